@@ -411,11 +411,14 @@ class General(commands.Cog):
 
                     # Load the compiled transcript using the file service manager
                     # which knows the proper base path for transcript storage
-                    import json
                     import os
 
                     import aiofiles
 
+                    from source.services.transcription.transcription_file_manager import (
+                        decode_transcript,
+                    )
+
                     # The transcript_filename from the DB contains the full path or relative path
                     transcript_file = compiled.get("transcript_filename")
                     await self.services.logging_service.info(
@@ -441,9 +444,9 @@ class General(commands.Cog):
                         )
                         try:
                             # Use aiofiles for async file reading
-                            async with aiofiles.open(transcript_file, encoding="utf-8") as f:
+                            async with aiofiles.open(transcript_file, "rb") as f:
                                 content = await f.read()
-                                transcript_data = json.loads(content)
+                                transcript_data = decode_transcript(content)
                                 summary = transcript_data.get("summary")
 
                                 if summary:
@@ -475,7 +478,7 @@ class General(commands.Cog):
                                         value="*Summary not yet generated. The summarization job may still be processing.*",
                                         inline=False,
                                     )
-                        except json.JSONDecodeError as e:
+                        except ValueError as e:
                             await self.services.logging_service.warning(
                                 f"Failed to parse compiled transcript JSON for meeting {meeting_id}: {str(e)}"
                             )
@@ -919,11 +922,14 @@ class General(commands.Cog):
             )
 
             if compiled:
-                import json
                 import os
 
                 import aiofiles
 
+                from source.services.transcription.transcription_file_manager import (
+                    decode_transcript,
+                )
+
                 # Get the transcript file path
                 transcript_file = compiled.get("transcript_filename")
 
@@ -939,9 +945,9 @@ class General(commands.Cog):
                 if transcript_file and os.path.exists(transcript_file):
                     try:
                         # Read the compiled transcript file
-                        async with aiofiles.open(transcript_file, encoding="utf-8") as f:
+                        async with aiofiles.open(transcript_file, "rb") as f:
                             content = await f.read()
-                            transcript_data = json.loads(content)
+                            transcript_data = decode_transcript(content)
 
                         # Create summary embed
                         summary_embed = discord.Embed(
@@ -1055,7 +1061,7 @@ class General(commands.Cog):
                                             layer_embed.set_footer(text=f"Meeting ID: {meeting_id}")
                                             await send_embed(layer_embed)
 
-                    except json.JSONDecodeError as e:
+                    except ValueError as e:
                         await self.services.logging_service.warning(
                             f"[DEEPINFO] Failed to parse compiled transcript JSON for meeting {meeting_id}: {str(e)}"
                         )
@@ -1267,11 +1273,14 @@ class General(commands.Cog):
             # Stage 6: Check if summarization is complete
             if not job_to_start and compiled_transcript:
                 # Load the compiled transcript file to check for summaries
-                import json
                 import os
 
                 import aiofiles
 
+                from source.services.transcription.transcription_file_manager import (
+                    decode_transcript,
+                )
+
                 transcript_filename = compiled_transcript.get("filename")
                 if transcript_filename:
                     storage_path = (
@@ -1281,9 +1290,9 @@ class General(commands.Cog):
 
                     if os.path.exists(transcript_file):
                         try:
-                            async with aiofiles.open(transcript_file, encoding="utf-8") as f:
+                            async with aiofiles.open(transcript_file, "rb") as f:
                                 transcript_content = await f.read()
-                                transcript_data = json.loads(transcript_content)
+                                transcript_data = decode_transcript(transcript_content)
 
                                 # Check if summary exists and is not empty
                                 if not transcript_data.get("summary") or not transcript_data.get(
@@ -1291,7 +1300,7 @@ class General(commands.Cog):
                                 ):
                                     job_to_start = "summarization"
                                     job_reason = "Compiled transcript exists but no summary found. Need to generate summaries."
-                        except (json.JSONDecodeError, Exception) as e:
+                        except Exception as e:
                             await self.services.logging_service.warning(
                                 f"[PROCESS_STEP] Error reading compiled transcript for meeting {meeting_id}: {str(e)}"
                             )
@@ -1,11 +1,20 @@
 # load env
 import os
+import sys
 from dotenv import load_dotenv
-import json
 import glob
 
 load_dotenv("../../.env.local")
 
+# Add source to path
+sys.path.append(os.getcwd())
+
+# Imported after load_dotenv so TRANSCRIPT_FORMAT/TRANSCRIPT_COMPRESSION apply
+from source.services.transcription.transcription_file_manager import (
+    decode_transcript,
+    encode_transcript,
+)
+
 
 # open up all files in the transcripts directory
 TRANSCRIPTS_DIR = "assets/data/transcriptions/compilations/storage"
@@ -14,14 +23,14 @@ if not TRANSCRIPTS_DIR:
     print("TRANSCRIPTS_STORAGE_PATH not set")
     exit(1)
 
-# Find all JSON files in the directory
+# Find all transcript files in the directory (they keep the .json extension in every format)
 transcript_files = glob.glob(os.path.join(TRANSCRIPTS_DIR, "*.json"))
 
 for file_path in transcript_files:
     print(f"Processing {file_path}")
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = decode_transcript(f.read())
 
         # Add summary_layers and summary if not present
         if "summary_layers" not in data:
@@ -29,9 +38,9 @@ for file_path in transcript_files:
         if "summary" not in data:
             data["summary"] = ""
 
-        # Save back
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Save back in the configured transcript format
+        with open(file_path, "wb") as f:
+            f.write(encode_transcript(data))
 
         print(f"Updated {file_path}")
     except Exception as e:
@@ -0,0 +1,99 @@
+"""
+Benchmark the recorder's PCM window flush.
+
+Compares the previous flush path (copy a window out of a bytearray, then shift
+the rest forward) with PCMWindowBuffer for 10 users over 40 flush cycles, and
+prints the flush latency and peak transient allocation per cycle.
+
+Usage:
+    python scripts/benchmark_pcm_window_buffer.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+# Add source to path
+sys.path.append(os.getcwd())
+
+from source.services.discord.discord_recorder_manager.manager import DiscordRecorderConstants
+from source.services.discord.discord_recorder_manager.window_buffer import PCMWindowBuffer
+
+WINDOW_BYTES = DiscordRecorderConstants.WINDOW_BYTES
+FRAME_BYTES = DiscordRecorderConstants.FRAME_BYTES
+
+
+def flush_bytearray(buffer: bytearray, windows: list) -> None:
+    """The previous flush path: copy the window out, then shift the rest forward."""
+    while len(buffer) >= WINDOW_BYTES:
+        windows.append(bytes(buffer[:WINDOW_BYTES]))
+        del buffer[:WINDOW_BYTES]
+
+
+def flush_window_buffer(buffer: PCMWindowBuffer, windows: list) -> None:
+    while len(buffer) >= WINDOW_BYTES:
+        windows.append(buffer.take(WINDOW_BYTES))
+
+
+def run_flush_cycles(make_buffer, append, flush, cycles: int, users: int = 10):
+    """Feed every user one flush interval of audio per cycle and time the flushes."""
+    interval_bytes = (
+        DiscordRecorderConstants.BYTES_PER_MS * DiscordRecorderConstants.FLUSH_INTERVAL_SECONDS * 1000
+    )
+    # Extraction also appends a few frames of gap padding now and then
+    blocks = [bytes([i % 251 + 1]) * interval_bytes for i in range(users)]
+    padding = bytes(3 * FRAME_BYTES)
+    buffers = [make_buffer() for _ in range(users)]
+
+    flush_seconds = 0.0
+    allocated = 0
+    windows_emitted = 0
+    tracemalloc.start()
+    try:
+        for cycle in range(cycles):
+            for user, buffer in enumerate(buffers):
+                append(buffer, blocks[user])
+                if cycle % 3 == user % 3:
+                    append(buffer, padding)
+
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            start = time.perf_counter()
+            for buffer in buffers:
+                windows: list = []
+                flush(buffer, windows)
+                windows_emitted += len(windows)
+                del windows  # Consumed by the flush path
+            flush_seconds += time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            allocated += peak - baseline
+    finally:
+        tracemalloc.stop()
+
+    return flush_seconds / cycles, allocated / cycles, windows_emitted
+
+
+def main() -> None:
+    cycles = 40
+
+    old_latency, old_alloc, old_windows = run_flush_cycles(
+        bytearray, bytearray.extend, flush_bytearray, cycles
+    )
+    new_latency, new_alloc, new_windows = run_flush_cycles(
+        PCMWindowBuffer, PCMWindowBuffer.extend, flush_window_buffer, cycles
+    )
+
+    print(f"10 users, {cycles} flush cycles ({old_windows} / {new_windows} windows):")
+    print(
+        f"  bytearray slicing: {old_latency * 1000:.2f} ms/flush, "
+        f"{old_alloc / 1e6:.1f} MB peak transient allocation/flush"
+    )
+    print(
+        f"  PCMWindowBuffer:   {new_latency * 1000:.2f} ms/flush, "
+        f"{new_alloc / 1e6:.1f} MB peak transient allocation/flush"
+    )
+
+
+if __name__ == "__main__":
+    main()
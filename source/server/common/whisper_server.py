@@ -1,5 +1,7 @@
 """Whisper server client implementation."""
 
+import asyncio
+import contextlib
 import json
 import logging
 import os
@@ -10,20 +12,58 @@ from source.server.services import WhisperServerHandler
 
 logger = logging.getLogger(__name__)
 
+# Statuses returned by the whisper wrapper when its admission queue is full or timed out
+RETRYABLE_STATUSES = {429, 503}
+
+# Statuses returned when the server cannot read a shared path (or, like a bare
+# whisper-server, does not accept one)
+SHARED_PATH_REJECTED_STATUSES = {400, 403, 404}
+
+# Send the path of the audio instead of uploading it (client and wrapper share a filesystem)
+WHISPER_SHARED_FILESYSTEM = os.getenv("WHISPER_SHARED_FILESYSTEM", "false").lower() == "true"
+
+# Total time allowed for one inference request. The wrapper may hold a request in its
+# queue for WHISPER_QUEUE_TIMEOUT (3600s) before transcribing it for up to
+# INFERENCE_TIMEOUT (300s), so this must cover both; aiohttp's 300s default does not.
+WHISPER_CLIENT_INFERENCE_TIMEOUT = float(
+    os.getenv("WHISPER_CLIENT_INFERENCE_TIMEOUT", str(3600 + 300 + 60))
+)
+
 
 class WhisperServerClient(WhisperServerHandler):
     """Client for Whisper.cpp server."""
 
-    def __init__(self, name: str = "whisper_server", endpoint: str = "http://localhost:50021"):
+    def __init__(
+        self,
+        name: str = "whisper_server",
+        endpoint: str = "http://localhost:50021",
+        max_retries: int = 5,
+        retry_base_delay: float = 2.0,
+        max_retry_delay: float = 60.0,
+        shared_filesystem: bool = WHISPER_SHARED_FILESYSTEM,
+        inference_timeout: float = WHISPER_CLIENT_INFERENCE_TIMEOUT,
+    ):
         """
         Initialize Whisper server client.
 
         Args:
             name: Name of the client
             endpoint: Whisper server endpoint URL
+            max_retries: Retries for inference requests rejected because the server is busy
+            retry_base_delay: Initial backoff in seconds when no Retry-After is provided
+            max_retry_delay: Upper bound for a single backoff in seconds
+            shared_filesystem: Send audio paths instead of uploading the audio; falls back
+                to an upload when the server cannot read the path
+            inference_timeout: Total seconds allowed for one inference request, including
+                time spent in the server's queue; a timeout is raised, not retried
         """
         super().__init__(name, endpoint)
         self.session: aiohttp.ClientSession | None = None
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.max_retry_delay = max_retry_delay
+        self.shared_filesystem = shared_filesystem
+        self.inference_timeout = inference_timeout
 
     # -------------------------------------------------------------- #
     # Handler Methods
@@ -133,33 +173,190 @@ class WhisperServerClient(WhisperServerHandler):
         # Default to JSON so we can safely parse it
         response_format = response_format or "json"
 
-        data = aiohttp.FormData()
-        with open(audio_path, "rb") as f:
-            data.add_field("file", f, filename=os.path.basename(audio_path))
+        params = {
+            "word_timestamps": word_timestamps,
+            "response_format": response_format,
+            "temperature": temperature,
+            "temperature_inc": temperature_inc,
+            "language": language,
+        }
+
+        attempt = 0
+        send_path = self.shared_filesystem
+        timeout = aiohttp.ClientTimeout(total=self.inference_timeout)
+        while True:
+            data = aiohttp.FormData()
+            with contextlib.ExitStack() as stack:
+                if send_path:
+                    # Co-located server reads the file itself - nothing is uploaded
+                    data.add_field("path", os.path.abspath(audio_path))
+                else:
+                    # The file object is streamed in blocks, not read into memory
+                    f = stack.enter_context(open(audio_path, "rb"))
+                    data.add_field("file", f, filename=os.path.basename(audio_path))
+
+                # Add optional parameters
+                for key, value in params.items():
+                    data.add_field(key, str(value))
+
+                try:
+                    async with self.session.post(
+                        f"{self.endpoint}/inference", data=data, timeout=timeout
+                    ) as response:
+                        body = await response.text()
+
+                        if response.status == 200:
+                            if "X-Queue-Position" in response.headers:
+                                logger.debug(
+                                    f"Inference for {audio_path} waited "
+                                    f"{response.headers.get('X-Queue-Wait-Seconds')}s in queue "
+                                    f"(position {response.headers.get('X-Queue-Position')})"
+                                )
+
+                            # Text-only response - return as plain string
+                            if response_format == "text":
+                                return body
+
+                            # JSON / verbose_json - return full parsed response
+                            result = json.loads(body)
+                            return result
+
+                        # Server cannot read the shared path - upload the file instead
+                        if send_path and response.status in SHARED_PATH_REJECTED_STATUSES:
+                            logger.warning(
+                                f"Whisper server cannot read {audio_path} ({response.status}), "
+                                f"uploading it instead"
+                            )
+                            send_path = False
+                            continue
+
+                        # Queue full / queue wait timed out - back off and retry
+                        if response.status in RETRYABLE_STATUSES and attempt < self.max_retries:
+                            attempt += 1
+                            retry_after = response.headers.get("Retry-After")
+                            delay = self._retry_delay(retry_after, attempt)
+                            logger.warning(
+                                f"Whisper server busy ({response.status}), retrying "
+                                f"{audio_path} in {delay:.1f}s "
+                                f"(attempt {attempt}/{self.max_retries})"
+                            )
+                        else:
+                            raise RuntimeError(f"Inference failed ({response.status}): {body}")
+                except asyncio.TimeoutError:
+                    # Not retried: the server keeps queueing or transcribing the abandoned
+                    # request, so a retry would add a duplicate transcription to its queue
+                    logger.error(
+                        f"Inference for {audio_path} timed out after "
+                        f"{self.inference_timeout:.0f}s"
+                    )
+                    raise
+
+            await asyncio.sleep(delay)
+
+    def _retry_delay(self, retry_after: str | None, attempt: int) -> float:
+        """
+        Compute the delay before the next inference attempt.
 
-            # Add optional parameters
-            for key, value in {
-                "word_timestamps": word_timestamps,
-                "response_format": response_format,
-                "temperature": temperature,
-                "temperature_inc": temperature_inc,
-                "language": language,
-            }.items():
-                data.add_field(key, str(value))
+        Args:
+            retry_after: Value of the server's Retry-After header, if any
+            attempt: 1-based retry attempt number
 
-            async with self.session.post(f"{self.endpoint}/inference", data=data) as response:
-                body = await response.text()
+        Returns:
+            Seconds to wait (server hint if present, otherwise exponential backoff)
+        """
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_retry_delay)
+            except ValueError:
+                pass
+        return min(self.retry_base_delay * (2 ** (attempt - 1)), self.max_retry_delay)
 
-                if response.status != 200:
-                    raise RuntimeError(f"Inference failed ({response.status}): {body}")
 
-                # Text-only response - return as plain string
-                if response_format == "text":
-                    return body
+class WhisperServerPool(WhisperServerHandler):
+    """
+    Pool of Whisper backends behind a single client interface.
 
-                # JSON / verbose_json - return full parsed response
-                result = json.loads(body)
-                return result
+    Each inference request is sent to an idle backend, so up to `size`
+    requests are transcribed concurrently.
+    """
+
+    def __init__(self, clients: list[WhisperServerClient], name: str = "whisper_server"):
+        """
+        Initialize Whisper server pool.
+
+        Args:
+            clients: One client per Whisper backend
+            name: Name of the pool
+        """
+        if not clients:
+            raise ValueError("WhisperServerPool requires at least one backend")
+
+        super().__init__(name, ",".join(client.endpoint for client in clients))
+        self.clients = clients
+        self._idle: asyncio.Queue[WhisperServerClient] = asyncio.Queue()
+        for client in clients:
+            self._idle.put_nowait(client)
+
+    @property
+    def size(self) -> int:
+        """Number of backends in the pool."""
+        return len(self.clients)
+
+    # -------------------------------------------------------------- #
+    # Server Management
+    # -------------------------------------------------------------- #
+
+    async def connect(self) -> None:
+        """Connect every backend in the pool."""
+        try:
+            for client in self.clients:
+                await client.connect()
+        except Exception:
+            await self.disconnect()
+            raise
+        self._connected = True
+
+    async def disconnect(self) -> None:
+        """Disconnect every backend in the pool."""
+        for client in self.clients:
+            await client.disconnect()
+        self._connected = False
+
+    async def health_check(self) -> bool:
+        """Check that every backend in the pool is healthy."""
+        results = await asyncio.gather(*(client.health_check() for client in self.clients))
+        return all(results)
+
+    # -------------------------------------------------------------- #
+    # Handler Methods
+    # -------------------------------------------------------------- #
+
+    async def select_load_model(self, model_path: str) -> None:
+        """
+        Load a Whisper model on every backend.
+
+        Args:
+            model_path: Path to the model file
+        """
+        for client in self.clients:
+            await client.select_load_model(model_path)
+
+    async def inference(self, audio_path: str, **kwargs) -> str | dict:
+        """
+        Transcribe the given audio file on the next idle backend.
+
+        Args:
+            audio_path: Path to the audio file
+            **kwargs: Passed through to WhisperServerClient.inference
+
+        Returns:
+            The backend's transcription result
+        """
+        client = await self._idle.get()
+        try:
+            return await client.inference(audio_path, **kwargs)
+        finally:
+            self._idle.put_nowait(client)
 
 
 def construct_whisper_server_client(
@@ -175,3 +372,20 @@ def construct_whisper_server_client(
         Configured WhisperServerClient instance
     """
     return WhisperServerClient(name="whisper_server", endpoint=endpoint)
+
+
+def construct_whisper_server_pool(endpoints: list[str]) -> WhisperServerPool:
+    """
+    Construct and return a pool of Whisper server clients.
+
+    Args:
+        endpoints: Whisper server endpoint URLs, one per backend
+
+    Returns:
+        Configured WhisperServerPool instance
+    """
+    clients = [
+        WhisperServerClient(name=f"whisper_server_{index}", endpoint=endpoint)
+        for index, endpoint in enumerate(endpoints)
+    ]
+    return WhisperServerPool(clients, name="whisper_server")
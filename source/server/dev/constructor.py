@@ -45,6 +45,13 @@ def load_vectordb_client():
 
 def load_whisper_server_client():
     """Load and return the Whisper server client for development."""
+    # Several backends (comma-separated) are served through a pool
+    endpoints = [e.strip() for e in os.getenv("WHISPER_ENDPOINTS", "").split(",") if e.strip()]
+    if len(endpoints) > 1:
+        return whisper_server.construct_whisper_server_pool(endpoints=endpoints)
+    if endpoints:
+        return whisper_server.construct_whisper_server_client(endpoint=endpoints[0])
+
     # Use Flask microservice endpoint instead of direct whisper-server
     endpoint = os.getenv("WHISPER_FLASK_ENDPOINT")
 
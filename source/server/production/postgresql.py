@@ -7,15 +7,21 @@ and operations with PostgreSQL database using SQLAlchemy Core for query building
 
 import logging
 import os
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import Any
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable
 
 import asyncpg
 from asyncpg import Pool
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import DateTime, create_engine, inspect
 from sqlalchemy.dialects import postgresql
-from sqlalchemy.schema import DDL
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.schema import DDL, CreateIndex
 from sqlalchemy.sql import ddl
+from sqlalchemy.sql.ddl import ExecutableDDLElement
+from sqlalchemy.sql.elements import TextClause
 
 from source.server.db_models import SQL_DATABASE_MODELS
 
@@ -23,6 +29,27 @@ from ..services import SQLDatabase
 
 logger = logging.getLogger(__name__)
 
+# Number of compiled statement shapes kept by execute(), also used as asyncpg's
+# per-connection prepared statement cache size
+STATEMENT_CACHE_SIZE = int(os.getenv("POSTGRES_STATEMENT_CACHE_SIZE", "512"))
+
+# Message of the DataError asyncpg raises on the client, before anything is sent, when a
+# bound value can't be encoded for its parameter type; only these are retried as literals
+_PARAMETER_ENCODE_ERROR = "invalid input for query argument"
+
+
+@dataclass
+class _CachedStatement:
+    """A statement shape compiled once with positional ($n) parameters."""
+
+    compiled: Any
+    query: str
+    returns_rows: bool
+    expanding: bool
+    positiontup: list[str]
+    processors: dict[str, Callable[[Any], Any] | None]
+    naive_datetime_params: frozenset[str]
+
 
 # -------------------------------------------------------------- #
 # PostgreSQL Server Handler
@@ -73,6 +100,10 @@ class PostgreSQLServer(SQLDatabase):
 
         self.pool: Pool | None = None
 
+        # Parameterized compilation: statement shape -> compiled statement
+        self._dialect = PGDialect_asyncpg()
+        self._statement_cache: OrderedDict[Any, _CachedStatement] = OrderedDict()
+
     # -------------------------------------------------------------- #
     # Connection Management
     # -------------------------------------------------------------- #
@@ -85,6 +116,7 @@ class PostgreSQLServer(SQLDatabase):
                 min_size=1,
                 max_size=10,
                 command_timeout=60,
+                statement_cache_size=STATEMENT_CACHE_SIZE,
             )
             self._connected = True
             logger.info(f"[{self.name}] Connected to PostgreSQL")
@@ -178,6 +210,8 @@ class PostgreSQLServer(SQLDatabase):
             # Get database columns info
             db_columns_list = inspector.get_columns(table_name)
             db_columns = {col["name"]: col for col in db_columns_list}
+            db_indexes = inspector.get_indexes(table_name)
+            db_primary_key = inspector.get_pk_constraint(table_name)["constrained_columns"]
             temp_engine.dispose()
 
             # Get model columns
@@ -209,6 +243,9 @@ class PostgreSQLServer(SQLDatabase):
                 await self.execute(stmt)
                 logger.info(f"[{self.name}] Added column `{col_name}` to table `{table_name}`")
 
+            # Create indexes the model declares but the table is missing
+            await self._create_missing_indexes(model, table_name, db_indexes, db_primary_key)
+
             # Modify existing columns if needed
             # PostgreSQL uses ALTER COLUMN TYPE syntax
             for col_name in columns_to_check:
@@ -274,6 +311,37 @@ class PostgreSQLServer(SQLDatabase):
             logger.error(f"[{self.name}] Error updating table schema for {table_name}: {e}")
             raise
 
+    async def _create_missing_indexes(
+        self, model, table_name: str, db_indexes: list[dict], db_primary_key: list[str]
+    ) -> None:
+        """
+        Create the model's indexes that don't exist on an existing table.
+
+        create_all only creates indexes together with a new table, so indexes added
+        to a model later would otherwise never reach existing deployments. An index
+        counts as present if the table has one with the same name or the same columns
+        (including the primary key's own index).
+
+        Args:
+            model: SQLAlchemy model class
+            table_name: Name of the table
+            db_indexes: Indexes currently on the table, as returned by Inspector.get_indexes
+            db_primary_key: Primary key columns of the table
+        """
+        existing_names = {index["name"] for index in db_indexes}
+        existing_columns = {tuple(index["column_names"]) for index in db_indexes}
+        existing_columns.add(tuple(db_primary_key))
+
+        for index in model.__table__.indexes:
+            columns = tuple(column.name for column in index.columns)
+            if index.name in existing_names or columns in existing_columns:
+                continue
+
+            await self.execute(CreateIndex(index, if_not_exists=True))
+            logger.info(
+                f"[{self.name}] Created index `{index.name}` on `{table_name}` ({', '.join(columns)})"
+            )
+
     def _get_postgresql_column_type(self, column) -> str:
         """
         Convert SQLAlchemy column type to PostgreSQL column type string.
@@ -336,30 +404,170 @@ class PostgreSQLServer(SQLDatabase):
         compiled = stmt.compile(dialect=postgresql.dialect())
         return str(compiled)
 
+    def _compile_statement(self, stmt, cache_key=None) -> _CachedStatement:
+        """
+        Compile a statement with positional parameters for asyncpg.
+
+        Args:
+            stmt: SQLAlchemy statement object
+            cache_key: The statement's cache key, if it has one
+
+        Returns:
+            Compiled statement with everything needed to bind new parameter values
+        """
+        if cache_key is not None:
+            compiled = stmt.compile(dialect=self._dialect, cache_key=cache_key)
+        else:
+            compiled = stmt.compile(dialect=self._dialect)
+        query = str(compiled)
+        positiontup = list(compiled.positiontup or [])
+
+        # Bind processors (enums -> names, JSON -> text, ...) for each positional parameter
+        processors = {}
+        naive_datetime_params = set()
+        for name in positiontup:
+            bind = compiled.binds.get(name)
+            if bind is None:
+                continue
+            processors[name] = bind.type.bind_processor(self._dialect)
+            if isinstance(bind.type, DateTime) and not bind.type.timezone:
+                naive_datetime_params.add(name)
+
+        if isinstance(stmt, TextClause):
+            returns_rows = query.strip().upper().startswith("SELECT")
+        else:
+            returns_rows = bool(
+                getattr(stmt, "is_select", False) or getattr(compiled, "effective_returning", None)
+            )
+
+        return _CachedStatement(
+            compiled=compiled,
+            query=query,
+            returns_rows=returns_rows,
+            expanding=bool(compiled.post_compile_params or compiled.literal_execute_params),
+            positiontup=positiontup,
+            processors=processors,
+            naive_datetime_params=frozenset(naive_datetime_params),
+        )
+
+    def _prepare_statement(self, stmt) -> tuple[str, list[Any], bool]:
+        """
+        Get the parameterized SQL and positional arguments for a statement.
+
+        Statements are compiled once per shape (SQLAlchemy cache key, which
+        ignores literal values) and reused with the new values bound. Identical
+        SQL text lets asyncpg reuse its prepared statement on each connection.
+
+        Args:
+            stmt: SQLAlchemy statement object
+
+        Returns:
+            Tuple of (query, positional args, whether the statement returns rows)
+        """
+        if isinstance(stmt, ExecutableDDLElement):
+            # DDL has no parameters and runs rarely; no point caching it
+            return str(stmt.compile(dialect=self._dialect)), [], False
+
+        try:
+            cache_key = stmt._generate_cache_key()
+        except (AttributeError, NotImplementedError):
+            cache_key = None
+
+        if cache_key is None:
+            # Uncacheable constructs are compiled every time
+            entry = self._compile_statement(stmt)
+            params = entry.compiled.construct_params()
+        else:
+            entry = self._statement_cache.get(cache_key.key)
+            if entry is None:
+                entry = self._compile_statement(stmt, cache_key)
+                self._statement_cache[cache_key.key] = entry
+                if len(self._statement_cache) > STATEMENT_CACHE_SIZE:
+                    self._statement_cache.popitem(last=False)
+            else:
+                self._statement_cache.move_to_end(cache_key.key)
+            params = entry.compiled.construct_params(extracted_parameters=cache_key.bindparams)
+
+        if entry.expanding:
+            # IN lists render one placeholder per element, so the SQL depends on the values
+            state = entry.compiled.construct_expanded_state(params)
+            query, names, processors = state.statement, state.positiontup, state.processors
+            params = state.parameters
+        else:
+            query, names, processors = entry.query, entry.positiontup, entry.processors
+
+        args = []
+        for name in names:
+            value = params[name]
+            processor = processors.get(name)
+            if processor is not None:
+                value = processor(value)
+            if (
+                name in entry.naive_datetime_params
+                and isinstance(value, datetime)
+                and value.tzinfo is not None
+            ):
+                # TIMESTAMP WITHOUT TIME ZONE keeps the wall-clock time, as the text literal did
+                value = value.replace(tzinfo=None)
+            args.append(value)
+
+        return query, args, entry.returns_rows
+
+    def _compile_literal(self, stmt) -> tuple[str, bool]:
+        """
+        Compile a statement with its values inlined as literals.
+
+        Used as a fallback when a value can't be encoded as a typed parameter.
+
+        Args:
+            stmt: SQLAlchemy statement object
+
+        Returns:
+            Tuple of (query, whether the query returns rows)
+        """
+        compiled = stmt.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+        query = str(compiled)
+        return query, query.strip().upper().startswith("SELECT")
+
     async def execute(self, stmt) -> list[dict[str, Any]]:
         """
         Execute a SQLAlchemy statement and return results.
 
+        Statements are executed with bound parameters, so asyncpg can reuse
+        prepared statements across calls that only differ in their values.
+
         Args:
             stmt: SQLAlchemy statement object (select, insert, update, delete)
 
         Returns:
-            List of result rows as dictionaries (empty list for non-SELECT queries)
+            List of result rows as dictionaries (empty list for statements without results)
         """
         try:
-            # Compile the statement to SQL string with literal binds
-            compiled = stmt.compile(
-                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
-            )
-            query = str(compiled)
+            query, args, returns_rows = self._prepare_statement(stmt)
 
             async with self._get_connection() as connection:
-                # Check if this is a SELECT query (returns results)
-                if query.strip().upper().startswith("SELECT"):
-                    rows = await connection.fetch(query)
-                    return [dict(row) for row in rows]
-                else:
-                    # For INSERT, UPDATE, DELETE - execute and return empty list
+                try:
+                    if returns_rows:
+                        rows = await connection.fetch(query, *args)
+                        return [dict(row) for row in rows]
+                    else:
+                        # For INSERT, UPDATE, DELETE, DDL - execute and return empty list
+                        await connection.execute(query, *args)
+                        return []
+                except asyncpg.exceptions.DataError as e:
+                    # A value whose Python type doesn't match the column (e.g. "5" for an
+                    # INTEGER column) fails to encode. The old literal path let PostgreSQL
+                    # coerce such values, so retry that way. Server-side errors such as
+                    # UndefinedFunctionError come from wrong queries and are raised as is
+                    if _PARAMETER_ENCODE_ERROR not in str(e):
+                        raise
+                    logger.warning(f"[{self.name}] Falling back to literal SQL: {e}")
+                    query, returns_rows = self._compile_literal(stmt)
+                    if returns_rows:
+                        rows = await connection.fetch(query)
+                        return [dict(row) for row in rows]
                     await connection.execute(query)
                     return []
         except Exception as e:
@@ -391,6 +599,8 @@ class PostgreSQLServer(SQLDatabase):
             )
             if "query" in locals():
                 logger.error(f"[{self.name}] Query: {query}")
+            if "args" in locals():
+                logger.error(f"[{self.name}] Params: {args}")
 
             # Additional context for foreign key violations
             error_str = str(e).lower()
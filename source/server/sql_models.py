@@ -1,6 +1,6 @@
 import enum
 
-from sqlalchemy import JSON, Column, DateTime, Enum, ForeignKey, Integer, String
+from sqlalchemy import JSON, Column, DateTime, Enum, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import declarative_base
 
 from source.utils import MEETING_UUID_LENGTH
@@ -77,6 +77,10 @@ class MeetingModel(Base):
     """
 
     __tablename__ = "meetings"
+    __table_args__ = (
+        # Meetings of a guild, newest first (get_meetings_by_guild)
+        Index("ix_meetings_guild_id_started_at", "guild_id", "started_at"),
+    )
 
     id = Column(String(16), primary_key=True, index=True)
     guild_id = Column(String(20), nullable=False, index=True)
@@ -248,12 +252,13 @@ class TempRecordingModel(Base):
     Filename = Filename of the recording file
         - assets/recordings/yyyy-mm-dd_recording_{user_id}_{timestamp in ms}.???
     Transcode Status = Status of the FFmpeg transcode job (queued, in_progress, done, failed)
+    Silence MS = Duration of a silence marker (no audio file), NULL for real recordings
     """
 
     __tablename__ = "temp_recordings"
 
     id = Column(String(16), primary_key=True, index=True)
-    created_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, nullable=False, index=True)  # TTL cleanup scans by age
     user_id = Column(String(20), nullable=False)
     meeting_id = Column(
         String(MEETING_UUID_LENGTH), ForeignKey("meetings.id"), nullable=False, index=True
@@ -265,6 +270,7 @@ class TempRecordingModel(Base):
         nullable=False,
         default=TranscodeStatus.QUEUED.value,
     )
+    silence_ms = Column(Integer, nullable=True)
 
 
 class ConversationsModel(Base):
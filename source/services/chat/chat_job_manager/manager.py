@@ -25,7 +25,7 @@ if TYPE_CHECKING:
 from datetime import datetime
 
 from source.server.sql_models import JobsStatus, JobsType
-from source.services.common.job import Job, JobQueue
+from source.services.common.job import Job, KeyedJobQueue
 from source.services.chat.conversation_manager.in_memory_cache import (
     Conversation,
     ConversationStatus,
@@ -51,6 +51,10 @@ MAX_MESSAGE_BATCH_SIZE = 5
 OLLAMA_CHAT_MODEL = os.getenv("OLLAMA_CHAT_MODEL", "gemma3:12b")
 OLLAMA_CONTEXT_CLEANER_MODEL = os.getenv("OLLAMA_CONTEXT_CLEANER_MODEL", "gemma3:12b")
 
+# Maximum number of chat jobs (threads) processed at the same time.
+# Jobs within a thread always run in order; inference is still serialized by the GPU lock.
+CHAT_JOB_MAX_CONCURRENCY = int(os.getenv("CHAT_JOB_MAX_CONCURRENCY", "4"))
+
 
 class LockedOllamaRequestManager:
     """
@@ -1509,7 +1513,7 @@ class ChatJobManagerService(Manager):
 
     This manager handles:
     - Creating and queuing chat jobs
-    - Managing job queue with event-based processing
+    - Running jobs in order per thread and in parallel across threads
     - Tracking job status in SQL
     - Routing messages to appropriate jobs
     """
@@ -1523,8 +1527,13 @@ class ChatJobManagerService(Manager):
         """
         super().__init__(context)
 
-        # Job queue
-        self._job_queue: JobQueue[ChatJob] = JobQueue()
+        # Job queue: ordered per thread, parallel across threads
+        self._job_queue: KeyedJobQueue[ChatJob] = KeyedJobQueue(
+            key_fn=lambda job: job.thread_id,
+            max_concurrency=CHAT_JOB_MAX_CONCURRENCY,
+            on_job_complete=self._on_job_completed,
+            on_job_failed=self._on_job_failed,
+        )
         self._active_jobs: dict[str, ChatJob] = {}  # thread_id -> ChatJob
 
     # -------------------------------------------------------------- #
@@ -1535,10 +1544,6 @@ class ChatJobManagerService(Manager):
         """Actions to perform on manager start."""
         await super().on_start(services)
 
-        # Set up job queue callbacks
-        self._job_queue.on_job_completed = self._on_job_completed
-        self._job_queue.on_job_failed = self._on_job_failed
-
         # Start processing queue
         await self._job_queue.start()
 
@@ -1672,28 +1677,27 @@ class ChatJobManagerService(Manager):
         # Update SQL job status
         await self._update_job_status(job.job_id, JobsStatus.COMPLETED)
 
-        # Remove from active jobs
-        if job.thread_id in self._active_jobs:
+        # Remove from active jobs (a newer job for the thread may have replaced it)
+        if self._active_jobs.get(job.thread_id) is job:
             del self._active_jobs[job.thread_id]
 
         await self.services.logging_service.info(f"Chat job {job.job_id} completed")
 
-    async def _on_job_failed(self, job: ChatJob, error: Exception) -> None:
+    async def _on_job_failed(self, job: ChatJob) -> None:
         """
         Callback when a job fails.
 
         Args:
-            job: The failed job
-            error: The exception that caused the failure
+            job: The failed job (error details in job.error_message)
         """
         # Update SQL job status
-        await self._update_job_status(job.job_id, JobsStatus.FAILED, str(error))
+        await self._update_job_status(job.job_id, JobsStatus.FAILED, job.error_message)
 
-        # Remove from active jobs
-        if job.thread_id in self._active_jobs:
+        # Remove from active jobs (a newer job for the thread may have replaced it)
+        if self._active_jobs.get(job.thread_id) is job:
             del self._active_jobs[job.thread_id]
 
-        await self.services.logging_service.error(f"Chat job {job.job_id} failed: {str(error)}")
+        await self.services.logging_service.error(f"Chat job {job.job_id} failed: {job.error_message}")
 
     # -------------------------------------------------------------- #
     # SQL Methods
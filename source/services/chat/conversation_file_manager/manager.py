@@ -12,6 +12,80 @@ if TYPE_CHECKING:
 from source.services.manager import BaseConversationFileServiceManager
 from source.utils import generate_16_char_uuid
 
+# -------------------------------------------------------------- #
+# Conversation Journal
+# -------------------------------------------------------------- #
+
+# Conversations are stored as a JSON snapshot plus an append-only JSON Lines journal.
+# Each journal line is one record applied on top of the snapshot:
+#   {"op": "message", "after": <uuid | null>, "message": {...}}  new message after a uuid (null = first)
+#   {"op": "context", "uuid": ..., "is_context": bool}           message context flag changed
+#   {"op": "cleanup", "index": int, "entry": {...}}               cleanup_log entry appended
+#   {"op": "meta", "updated_at": ..., "summary": ..., "participants": [...]}
+# Writing a full snapshot compacts the conversation and truncates its journal.
+
+JOURNAL_SUFFIX = ".journal.jsonl"
+
+
+def replay_conversation_journal(
+    conversation_data: dict[str, Any], records: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Apply journal records to a conversation snapshot in place.
+
+    Replay is idempotent, so records that already made it into the snapshot
+    (e.g. a crash between compaction and truncation) are skipped.
+
+    Args:
+        conversation_data: The snapshot conversation data
+        records: Journal records in the order they were written
+
+    Returns:
+        The updated conversation data
+    """
+    history: list[dict[str, Any]] = conversation_data.setdefault("history", [])
+    positions = {message.get("uuid"): i for i, message in enumerate(history)}
+
+    for record in records:
+        op = record.get("op")
+
+        if op == "message":
+            message = record.get("message") or {}
+            if message.get("uuid") in positions:
+                continue
+
+            # Unknown anchors (e.g. dropped by a compaction) fall back to appending
+            after = record.get("after")
+            if after is None:
+                index = 0
+            else:
+                index = positions[after] + 1 if after in positions else len(history)
+
+            if index == len(history):
+                positions[message.get("uuid")] = index
+                history.append(message)
+            else:
+                history.insert(index, message)
+                positions = {m.get("uuid"): i for i, m in enumerate(history)}
+
+        elif op == "context":
+            index = positions.get(record.get("uuid"))
+            if index is not None:
+                history[index]["is_context"] = record.get("is_context", True)
+
+        elif op == "cleanup":
+            cleanup_log = conversation_data.setdefault("cleanup_log", [])
+            if record.get("index") == len(cleanup_log):
+                cleanup_log.append(record.get("entry"))
+
+        elif op == "meta":
+            for key in ("updated_at", "summary", "participants"):
+                if key in record:
+                    conversation_data[key] = record[key]
+
+    return conversation_data
+
+
 # -------------------------------------------------------------- #
 # Conversation File Manager Service
 # -------------------------------------------------------------- #
@@ -115,6 +189,60 @@ class ConversationFileManagerService(BaseConversationFileServiceManager):
         date_str = date.strftime("%Y-%m-%d")
         return f"{date_str}_conversation-in-{guild_id}_uuid-{thread_id}.json"
 
+    def _build_journal_path(self, filename: str) -> str:
+        """
+        Build the absolute path of a conversation's journal file.
+
+        Args:
+            filename: The conversation snapshot filename
+
+        Returns:
+            Path in format: {storage}/{filename without .json}.journal.jsonl
+        """
+        stem = filename[: -len(".json")] if filename.endswith(".json") else filename
+        return os.path.abspath(os.path.join(self.conversation_storage_path, stem + JOURNAL_SUFFIX))
+
+    async def _clear_journal(self, filename: str) -> None:
+        """
+        Remove a conversation's journal once its snapshot holds the full state.
+
+        Args:
+            filename: The conversation snapshot filename
+        """
+        journal_path = self._build_journal_path(filename)
+        if await self.services.file_service_manager.file_exists(journal_path):
+            await self.services.file_service_manager.delete_file(journal_path)
+
+    async def _read_journal(self, filename: str) -> list[dict[str, Any]]:
+        """
+        Read the journal records for a conversation.
+
+        A torn final line (from an interrupted append) is ignored.
+
+        Args:
+            filename: The conversation snapshot filename
+
+        Returns:
+            List of journal records, empty if there is no journal
+        """
+        journal_path = self._build_journal_path(filename)
+        if not await self.services.file_service_manager.file_exists(journal_path):
+            return []
+
+        data_bytes = await self.services.file_service_manager.read_file(journal_path)
+
+        records = []
+        for line in data_bytes.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                await self.services.logging_service.warning(
+                    f"Skipping unreadable journal record for conversation: {filename}"
+                )
+        return records
+
     async def save_conversation(
         self,
         conversation_data: dict[str, Any],
@@ -157,6 +285,9 @@ class ConversationFileManagerService(BaseConversationFileServiceManager):
             # Use file_manager's atomic save operation (will raise FileExistsError if exists)
             await self.services.file_service_manager.save_file(file_path, data_bytes)
 
+            # A fresh snapshot supersedes any stale journal
+            await self._clear_journal(filename)
+
             await self.services.logging_service.info(
                 f"Saved conversation file: {filename} ({len(data_bytes)} bytes)"
             )
@@ -183,7 +314,8 @@ class ConversationFileManagerService(BaseConversationFileServiceManager):
         Update an existing conversation JSON file with new data.
 
         This method uses the file_manager's atomic update operation to safely
-        modify the conversation file.
+        modify the conversation file. Writing the full snapshot compacts the
+        conversation, so its journal is truncated afterwards.
 
         Args:
             filename: The name of the conversation file to update
@@ -206,6 +338,9 @@ class ConversationFileManagerService(BaseConversationFileServiceManager):
             # Use file_manager's update operation (accepts absolute paths)
             await self.services.file_service_manager.update_file(file_path, data_bytes)
 
+            # Snapshot now holds everything the journal recorded
+            await self._clear_journal(filename)
+
             await self.services.logging_service.info(
                 f"Updated conversation file: {filename} ({len(data_bytes)} bytes)"
             )
@@ -221,10 +356,54 @@ class ConversationFileManagerService(BaseConversationFileServiceManager):
             )
             raise RuntimeError(f"Failed to update conversation: {str(e)}") from e
 
+    async def append_conversation_journal(
+        self,
+        filename: str,
+        records: list[dict[str, Any]],
+    ) -> None:
+        """
+        Append records to a conversation's journal.
+
+        Cost depends only on the size of the records, not on the length of
+        the conversation. The snapshot file must already exist.
+
+        Args:
+            filename: The conversation snapshot filename
+            records: JSON-serializable journal records
+
+        Raises:
+            RuntimeError: If the append fails
+        """
+        if not records:
+            return
+
+        journal_path = self._build_journal_path(filename)
+
+        try:
+            lines = [
+                json.dumps(record, ensure_ascii=False, separators=(",", ":")) for record in records
+            ]
+            data_bytes = ("\n".join(lines) + "\n").encode("utf-8")
+
+            await self.services.file_service_manager.append_file(journal_path, data_bytes)
+
+            await self.services.logging_service.debug(
+                f"Appended {len(records)} journal records to conversation: {filename} ({len(data_bytes)} bytes)"
+            )
+
+        except Exception as e:
+            await self.services.logging_service.error(
+                f"Failed to append to conversation journal {filename}: {str(e)}"
+            )
+            raise RuntimeError(f"Failed to append to conversation journal: {str(e)}") from e
+
     async def retrieve_conversation(self, filename: str) -> dict[str, Any] | None:
         """
         Retrieve a conversation JSON file by filename.
 
+        Any journal records written since the last compaction are replayed
+        on top of the snapshot.
+
         Args:
             filename: The name of the conversation file to retrieve
 
@@ -242,6 +421,11 @@ class ConversationFileManagerService(BaseConversationFileServiceManager):
             data_bytes = await self.services.file_service_manager.read_file(file_path)
             conversation_data = json.loads(data_bytes.decode("utf-8"))
 
+            # Replay the journal on top of the snapshot
+            records = await self._read_journal(filename)
+            if records:
+                replay_conversation_journal(conversation_data, records)
+
             await self.services.logging_service.info(f"Retrieved conversation: {filename}")
 
             return conversation_data
@@ -274,6 +458,7 @@ class ConversationFileManagerService(BaseConversationFileServiceManager):
         try:
             # Use file_manager's delete operation (will check existence internally)
             await self.services.file_service_manager.delete_file(file_path)
+            await self._clear_journal(filename)
 
             await self.services.logging_service.info(f"Deleted conversation file: {filename}")
 
@@ -7,6 +7,7 @@ with automatic cleanup after idle periods.
 from __future__ import annotations
 
 import asyncio
+import os
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -18,6 +19,11 @@ if TYPE_CHECKING:
         BaseConversationFileServiceManager,
     )
 
+# Minimum journal records before a conversation is compacted into a fresh snapshot.
+# Longer conversations compact once the journal outgrows their history, which keeps
+# the amortized cost of a save constant.
+JOURNAL_COMPACTION_THRESHOLD = 200
+
 
 # -------------------------------------------------------------- #
 # Message Type Enum
@@ -162,6 +168,9 @@ class Conversation:
         filename: Designated filename for saving the conversation
         conversation_file_manager: Reference to the file manager service
         status: Current status of the conversation (idle, thinking, processing_queue)
+
+    Saving appends the changes since the last save to the conversation's journal
+    and only rewrites the full snapshot when compacting.
     """
 
     thread_id: str
@@ -178,6 +187,15 @@ class Conversation:
     filename: str = ""
     status: ConversationStatus = ConversationStatus.IDLE
 
+    # Journal bookkeeping (changes not yet persisted, and what the snapshot + journal hold)
+    _journal_pending: list[dict[str, Any]] = field(default_factory=list, repr=False, compare=False)
+    _journal_records: int = field(default=0, repr=False, compare=False)
+    _journal_history_len: int = field(default=0, repr=False, compare=False)
+    _journal_cleanup_len: int = field(default=0, repr=False, compare=False)
+    _journal_meta: dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+    _snapshot_saved: bool = field(default=False, repr=False, compare=False)
+    _save_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False, compare=False)
+
     def __post_init__(self):
         """Initialize computed fields after dataclass initialization."""
         if self.updated_at is None:
@@ -190,15 +208,35 @@ class Conversation:
         date_str = self.created_at.strftime("%Y-%m-%d")
         self.filename = f"{date_str}_conversation-in-{self.guild_id}_uuid-{self.thread_id}.json"
 
+        # Everything passed in is considered persisted; new changes are journaled
+        self._journal_history_len = len(self.history)
+        self._journal_cleanup_len = len(self.cleanup_log)
+        self._journal_meta = self._meta_json()
+
     def add_message(self, message: Message) -> None:
         """Add a message to the conversation history.
 
         Args:
             message: Message to add to the conversation
         """
-        self.history.append(message)
+        self.insert_message(len(self.history), message)
+
+    def insert_message(self, index: int, message: Message) -> None:
+        """Insert a message into the conversation history at a given position.
+
+        Args:
+            index: Position in history to insert the message at
+            message: Message to insert into the conversation
+        """
+        index = max(0, min(index, len(self.history)))
+        after = self.history[index - 1].uuid if index > 0 else None
+
+        self.history.insert(index, message)
         self.updated_at = datetime.now()
 
+        self._journal_pending.append({"op": "message", "after": after, "message": message})
+        self._journal_history_len += 1
+
         # Add to participants if it's a user message with a requester
         if message.requester and message.requester not in self.participants:
             self.participants.append(message.requester)
@@ -222,8 +260,12 @@ class Conversation:
             True if successful, False if index out of bounds
         """
         if 0 <= message_index < len(self.history):
-            self.history[message_index].is_context = is_context
+            message = self.history[message_index]
+            message.is_context = is_context
             self.updated_at = datetime.now()
+            self._journal_pending.append(
+                {"op": "context", "uuid": message.uuid, "is_context": is_context}
+            )
             return True
         return False
 
@@ -284,15 +326,95 @@ class Conversation:
             conversation_file_manager=conversation_file_manager,
         )
 
+    def _meta_json(self) -> dict[str, Any]:
+        """Conversation fields that are journaled as a whole on change."""
+        return {
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "summary": self.summary,
+            "participants": list(self.participants),
+        }
+
+    def _drain_journal(self) -> list[dict[str, Any]]:
+        """Collect the journal records for changes made since the last save.
+
+        Returns:
+            JSON-serializable journal records (empty if nothing changed)
+        """
+        records: list[dict[str, Any]] = []
+
+        for record in self._journal_pending:
+            if record["op"] == "message":
+                record = {**record, "message": record["message"].to_json()}
+            records.append(record)
+        self._journal_pending.clear()
+
+        for index in range(self._journal_cleanup_len, len(self.cleanup_log)):
+            records.append({"op": "cleanup", "index": index, "entry": self.cleanup_log[index]})
+        self._journal_cleanup_len = len(self.cleanup_log)
+
+        meta = self._meta_json()
+        if meta != self._journal_meta:
+            records.append({"op": "meta", **meta})
+            self._journal_meta = meta
+
+        return records
+
+    def _needs_snapshot(self) -> bool:
+        """Check whether the next save must write the full snapshot.
+
+        This is the case for a conversation that was never written, once the
+        journal is due for compaction, or when history/cleanup_log were
+        modified without going through the journaling methods.
+        """
+        return (
+            not self._snapshot_saved
+            or self._journal_records >= max(JOURNAL_COMPACTION_THRESHOLD, len(self.history))
+            or len(self.history) != self._journal_history_len
+            or len(self.cleanup_log) < self._journal_cleanup_len
+        )
+
     async def save_conversation(self) -> bool:
         """Save the conversation to disk via the conversation_file_manager.
 
+        Changes since the last save are appended to the conversation's journal.
+        The full snapshot is only written for new conversations and when the
+        journal is compacted.
+
         Returns:
             True if save was successful, False otherwise
         """
         if not self.conversation_file_manager:
             raise ValueError("conversation_file_manager is not set. Cannot save conversation.")
 
+        async with self._save_lock:
+            try:
+                if self._needs_snapshot():
+                    return await self._save_snapshot()
+
+                records = self._drain_journal()
+                if records:
+                    await self.conversation_file_manager.append_conversation_journal(
+                        filename=self.filename, records=records
+                    )
+                    self._journal_records += len(records)
+
+                return True
+
+            except Exception as e:
+                # The journal may now be missing records; rewrite the snapshot next time
+                self._snapshot_saved = False
+                await self.conversation_file_manager.services.logging_service.error(
+                    f"Failed to append to the journal of conversation {self.filename}, "
+                    f"the next save rewrites its snapshot: {str(e)}"
+                )
+                return False
+
+    async def _save_snapshot(self) -> bool:
+        """Write the full conversation, compacting away its journal.
+
+        Returns:
+            True if save was successful, False otherwise
+        """
         try:
             # Convert to JSON
             conversation_data = self.to_json()
@@ -314,9 +436,19 @@ class Conversation:
                     discord_user_id=self.requester,
                     guild_id=self.guild_id,
                     thread_id=self.thread_id,
+                    date=self.created_at,
                 )
                 success = True
 
+            if success:
+                # Snapshot holds everything; start a fresh journal
+                self._journal_pending.clear()
+                self._journal_records = 0
+                self._journal_history_len = len(self.history)
+                self._journal_cleanup_len = len(self.cleanup_log)
+                self._journal_meta = self._meta_json()
+                self._snapshot_saved = True
+
             return success
 
         except Exception:
@@ -654,11 +786,6 @@ class InMemoryConversationManager:
                     filename = f"{date_str}_conversation-with-{requester_id}-in-{guild_id}.json"
 
             # Try to load the conversation file
-            # Note: We need to read the file directly since conversation_file_manager
-            # might not have a method to load by filename
-            import json
-            import os
-
             file_path = os.path.join(conversation_file_manager.conversation_storage_path, filename)
 
             if not os.path.exists(file_path):
@@ -674,10 +801,10 @@ class InMemoryConversationManager:
                 # Ensure filename matches what we expect/found
                 conversation.filename = filename
             else:
-                # Load conversation from file
-                loop = asyncio.get_event_loop()
-                with open(file_path, encoding="utf-8") as f:
-                    conversation_data = json.load(f)
+                # Load conversation from file (snapshot with its journal replayed)
+                conversation_data = await conversation_file_manager.retrieve_conversation(filename)
+                if conversation_data is None:
+                    return None
 
                 # Create Conversation object from JSON
                 conversation = Conversation.from_json(
@@ -687,6 +814,8 @@ class InMemoryConversationManager:
                 )
                 # Ensure filename matches what we expect/found
                 conversation.filename = filename
+                # The snapshot exists on disk, so further saves can go to the journal
+                conversation._snapshot_saved = True
 
             # Add to memory
             self.conversations[thread_id] = conversation
@@ -388,7 +388,7 @@ class ContextCleaningSubroutine(BaseSubroutine):
                             # 4. Insert Summary Message
                             # We insert it after the last message being summarized
                             last_index = max(indices_to_hide)
-                            self.conversation.history.insert(last_index + 1, summary_msg)
+                            self.conversation.insert_message(last_index + 1, summary_msg)
 
                             # 5. Hide original messages
                             # Note: Indices shift after insertion, but since we insert AFTER the last one,
@@ -16,7 +16,9 @@ if TYPE_CHECKING:
     from source.services.chat.mcp import MCPManager
 
 from source.server.sql_models import MeetingModel
-from source.services.transcription.text_embedding_manager.manager import EmbeddingModelHandler
+from source.services.transcription.text_embedding_manager.manager import (
+    get_shared_embedding_model,
+)
 
 
 # Cache for Discord usernames: {user_id: username}
@@ -113,19 +115,14 @@ async def query_chroma_summaries(
             job_id="tool_call",
             metadata={"query_count": len(queries)},
         ):
-            handler = EmbeddingModelHandler()
-            try:
-                await asyncio.to_thread(handler.load_model)
-
+            # Shared model stays resident between tool calls (no per-call load)
+            async with get_shared_embedding_model().use() as handler:
                 # Embed the queries
                 # Note: We removed the instruction prefix to match admin_page.py behavior
                 embeddings = await asyncio.to_thread(
                     lambda: handler.encode(queries, batch_size=len(queries))
                 )
 
-            finally:
-                await asyncio.to_thread(handler.offload_model)
-
         # 2. Query ChromaDB
         collection_name = "summaries"
 
@@ -223,14 +220,10 @@ async def query_chroma_transcriptions(
             job_id="tool_call",
             metadata={"query_count": len(queries)},
         ):
-            handler = EmbeddingModelHandler()
-            try:
-                await asyncio.to_thread(handler.load_model)
+            async with get_shared_embedding_model().use() as handler:
                 embeddings = await asyncio.to_thread(
                     lambda: handler.encode(queries, batch_size=len(queries))
                 )
-            finally:
-                await asyncio.to_thread(handler.offload_model)
 
         # 3. Query ChromaDB
         collection_name = f"embeddings_{guild_id}"
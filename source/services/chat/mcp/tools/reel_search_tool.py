@@ -18,7 +18,9 @@ if TYPE_CHECKING:
     from source.context import Context
     from source.services.chat.mcp import MCPManager
 
-from source.services.transcription.text_embedding_manager.manager import EmbeddingModelHandler
+from source.services.transcription.text_embedding_manager.manager import (
+    get_shared_embedding_model,
+)
 
 
 async def refine_search_query(raw_query: str, context: Context) -> str:
@@ -171,15 +173,9 @@ async def query_reel_summaries(
             job_id="reel_search_tool",
             metadata={"query": query},
         ):
-            handler = EmbeddingModelHandler()
-            try:
-                await asyncio.to_thread(handler.load_model)
-
+            async with get_shared_embedding_model().use() as handler:
                 embeddings = await asyncio.to_thread(lambda: handler.encode([query], batch_size=1))
 
-            finally:
-                await asyncio.to_thread(handler.offload_model)
-
         # Step 3: Query ChromaDB
         collection_name = f"reels_{guild_id}"
 
@@ -1,5 +1,5 @@
 """Common service utilities and base classes."""
 
-from source.services.common.job import Job, JobQueue, JobStatus
+from source.services.common.job import Job, JobQueue, JobStatus, KeyedJobQueue
 
-__all__ = ["Job", "JobQueue", "JobStatus"]
+__all__ = ["Job", "JobQueue", "JobStatus", "KeyedJobQueue"]
@@ -253,6 +253,28 @@ class FileManagerService(BaseFileServiceManager):
 
         await self.services.logging_service.info(f"Updated file: {filepath} ({len(data)} bytes)")
 
+    async def append_file(self, filepath: str, data: bytes) -> None:
+        """
+        Append data to a file, creating it if it doesn't exist.
+
+        Args:
+            filepath: Can be absolute path or relative to storage_path
+            data: Data to append as bytes
+        """
+        # Determine if path is absolute or relative
+        if os.path.isabs(filepath):
+            file_path = filepath
+        else:
+            file_path = os.path.join(self.storage_path, filepath)
+
+        async with (
+            self._acquire_file_lock(filepath),
+            aiofiles.open(file_path, "ab") as f,
+        ):
+            await f.write(data)
+
+        await self.services.logging_service.debug(f"Appended to file: {filepath} ({len(data)} bytes)")
+
     async def get_folder_contents(self) -> list[str]:
         """Get a list of files in the storage path."""
         loop = asyncio.get_event_loop()
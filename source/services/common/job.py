@@ -4,13 +4,15 @@ Common job and job queue implementation for event-based processing.
 This module provides:
 - Job: Base class for defining asynchronous jobs
 - JobQueue: Event-based queue that processes one job at a time
+- KeyedJobQueue: Queue that runs jobs in order per key and in parallel across keys
 - JobStatus: Enum for tracking job states
 """
 
 import asyncio
 import enum
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Generic, TypeVar
@@ -267,11 +269,11 @@ class JobQueue(Generic[TJob]):
             # Check if we should retry
             if retry_count < self._max_retries:
                 self._retry_counts[job.job_id] = retry_count + 1
-                # Re-queue the job for retry
-                await self._queue.put(job)
                 # Reset job status for retry
                 job.status = JobStatus.PENDING
                 job.error_message = None
+                # Re-queue the job for retry
+                await self._requeue(job)
             else:
                 # Mark job as failed
                 job.mark_failed(error_message)
@@ -290,6 +292,15 @@ class JobQueue(Generic[TJob]):
                     except Exception as e:
                         print(f"Error in on_job_failed callback: {e}")
 
+    async def _requeue(self, job: TJob) -> None:
+        """
+        Put a job back on the queue for a retry attempt.
+
+        Args:
+            job: The job to retry
+        """
+        await self._queue.put(job)
+
     def get_queue_size(self) -> int:
         """Get the current number of jobs waiting in the queue."""
         return self._queue.qsize()
@@ -330,3 +341,206 @@ class JobQueue(Generic[TJob]):
     def is_running(self) -> bool:
         """Check if the worker is running."""
         return self._is_running
+
+
+class KeyedJobQueue(JobQueue[TJob]):
+    """
+    Job queue that keeps jobs ordered per key while running keys in parallel.
+
+    Jobs sharing a key (e.g. a conversation thread) run one at a time in FIFO
+    order. Jobs with different keys run concurrently, up to max_concurrency
+    jobs at once. Each key with pending work gets its own runner task, which
+    exits once that key's backlog is drained.
+
+    Attributes:
+        key_fn: Function mapping a job to its ordering key
+        max_concurrency: Maximum number of jobs executing at the same time
+        max_retries: Maximum number of retry attempts for failed jobs (default: 0)
+        on_job_complete: Optional callback when a job completes successfully
+        on_job_failed: Optional callback when a job fails
+        on_job_started: Optional callback when a job starts
+    """
+
+    def __init__(
+        self,
+        key_fn: Callable[[TJob], Hashable],
+        max_concurrency: int = 4,
+        max_retries: int = 0,
+        on_job_complete: Callable[[TJob], Any] | None = None,
+        on_job_failed: Callable[[TJob], Any] | None = None,
+        on_job_started: Callable[[TJob], Any] | None = None,
+    ):
+        """
+        Initialize the keyed job queue.
+
+        Args:
+            key_fn: Function mapping a job to its ordering key
+            max_concurrency: Maximum number of jobs executing at the same time
+            max_retries: Maximum number of retry attempts for failed jobs
+            on_job_complete: Optional callback when a job completes successfully
+            on_job_failed: Optional callback when a job fails
+            on_job_started: Optional callback when a job starts
+        """
+        super().__init__(
+            max_retries=max_retries,
+            on_job_complete=on_job_complete,
+            on_job_failed=on_job_failed,
+            on_job_started=on_job_started,
+        )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self._key_fn = key_fn
+        self._max_concurrency: int = max_concurrency
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Per-key state
+        self._pending: dict[Hashable, deque[TJob]] = {}
+        self._runners: dict[Hashable, asyncio.Task] = {}
+        self._current_jobs: dict[Hashable, TJob] = {}
+
+        # Completion tracking for wait_until_empty
+        self._unfinished: int = 0
+        self._all_done: asyncio.Event = asyncio.Event()
+        self._all_done.set()
+
+    async def add_job(self, job: TJob) -> None:
+        """
+        Add a job to the queue behind any pending jobs with the same key.
+
+        If the queue is not running, it will be started automatically.
+
+        Args:
+            job: The job to add to the queue
+        """
+        key = self._key_fn(job)
+        self._pending.setdefault(key, deque()).append(job)
+        self._unfinished += 1
+        self._all_done.clear()
+
+        if not self._is_running:
+            await self.start()
+        else:
+            self._ensure_runner(key)
+
+    async def start(self) -> None:
+        """Start runners for every key with pending jobs."""
+        if self._is_running:
+            return
+
+        self._is_running = True
+        self._shutdown_event.clear()
+        for key in list(self._pending):
+            self._ensure_runner(key)
+
+    async def stop(self, wait_for_completion: bool = True) -> None:
+        """
+        Stop the queue.
+
+        Runners finish their current job and leave the rest pending.
+
+        Args:
+            wait_for_completion: If True, wait for running jobs to complete before stopping
+        """
+        if not self._is_running:
+            return
+
+        self._is_running = False
+        self._shutdown_event.set()
+
+        if wait_for_completion and self._runners:
+            await asyncio.gather(*self._runners.values(), return_exceptions=True)
+
+    def _ensure_runner(self, key: Hashable) -> None:
+        """Start a runner task for a key unless one is already active."""
+        if key not in self._runners:
+            self._runners[key] = asyncio.create_task(self._run_key(key))
+
+    async def _run_key(self, key: Hashable) -> None:
+        """
+        Process jobs for a single key in order until its backlog is empty.
+
+        Args:
+            key: The key whose jobs this runner owns
+        """
+        try:
+            while self._is_running:
+                pending = self._pending.get(key)
+                if not pending:
+                    break
+
+                # Take a concurrency slot per job so busy keys cannot starve others
+                async with self._semaphore:
+                    if not self._is_running:
+                        break
+                    job = pending.popleft()
+                    self._current_jobs[key] = job
+                    try:
+                        await self._process_job(job)
+                    except Exception as e:
+                        print(f"Unexpected error in keyed job queue runner: {e}")
+                    finally:
+                        del self._current_jobs[key]
+                        self._task_done()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            del self._runners[key]
+            if not self._pending.get(key):
+                self._pending.pop(key, None)
+            elif self._is_running:
+                # Jobs arrived after the loop exited; keep them moving
+                self._ensure_runner(key)
+
+    async def _requeue(self, job: TJob) -> None:
+        """Retry a job before anything else queued under its key."""
+        self._pending.setdefault(self._key_fn(job), deque()).appendleft(job)
+        self._unfinished += 1
+        self._all_done.clear()
+
+    def _task_done(self) -> None:
+        """Record that one queued job has been processed."""
+        self._unfinished -= 1
+        if self._unfinished <= 0:
+            self._unfinished = 0
+            self._all_done.set()
+
+    def get_queue_size(self) -> int:
+        """Get the current number of jobs waiting across all keys."""
+        return sum(len(pending) for pending in self._pending.values())
+
+    def get_current_job(self) -> TJob | None:
+        """Get one of the currently processing jobs, if any."""
+        return next(iter(self._current_jobs.values()), None)
+
+    def get_current_jobs(self) -> list[TJob]:
+        """Get all currently processing jobs."""
+        return list(self._current_jobs.values())
+
+    def get_statistics(self) -> dict[str, Any]:
+        """
+        Get queue statistics.
+
+        Returns:
+            Dictionary with the JobQueue statistics plus:
+            - max_concurrency: Maximum number of jobs running at once
+            - active_jobs: Number of jobs currently executing
+            - active_keys: Number of keys with a runner
+        """
+        stats = super().get_statistics()
+        stats.update(
+            {
+                "max_concurrency": self._max_concurrency,
+                "active_jobs": len(self._current_jobs),
+                "active_keys": len(self._runners),
+            }
+        )
+        return stats
+
+    async def wait_until_empty(self) -> None:
+        """Wait until all queued jobs are processed."""
+        await self._all_done.wait()
+
+    def is_empty(self) -> bool:
+        """Check if no jobs are waiting."""
+        return self.get_queue_size() == 0
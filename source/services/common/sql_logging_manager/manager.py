@@ -1,3 +1,6 @@
+import asyncio
+import os
+from contextlib import suppress
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -14,12 +17,24 @@ if TYPE_CHECKING:
 # -------------------------------------------------------------- #
 
 
+# Seconds job status events are coalesced before being written; 0 writes every event
+JOB_STATUS_FLUSH_INTERVAL_SECONDS = float(os.getenv("JOB_STATUS_FLUSH_INTERVAL_SECONDS", "2"))
+
+
 class SQLLoggingManagerService(BaseSQLLoggingServiceManager):
     """Service for managing SQL logging."""
 
-    def __init__(self, context: "Context"):
+    def __init__(self, context: "Context", flush_interval: float | None = None):
         super().__init__(context)
 
+        self.flush_interval = (
+            JOB_STATUS_FLUSH_INTERVAL_SECONDS if flush_interval is None else flush_interval
+        )
+
+        # Latest not yet written status event per job: {job_id: job_data}
+        self._pending_job_events: dict[str, dict] = {}
+        self._flush_task: asyncio.Task | None = None
+
     # -------------------------------------------------------------- #
     # Manager Methods
     # -------------------------------------------------------------- #
@@ -27,11 +42,32 @@ class SQLLoggingManagerService(BaseSQLLoggingServiceManager):
     async def on_start(self, services):
         await super().on_start(services)
         await self.services.logging_service.info("SQLLoggingManagerService initialized")
+
+        if self.flush_interval > 0 and not self._flush_task:
+            self._flush_task = asyncio.create_task(self._flush_loop())
         return True
 
     async def on_close(self):
+        # Stop the flush loop, then write whatever is still buffered
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._flush_task
+        self._flush_task = None
+        await self.flush_job_status_events()
         return True
 
+    async def _flush_loop(self) -> None:
+        """Background task writing coalesced job status events every flush_interval."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush_job_status_events()
+            except Exception as e:
+                await self.services.logging_service.error(
+                    f"Unexpected error flushing job status events: {str(e)}"
+                )
+
     # -------------------------------------------------------------- #
     # SQL Logging Methods
     # -------------------------------------------------------------- #
@@ -57,6 +93,11 @@ class SQLLoggingManagerService(BaseSQLLoggingServiceManager):
         This ensures we maintain a single row per job and track its progress from
         PENDING -> IN_PROGRESS -> COMPLETED/FAILED, updating timestamps along the way.
 
+        Events are buffered and written every flush_interval seconds (and on close).
+        Only the latest status per job is kept, so a job that goes through several
+        states within one interval costs a single upsert. Timestamps and error_log
+        from earlier events are kept unless a later event sets them again.
+
         Args:
             job_type: Type of job (TEMP_TRANSCODING, TRANSCODING, TRANSCRIBING, CLEANING)
             job_id: Unique 16-character job identifier (used as primary key)
@@ -82,8 +123,6 @@ class SQLLoggingManagerService(BaseSQLLoggingServiceManager):
         if not isinstance(job_type, JobsType):
             raise ValueError("job_type must be a valid JobsType enum value")
 
-        # Use INSERT ... ON DUPLICATE KEY UPDATE to handle race conditions
-        # This is atomic and prevents duplicate key errors
         job_data = {
             "id": job_id,  # Use job_id as the primary key
             "type": job_type.value,  # Use the enum value string
@@ -95,18 +134,71 @@ class SQLLoggingManagerService(BaseSQLLoggingServiceManager):
             "error_log": error_log,
         }
 
-        # Build insert statement with ON DUPLICATE KEY UPDATE
+        if self.flush_interval <= 0:
+            await self._upsert_job_status(job_data)
+            return
+
+        # Coalesce with the job's pending event: latest status wins, the first
+        # event's row values are kept and fields are only overwritten when provided
+        pending = self._pending_job_events.get(job_id)
+        if pending is None:
+            self._pending_job_events[job_id] = job_data
+        else:
+            pending["status"] = job_data["status"]
+            for field in ("started_at", "finished_at", "error_log"):
+                if job_data[field] is not None:
+                    pending[field] = job_data[field]
+
+    async def flush_job_status_events(self) -> int:
+        """
+        Write all buffered job status events, one upsert per job.
+
+        Events whose write fails are buffered again and retried on the next flush.
+
+        Returns:
+            Number of jobs written
+        """
+        pending, self._pending_job_events = self._pending_job_events, {}
+        written = 0
+        for job_data in pending.values():
+            try:
+                await self._upsert_job_status(job_data)
+                written += 1
+            except Exception as e:
+                await self.services.logging_service.error(
+                    f"Failed to write job status: job_id={job_data['id']}, "
+                    f"status={job_data['status']}, retrying on next flush: {str(e)}"
+                )
+                self._requeue_job_event(job_data)
+        return written
+
+    def _requeue_job_event(self, job_data: dict) -> None:
+        """
+        Buffer an event whose write failed again.
+
+        If a newer event for the job arrived during the flush its status wins; the
+        failed event only fills in the timestamps and error_log the newer one lacks.
+        """
+        newer = self._pending_job_events.get(job_data["id"])
+        if newer is None:
+            self._pending_job_events[job_data["id"]] = job_data
+            return
+        for field in ("started_at", "finished_at", "error_log"):
+            if newer[field] is None:
+                newer[field] = job_data[field]
+
+    async def _upsert_job_status(self, job_data: dict) -> None:
+        """Insert a job status row, or update the provided fields if it exists."""
+        # Use INSERT ... ON DUPLICATE KEY UPDATE to handle race conditions
+        # This is atomic and prevents duplicate key errors
         stmt = mysql_insert(JobsStatusModel).values(**job_data)
 
         # Define what to update if the key already exists
         # Only update fields that are explicitly provided (not None)
-        update_dict = {"status": status.value}
-        if started_at is not None:
-            update_dict["started_at"] = started_at
-        if finished_at is not None:
-            update_dict["finished_at"] = finished_at
-        if error_log is not None:
-            update_dict["error_log"] = error_log
+        update_dict = {"status": job_data["status"]}
+        for field in ("started_at", "finished_at", "error_log"):
+            if job_data[field] is not None:
+                update_dict[field] = job_data[field]
 
         # Add ON DUPLICATE KEY UPDATE clause
         stmt = stmt.on_duplicate_key_update(**update_dict)
@@ -114,8 +206,8 @@ class SQLLoggingManagerService(BaseSQLLoggingServiceManager):
         # Execute the upsert
         await self.server.sql_client.execute(stmt)
         await self.services.logging_service.log(
-            f"Upserted job status: job_id={job_id}, type={job_type.value}, "
-            f"status={status.value}, meeting_id={meeting_id}"
+            f"Upserted job status: job_id={job_data['id']}, type={job_data['type']}, "
+            f"status={job_data['status']}, meeting_id={job_data['meeting_id']}"
         )
 
     async def fetch_logs(self) -> list:
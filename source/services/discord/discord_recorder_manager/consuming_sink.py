@@ -0,0 +1,78 @@
+"""
+Consuming variant of Pycord's WaveSink.
+
+Pycord's sinks append every decoded packet to a per-user BytesIO that lives
+for the whole recording, so a session that polls the sink keeps every byte
+of audio resident until it stops. ConsumingWaveSink lets the flush cycle
+take ownership of the PCM received so far and start the user over with an
+empty buffer, bounding sink memory to roughly one flush interval per user.
+
+Pycord writes from its decoder thread while the flush cycle reads on the
+event loop, so buffer swaps and writes are serialised with a lock.
+"""
+
+import io
+import threading
+
+import discord
+
+
+class ConsumingWaveSink(discord.sinks.WaveSink):
+    """WaveSink whose per-user buffers can be drained while recording."""
+
+    def __init__(self, *, filters=None):
+        super().__init__(filters=filters)
+        self._lock = threading.Lock()
+
+        # Total bytes ever written per user, including drained ones: {user_id: int}
+        self.bytes_written: dict[int, int] = {}
+
+    @discord.sinks.Filters.container
+    def write(self, data, user):
+        with self._lock:
+            if user not in self.audio_data:
+                self.audio_data[user] = discord.sinks.AudioData(io.BytesIO())
+            self.audio_data[user].write(data)
+            self.bytes_written[user] = self.bytes_written.get(user, 0) + len(data)
+
+    def consume(self, user) -> bytes:
+        """
+        Take all audio buffered for a user since the last call.
+
+        The user's BytesIO is replaced with a fresh one, so the returned
+        bytes are no longer referenced by the sink.
+
+        Args:
+            user: User ID as used by pycord in audio_data
+
+        Returns:
+            Buffered audio bytes (empty if nothing new was written)
+        """
+        with self._lock:
+            audio = self.audio_data.get(user)
+            if audio is None or audio.finished:
+                return b""
+            data = audio.file.getvalue()
+            if data:
+                audio.file = io.BytesIO()
+            return data
+
+    def consume_all(self) -> dict[int, bytes]:
+        """
+        Take buffered audio for every user that has written to the sink.
+
+        Returns:
+            {user_id: bytes} for all users known to the sink, including empty ones
+        """
+        with self._lock:
+            users = list(self.audio_data.keys())
+        return {user: self.consume(user) for user in users}
+
+    def buffered_bytes(self) -> int:
+        """Number of bytes currently held by the sink across all users."""
+        total = 0
+        with self._lock:
+            for audio in self.audio_data.values():
+                with audio.file.getbuffer() as view:
+                    total += view.nbytes
+        return total
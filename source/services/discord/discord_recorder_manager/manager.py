@@ -10,16 +10,19 @@ from sqlalchemy import select
 
 if TYPE_CHECKING:
     from source.context import Context
+    from source.services.gpu.ffmpeg_manager.manager import FFmpegConversionStream
 
 from source.server.sql_models import (
     MeetingStatus,
     TempRecordingModel,
     TranscodeStatus,
 )
+from source.services.discord.discord_recorder_manager.consuming_sink import ConsumingWaveSink
 from source.services.discord.discord_recorder_manager.pcm_generator import (
     SilentPCM,
     calculate_pcm_duration_ms,
 )
+from source.services.discord.discord_recorder_manager.window_buffer import PCMWindowBuffer
 from source.services.manager import BaseDiscordRecorderServiceManager, ServicesManager
 from source.utils import BotUtils, generate_16_char_uuid, get_current_timestamp_est
 
@@ -70,6 +73,23 @@ class DiscordRecorderConstants:
     # FFmpeg encoding
     MP3_BITRATE = "128k"  # 128 kbps
 
+    # Streaming encode
+    # When enabled, each user gets one long-lived FFmpeg encoder fed directly from the
+    # flush path, instead of a PCM temp file and a separate FFmpeg process per 30s window.
+    # Users whose encoder fails to start or dies fall back to per-window transcodes.
+    STREAMING_ENCODE_ENABLED = os.getenv("RECORDING_STREAMING_ENCODE", "true").lower() == "true"
+
+    # Silence markers
+    # Fully silent windows (backfill for absent or not-yet-speaking users) are not written
+    # or transcoded. Each run of consecutive silent windows becomes one temp recording with
+    # this extension and a silence_ms duration; the silence is rendered at final assembly.
+    SILENCE_MARKER_EXTENSION = ".silence"
+
+    # Post-stop processing
+    # Users' final tracks (concatenate, persist, probe) are assembled concurrently,
+    # at most this many at a time
+    POST_STOP_MAX_CONCURRENCY = int(os.getenv("RECORDING_POST_STOP_CONCURRENCY", "4"))
+
     # Transcode timeout
     TRANSCODE_TIMEOUT_SECONDS = 360  # 6 minutes
 
@@ -94,13 +114,15 @@ class DiscordSessionHandler:
     - Multi-user audio recording via Pycord's recording API
     - Per-user audio buffering and periodic flushing
     - Temp recording creation in SQL
-    - FFmpeg job queuing
+    - FFmpeg job queuing (or per-user streaming encoders)
     - Session lifecycle management
 
     Recording Architecture:
-    - Uses discord.sinks.WaveSink to capture per-user audio streams
+    - Uses ConsumingWaveSink (a pycord WaveSink) to capture per-user audio streams
+    - Each flush drains the sink, so sink memory stays bounded by one flush interval
     - Periodically flushes audio for ALL users in the call
     - Each user's audio is stored as separate temp recordings
+    - Fully silent windows are stored as silence markers, rendered at final assembly
     """
 
     def __init__(
@@ -125,8 +147,8 @@ class DiscordSessionHandler:
         self.is_paused = False  # Track if session is paused
         self.pause_time: datetime | None = None  # Track when session was paused
 
-        # Per-user audio buffers: {user_id: bytearray}
-        self._user_audio_buffers: dict[int, bytearray] = {}
+        # Per-user audio buffers: {user_id: PCMWindowBuffer}
+        self._user_audio_buffers: dict[int, PCMWindowBuffer] = {}
 
         # Track chunk counters per user: {user_id: int}
         self._user_chunk_counters: dict[int, int] = {}
@@ -134,7 +156,7 @@ class DiscordSessionHandler:
         # Track temp recording IDs per user: {user_id: list[str]}
         self._user_temp_recording_ids: dict[int, list[str]] = {}
 
-        # Track how many bytes we've read from each user's sink: {user_id: int}
+        # Track how many bytes we've consumed from each user's sink: {user_id: int}
         self._user_bytes_read: dict[int, int] = {}
 
         # Timeline tracking per user (wall-clock based, in milliseconds)
@@ -149,8 +171,27 @@ class DiscordSessionHandler:
             unsigned_8bit=DiscordRecorderConstants.DISCORD_UNSIGNED_8BIT,
         )
 
+        # Per-user streaming encoders (STREAMING_ENCODE_ENABLED): {user_id: stream}
+        self._user_encoder_streams: dict[int, "FFmpegConversionStream"] = {}
+
+        # Temp recording ID backing each user's encoder stream: {user_id: str | None}
+        self._user_stream_recording_ids: dict[int, str | None] = {}
+
+        # Users that fell back to per-window transcodes after an encoder failure
+        self._user_stream_fallback: set[int] = set()
+
+        # Silent windows not yet recorded as a marker: {user_id: [first_chunk_idx, window_count]}
+        self._user_silence_runs: dict[int, list[int]] = {}
+
+        # PCM emitted for each user, counting backfilled silence: {user_id: bytes}
+        self._user_emitted_pcm_bytes: dict[int, int] = {}
+
+        # Temp recordings emitted this cycle, inserted together by _commit_temp_recordings:
+        # [(user_id, insert_temp_recording kwargs, (pcm_path, mp3_path) to transcode or None)]
+        self._staged_temp_recordings: list[tuple[int, dict, tuple[str, str] | None]] = []
+
         # Pycord recording sink
-        self._sink: discord.sinks.WaveSink | None = None
+        self._sink: ConsumingWaveSink | None = None
 
         # Shutdown flag
         self._is_shutting_down = False
@@ -191,7 +232,7 @@ class DiscordSessionHandler:
 
             # Only initialize if user is not already tracked
             if user_id not in self._user_chunk_counters:
-                self._user_audio_buffers[user_id] = bytearray()
+                self._user_audio_buffers[user_id] = PCMWindowBuffer()
                 self._user_chunk_counters[user_id] = 0
                 self._user_temp_recording_ids[user_id] = []
                 self._user_bytes_read[user_id] = 0
@@ -223,6 +264,9 @@ class DiscordSessionHandler:
         self._user_temp_recording_ids = {}
         self._user_bytes_read = {}
         self._user_last_wall_ms = {}
+        self._user_silence_runs = {}
+        self._user_emitted_pcm_bytes = {}
+        self._staged_temp_recordings = []
 
         # Initialize tracking for all users currently in the voice channel
         await self._initialize_channel_members()
@@ -232,8 +276,8 @@ class DiscordSessionHandler:
             f"user {self.user_id}, channel {self.channel_id}"
         )
 
-        # Start Pycord recording with WaveSink
-        self._sink = discord.sinks.WaveSink()
+        # Start Pycord recording with a WaveSink that the flush cycle drains
+        self._sink = ConsumingWaveSink()
 
         # Start recording (callback will be triggered on stop)
         # Use sync_start=False to avoid blocking the event loop
@@ -287,11 +331,21 @@ class DiscordSessionHandler:
             # Final timeline catch-up: ensure all users have the same number of chunks
             # by padding stragglers to match the user with the most chunks
             await self._backfill_to_max_chunks()
-        else:
+
+            # Record trailing silent runs as markers
+            await self._record_silence_runs()
+
+        # Insert everything staged since the last cycle (also rows a cancelled cycle left behind)
+        await self._commit_temp_recordings()
+
+        if was_paused:
             await self.services.logging_service.info(
                 "Session was paused - skipping audio extraction/flush (audio already saved to temp files during pause)"
             )
 
+        # Finalize streaming encoders now that every window has been pushed
+        await self._close_encoder_streams()
+
         # Now set shutdown flag to prevent any new operations
         self._is_shutting_down = True
 
@@ -341,6 +395,8 @@ class DiscordSessionHandler:
         # This ensures temp recordings exist in database for later processing
         await self._extract_user_audio_from_sink()
         await self._flush_all_users(force=True)
+        await self._record_silence_runs()
+        await self._commit_temp_recordings()
 
         # Stop Discord recording to prevent audio collection during pause
         if self.discord_voice_client.recording:
@@ -428,7 +484,7 @@ class DiscordSessionHandler:
         self._consecutive_empty_flush_cycles = 0
 
         # Restart Discord recording with a fresh sink
-        self._sink = discord.sinks.WaveSink()
+        self._sink = ConsumingWaveSink()
         self.discord_voice_client.start_recording(
             self._sink, self._recording_finished_callback, sync_start=False
         )
@@ -590,9 +646,10 @@ class DiscordSessionHandler:
         """
         Extract audio data from the Pycord sink for all users with timeline-driven gap padding.
 
-        This reads from sink.audio_data and appends new PCM data to per-user buffers.
-        The sink accumulates audio continuously, so we track what we've already
-        processed (via _user_bytes_read) to avoid duplicates.
+        This drains each user's buffer in the sink and appends the PCM to per-user
+        buffers. Draining hands the bytes over to us, so the sink only ever holds
+        audio received since the last flush instead of the whole session.
+        _user_bytes_read tracks the total consumed per user.
 
         Timeline-driven architecture:
         1. Use session clock (elapsed time since start_time) for all timeline calculations
@@ -620,12 +677,12 @@ class DiscordSessionHandler:
         # WAV header size (standard RIFF WAV format)
         WAV_HEADER_SIZE = 44
 
-        # Iterate through all users in the sink
-        for user_id, audio_data in self._sink.audio_data.items():
+        # Drain all users in the sink (snapshot, pycord may add users concurrently)
+        for user_id, consumed_data in self._sink.consume_all().items():
             # Initialize buffer for new users
             is_new_user = user_id not in self._user_audio_buffers
             if is_new_user:
-                self._user_audio_buffers[user_id] = bytearray()
+                self._user_audio_buffers[user_id] = PCMWindowBuffer()
                 self._user_chunk_counters[user_id] = 0
                 self._user_temp_recording_ids[user_id] = []
                 self._user_bytes_read[user_id] = 0
@@ -634,30 +691,22 @@ class DiscordSessionHandler:
                     f"Started recording for user {user_id} in meeting {self.meeting_id}"
                 )
 
-            # Get current position in the BytesIO
-            bytes_io = audio_data.file
-            bytes_io.seek(0, 2)  # Seek to end to get total size
-            total_bytes = bytes_io.tell()
-
-            # Calculate how many new bytes are available
-            bytes_already_read = self._user_bytes_read[user_id]
-            new_bytes_available = total_bytes - bytes_already_read
-
-            if new_bytes_available <= 0:
+            if not consumed_data:
                 continue  # No new data for this user
 
-            # Seek to where we left off
-            bytes_io.seek(bytes_already_read)
+            bytes_already_read = self._user_bytes_read[user_id]
+            total_bytes = bytes_already_read + len(consumed_data)
 
             # If this is the first read, skip WAV header
             if bytes_already_read == 0:
-                # Skip WAV header (44 bytes)
-                bytes_io.seek(WAV_HEADER_SIZE)
-                bytes_already_read = WAV_HEADER_SIZE
-                new_bytes_available = total_bytes - WAV_HEADER_SIZE
+                new_pcm_data = consumed_data[WAV_HEADER_SIZE:]
+            else:
+                new_pcm_data = consumed_data
+            del consumed_data
 
-            # Read only the new PCM data
-            new_pcm_data = bytes_io.read(new_bytes_available)
+            if not new_pcm_data:
+                self._user_bytes_read[user_id] = total_bytes
+                continue
 
             # Calculate duration of this new PCM block in milliseconds
             pcm_ms = calculate_pcm_duration_ms(
@@ -895,6 +944,9 @@ class DiscordSessionHandler:
                 # (runs AFTER flush so chunk counters are up-to-date)
                 await self._backfill_absent_users()
 
+                # Insert this cycle's temp recordings in one statement
+                await self._commit_temp_recordings()
+
                 await self.services.logging_service.info(
                     f"Completed flush cycle #{flush_count} for meeting {self.meeting_id}"
                 )
@@ -944,9 +996,8 @@ class DiscordSessionHandler:
             # Process buffer in exact 30s windows
             windows_emitted = 0
             while len(buffer) >= DiscordRecorderConstants.WINDOW_BYTES:
-                # Extract exact 30s window
-                window_data = bytes(buffer[: DiscordRecorderConstants.WINDOW_BYTES])
-                del buffer[: DiscordRecorderConstants.WINDOW_BYTES]
+                # Extract exact 30s window (a view, copied only if it spans appended blocks)
+                window_data = buffer.take(DiscordRecorderConstants.WINDOW_BYTES)
 
                 # Validate frame alignment
                 if not self._is_frame_aligned(len(window_data)):
@@ -956,12 +1007,18 @@ class DiscordSessionHandler:
                         f"(expected multiple of {DiscordRecorderConstants.FRAME_BYTES})"
                     )
 
-                # Flush this exact 30s window
-                await self._flush_user_window(
-                    user_id=user_id,
-                    chunk_idx=self._user_chunk_counters[user_id],
-                    window_data=window_data,
-                )
+                # Windows that are only gap padding are recorded like backfill
+                if self._silent_gen.is_silent(window_data):
+                    await self._flush_user_backfill(
+                        user_id=user_id, chunk_idx=self._user_chunk_counters[user_id]
+                    )
+                else:
+                    # Flush this exact 30s window
+                    await self._flush_user_window(
+                        user_id=user_id,
+                        chunk_idx=self._user_chunk_counters[user_id],
+                        window_data=window_data,
+                    )
 
                 self._user_chunk_counters[user_id] += 1
                 windows_emitted += 1
@@ -970,8 +1027,7 @@ class DiscordSessionHandler:
 
             # On final flush, emit remaining partial window (if any)
             if force and len(buffer) > 0:
-                partial_window_data = bytes(buffer)
-                buffer.clear()
+                partial_window_data = buffer.take_all()
 
                 partial_duration_ms = calculate_pcm_duration_ms(
                     len(partial_window_data),
@@ -1102,83 +1158,195 @@ class DiscordSessionHandler:
 
     async def _flush_user_backfill(self, user_id: int, chunk_idx: int) -> None:
         """
-        Flush a single silent 30s window for timeline backfill.
+        Record a single silent 30s window for timeline backfill.
 
         Used for:
         1. First-packet-anchored backfill (new users joining mid-session)
         2. Absent-user backfill (users who left or are temporarily absent)
         3. Final equalization backfill (stop path padding to max chunks)
+        4. Buffered windows that contain nothing but gap padding
 
-        Generates exactly WINDOW_MS (30,000ms) of silence, which equals
-        WINDOW_BYTES (5,760,000 bytes) of frame-aligned PCM.
+        If the user has a running encoder stream, exactly WINDOW_MS of silence is
+        pushed into it so the stream's MP3 stays contiguous. Otherwise no audio is
+        generated: the window extends the user's pending silence run, which is
+        recorded as a single silence marker once the run ends (see _record_silence_run).
 
         Args:
             user_id: Discord user ID
             chunk_idx: Window index (0-based, monotonically increasing)
         """
-        # Generate exact 30s of silence (frame-aligned)
-        window_data = self._silent_gen.generate(DiscordRecorderConstants.WINDOW_MS)
+        self._count_emitted_pcm(user_id, DiscordRecorderConstants.WINDOW_BYTES)
 
-        # Validate the generated silence is exactly WINDOW_BYTES
-        if len(window_data) != DiscordRecorderConstants.WINDOW_BYTES:
-            await self.services.logging_service.warning(
-                f"Backfill silence for user {user_id} chunk {chunk_idx} generated "
-                f"{len(window_data)} bytes, expected {DiscordRecorderConstants.WINDOW_BYTES}"
-            )
+        # Streaming mode: keep an open encoder's timeline continuous
+        if user_id in self._user_encoder_streams:
+            window_data = self._silent_gen.generate(DiscordRecorderConstants.WINDOW_MS)
+            consumed = await self._push_to_encoder_stream(user_id, chunk_idx, window_data)
+            if consumed == len(window_data):
+                await self.services.logging_service.debug(
+                    f"Streamed silent window {chunk_idx} for user {user_id} "
+                    f"in meeting {self.meeting_id} (size: {len(window_data):,} bytes, "
+                    f"timestamp: {chunk_idx * DiscordRecorderConstants.WINDOW_MS}ms)"
+                )
+                return
+            if consumed:
+                # The encoder died part way through: mark only the silence it didn't get
+                consumed_ms = self._pcm_ms(consumed)
+                await self._record_silence_run(user_id)
+                self._stage_temp_recording(
+                    user_id,
+                    start_timestamp_ms=chunk_idx * DiscordRecorderConstants.WINDOW_MS
+                    + consumed_ms,
+                    filename=(
+                        f"{self.meeting_id}_user{user_id}_chunk{chunk_idx:04d}"
+                        f"{DiscordRecorderConstants.SILENCE_MARKER_EXTENSION}"
+                    ),
+                    silence_ms=DiscordRecorderConstants.WINDOW_MS - consumed_ms,
+                )
+                return
 
-        # Generate unique chunk filename
-        pcm_filename = f"{self.meeting_id}_user{user_id}_chunk{chunk_idx:04d}.pcm"
-        mp3_filename = f"{self.meeting_id}_user{user_id}_chunk{chunk_idx:04d}.mp3"
+        # Extend the pending run, or start a new one if this window isn't contiguous
+        run = self._user_silence_runs.get(user_id)
+        if run and run[0] + run[1] == chunk_idx:
+            run[1] += 1
+        else:
+            await self._record_silence_run(user_id)
+            self._user_silence_runs[user_id] = [chunk_idx, 1]
 
-        # Write PCM to temp storage
-        pcm_path = await self._write_pcm_to_temp(pcm_filename, window_data)
+        await self.services.logging_service.debug(
+            f"Backfilled silent window {chunk_idx} for user {user_id} in meeting {self.meeting_id} "
+            f"(duration: {DiscordRecorderConstants.WINDOW_MS}ms, "
+            f"timestamp: {chunk_idx * DiscordRecorderConstants.WINDOW_MS}ms)"
+        )
 
-        # Build MP3 output path in temp storage
-        temp_storage_path = (
-            self.services.recording_file_service_manager.get_temporary_storage_path()
+    async def _record_silence_run(self, user_id: int) -> None:
+        """
+        Record a user's pending run of silent windows as one silence marker.
+
+        The marker is a temp recording with no file behind it: its timestamp is the
+        first window's start and silence_ms covers every window in the run. It is
+        created already done, so it needs no transcode. The row is staged and
+        inserted by the next _commit_temp_recordings.
+
+        Args:
+            user_id: Discord user ID
+        """
+        run = self._user_silence_runs.pop(user_id, None)
+        if not run:
+            return
+
+        first_idx, window_count = run
+        duration_ms = window_count * DiscordRecorderConstants.WINDOW_MS
+        marker_filename = (
+            f"{self.meeting_id}_user{user_id}_chunk{first_idx:04d}"
+            f"{DiscordRecorderConstants.SILENCE_MARKER_EXTENSION}"
         )
-        mp3_path = os.path.join(temp_storage_path, mp3_filename)
 
-        # Create temp recording in SQL with exact timestamp
-        # Timestamp = chunk_idx * WINDOW_MS (exact 30s boundaries)
-        temp_recording_id = None
+        self._stage_temp_recording(
+            user_id,
+            start_timestamp_ms=first_idx * DiscordRecorderConstants.WINDOW_MS,
+            filename=marker_filename,
+            silence_ms=duration_ms,
+        )
+
+        await self.services.logging_service.info(
+            f"Recorded silence marker for user {user_id} in meeting {self.meeting_id}: "
+            f"{window_count} window(s) from chunk {first_idx} ({duration_ms}ms)"
+        )
+
+    async def _record_silence_runs(self) -> None:
+        """Record every user's pending silent run (stop and pause paths)."""
+        for user_id in list(self._user_silence_runs.keys()):
+            await self._record_silence_run(user_id)
+
+    def _stage_temp_recording(
+        self,
+        user_id: int,
+        start_timestamp_ms: int,
+        filename: str,
+        silence_ms: int | None = None,
+        transcode: tuple[str, str] | None = None,
+    ) -> None:
+        """
+        Stage a temp recording row for the next _commit_temp_recordings.
+
+        Args:
+            user_id: Discord user ID
+            start_timestamp_ms: Position of the chunk in the meeting timeline
+            filename: Filename of the chunk in temp storage
+            silence_ms: Duration if the chunk is a silence marker
+            transcode: (pcm_path, mp3_path) to transcode once the row is inserted
+        """
+        row = {
+            "user_id": str(user_id),  # Discord user ID
+            "meeting_id": self.meeting_id,
+            "start_timestamp_ms": start_timestamp_ms,
+            "filename": filename,
+            "silence_ms": silence_ms,
+        }
+        self._staged_temp_recordings.append((user_id, row, transcode))
+
+    async def _commit_temp_recordings(self) -> None:
+        """
+        Insert all staged temp recordings with one statement, then queue their transcodes.
+
+        Called once at the end of every flush cycle, and on the pause and stop
+        paths, so SQL round trips per cycle no longer grow with the number of users.
+        Transcodes are queued after the insert so status updates always find their row.
+        """
+        staged, self._staged_temp_recordings = self._staged_temp_recordings, []
+        if not staged:
+            return
+
+        temp_recording_ids: list[str | None] = [None] * len(staged)
         if self.services.sql_recording_service_manager:
             try:
-                start_timestamp_ms = chunk_idx * DiscordRecorderConstants.WINDOW_MS
-
-                temp_recording_id = (
-                    await self.services.sql_recording_service_manager.insert_temp_recording(
-                        user_id=str(user_id),  # Discord user ID
-                        meeting_id=self.meeting_id,
-                        start_timestamp_ms=start_timestamp_ms,
-                        filename=pcm_filename,
+                temp_recording_ids = (
+                    await self.services.sql_recording_service_manager.insert_temp_recordings(
+                        [row for _, row, _ in staged]
                     )
                 )
-
-                if temp_recording_id:
-                    # Ensure user has entry in temp_recording_ids dict
-                    if user_id not in self._user_temp_recording_ids:
-                        self._user_temp_recording_ids[user_id] = []
-                    self._user_temp_recording_ids[user_id].append(temp_recording_id)
             except Exception as e:
                 await self.services.logging_service.error(
-                    f"CRITICAL DISCORD RECORDER SQL ERROR: Failed to insert backfill temp recording - "
-                    f"Meeting: {self.meeting_id}, User: {user_id}, Chunk: {chunk_idx}, "
-                    f"Filename: {pcm_filename}, Error Type: {type(e).__name__}, Details: {str(e)}. "
+                    f"CRITICAL DISCORD RECORDER SQL ERROR: Failed to insert {len(staged)} temp recording(s) - "
+                    f"Meeting: {self.meeting_id}, "
+                    f"Filenames: {', '.join(row['filename'] for _, row, _ in staged)}, "
+                    f"Error Type: {type(e).__name__}, Details: {str(e)}. "
                     f"This likely indicates a missing meeting entry in the meetings table (foreign key constraint)."
                 )
                 # Don't raise - allow recording to continue even if SQL fails
+                # The files were already saved, so we can manually recover later
 
-        # Queue FFmpeg transcode job
-        await self._queue_pcm_to_mp3_transcode(pcm_path, mp3_path, temp_recording_id)
+        for (user_id, _, transcode), temp_recording_id in zip(staged, temp_recording_ids):
+            if temp_recording_id:
+                self._user_temp_recording_ids.setdefault(user_id, []).append(temp_recording_id)
+            if transcode:
+                pcm_path, mp3_path = transcode
+                await self._queue_pcm_to_mp3_transcode(pcm_path, mp3_path, temp_recording_id)
 
-        await self.services.logging_service.debug(
-            f"Backfilled silent window {chunk_idx} for user {user_id} in meeting {self.meeting_id} "
-            f"(PCM: {pcm_filename}, size: {len(window_data):,} bytes, duration: {DiscordRecorderConstants.WINDOW_MS}ms, "
-            f"timestamp: {chunk_idx * DiscordRecorderConstants.WINDOW_MS}ms)"
+    def _count_emitted_pcm(self, user_id: int, byte_count: int) -> None:
+        """
+        Add a just-emitted window to the user's track length.
+
+        Counted from the PCM itself rather than the chunk grid: a pause emits a
+        partial window but the chunk counter keeps going after resume.
+        """
+        self._user_emitted_pcm_bytes[user_id] = (
+            self._user_emitted_pcm_bytes.get(user_id, 0) + byte_count
         )
 
-    async def _flush_user_window(self, user_id: int, chunk_idx: int, window_data: bytes) -> None:
+    @staticmethod
+    def _pcm_ms(byte_count: int) -> int:
+        """Duration in ms of `byte_count` bytes of Discord PCM."""
+        return calculate_pcm_duration_ms(
+            byte_count,
+            sample_rate=DiscordRecorderConstants.DISCORD_SAMPLE_RATE,
+            bits_per_sample=DiscordRecorderConstants.DISCORD_BITS_PER_SAMPLE,
+            channels=DiscordRecorderConstants.DISCORD_CHANNELS,
+        )
+
+    async def _flush_user_window(
+        self, user_id: int, chunk_idx: int, window_data: bytes | memoryview
+    ) -> None:
         """
         Flush a single audio window (real data) for a user.
 
@@ -1187,8 +1355,8 @@ class DiscordSessionHandler:
 
         This method handles:
         1. Writing PCM window to temp storage
-        2. Creating temp recording in SQL with exact timestamp
-        3. Queuing FFmpeg transcode job
+        2. Staging the temp recording with its exact timestamp
+        3. Queuing FFmpeg transcode job (after the staged row is inserted)
 
         Timestamp calculation: chunk_idx * WINDOW_MS
         This ensures exact 30s boundaries in the timeline.
@@ -1197,8 +1365,30 @@ class DiscordSessionHandler:
             user_id: Discord user ID
             chunk_idx: Window index (0-based, monotonically increasing)
             window_data: Exact PCM bytes for this window (typically 30s = 5,760,000 bytes,
-                        or partial on final flush)
+                        or partial on final flush), usually a view into the user's buffer
         """
+        # Audio ends any silent run before it, record it first to keep markers in order
+        await self._record_silence_run(user_id)
+
+        self._count_emitted_pcm(user_id, len(window_data))
+
+        # Streaming mode: feed the user's encoder directly
+        consumed = await self._push_to_encoder_stream(user_id, chunk_idx, window_data)
+        if consumed == len(window_data):
+            await self.services.logging_service.info(
+                f"Streamed window {chunk_idx} for user {user_id} "
+                f"in meeting {self.meeting_id} (size: {len(window_data):,} bytes, "
+                f"timestamp: {chunk_idx * DiscordRecorderConstants.WINDOW_MS}ms)"
+            )
+            return
+
+        # If the encoder died part way through, transcode only what it didn't get
+        start_timestamp_ms = chunk_idx * DiscordRecorderConstants.WINDOW_MS
+        if consumed:
+            window_data = window_data[consumed:]
+            start_timestamp_ms += self._pcm_ms(consumed)
+        window_duration_ms = self._pcm_ms(len(window_data))
+
         # Generate unique chunk filename
         pcm_filename = f"{self.meeting_id}_user{user_id}_chunk{chunk_idx:04d}.pcm"
         mp3_filename = f"{self.meeting_id}_user{user_id}_chunk{chunk_idx:04d}.mp3"
@@ -1212,59 +1402,196 @@ class DiscordSessionHandler:
         )
         mp3_path = os.path.join(temp_storage_path, mp3_filename)
 
-        # Create temp recording in SQL with exact timestamp
-        # Timestamp = chunk_idx * WINDOW_MS (exact 30s boundaries)
+        # Stage the temp recording with its exact timestamp
+        # Timestamp = chunk_idx * WINDOW_MS (exact 30s boundaries, or later for the
+        # rest of a window a dying encoder took part of); the transcode is queued
+        # once the row exists (see _commit_temp_recordings)
+        self._stage_temp_recording(
+            user_id,
+            start_timestamp_ms=start_timestamp_ms,
+            filename=pcm_filename,
+            transcode=(pcm_path, mp3_path),
+        )
+
+        await self.services.logging_service.info(
+            f"Flushed window {chunk_idx} for user {user_id} in meeting {self.meeting_id} "
+            f"(PCM: {pcm_filename}, size: {len(window_data):,} bytes, duration: {window_duration_ms}ms, "
+            f"timestamp: {start_timestamp_ms}ms)"
+        )
+
+    # -------------------------------------------------------------- #
+    # Streaming Encoder
+    # -------------------------------------------------------------- #
+
+    async def _get_encoder_stream(
+        self, user_id: int, chunk_idx: int
+    ) -> "FFmpegConversionStream | None":
+        """
+        Get (or start) the long-lived MP3 encoder for a user.
+
+        The first window pushed to a stream creates a single temp recording whose
+        timestamp is that window's start, so post-stop processing sees the stream's
+        MP3 as one chunk covering every window the stream received.
+
+        Args:
+            user_id: Discord user ID
+            chunk_idx: Index of the first window that will be pushed
+
+        Returns:
+            The user's running stream, or None if streaming is unavailable for this user
+        """
+        if (
+            not DiscordRecorderConstants.STREAMING_ENCODE_ENABLED
+            or user_id in self._user_stream_fallback
+            or not self.services.ffmpeg_service_manager
+        ):
+            return None
+
+        stream = self._user_encoder_streams.get(user_id)
+        if stream:
+            return stream
+
+        mp3_filename = f"{self.meeting_id}_user{user_id}_stream{chunk_idx:04d}.mp3"
+        mp3_path = os.path.join(
+            self.services.recording_file_service_manager.get_temporary_storage_path(),
+            mp3_filename,
+        )
+
+        stream = await self.services.ffmpeg_service_manager.create_pcm_to_mp3_stream_handler(
+            output_path=mp3_path,
+            bitrate=DiscordRecorderConstants.MP3_BITRATE,
+            job_id=generate_16_char_uuid(),
+            meeting_id=self.meeting_id,
+        )
+        if not stream:
+            await self.services.logging_service.warning(
+                f"Could not start streaming encoder for user {user_id} in meeting {self.meeting_id}, "
+                f"falling back to per-window transcodes"
+            )
+            self._user_stream_fallback.add(user_id)
+            return None
+
+        # Create temp recording in SQL for the stream's MP3
         temp_recording_id = None
         if self.services.sql_recording_service_manager:
             try:
-                start_timestamp_ms = chunk_idx * DiscordRecorderConstants.WINDOW_MS
-
                 temp_recording_id = (
                     await self.services.sql_recording_service_manager.insert_temp_recording(
                         user_id=str(user_id),  # Discord user ID
                         meeting_id=self.meeting_id,
-                        start_timestamp_ms=start_timestamp_ms,
-                        filename=pcm_filename,
+                        start_timestamp_ms=chunk_idx * DiscordRecorderConstants.WINDOW_MS,
+                        filename=mp3_filename,
                     )
                 )
 
                 if temp_recording_id:
-                    # Ensure user has entry in temp_recording_ids dict
                     if user_id not in self._user_temp_recording_ids:
                         self._user_temp_recording_ids[user_id] = []
                     self._user_temp_recording_ids[user_id].append(temp_recording_id)
             except Exception as e:
                 await self.services.logging_service.error(
-                    f"CRITICAL DISCORD RECORDER SQL ERROR: Failed to insert temp recording - "
+                    f"CRITICAL DISCORD RECORDER SQL ERROR: Failed to insert stream temp recording - "
                     f"Meeting: {self.meeting_id}, User: {user_id}, Chunk: {chunk_idx}, "
-                    f"Filename: {pcm_filename}, Error Type: {type(e).__name__}, Details: {str(e)}. "
+                    f"Filename: {mp3_filename}, Error Type: {type(e).__name__}, Details: {str(e)}. "
                     f"This likely indicates a missing meeting entry in the meetings table (foreign key constraint)."
                 )
                 # Don't raise - allow recording to continue even if SQL fails
-                # The file was already saved, so we can manually recover later
 
-        # Queue FFmpeg transcode job
-        await self._queue_pcm_to_mp3_transcode(pcm_path, mp3_path, temp_recording_id)
+        self._user_encoder_streams[user_id] = stream
+        self._user_stream_recording_ids[user_id] = temp_recording_id
+        return stream
 
-        # Calculate duration for logging
-        window_duration_ms = calculate_pcm_duration_ms(
-            len(window_data),
-            sample_rate=DiscordRecorderConstants.DISCORD_SAMPLE_RATE,
-            bits_per_sample=DiscordRecorderConstants.DISCORD_BITS_PER_SAMPLE,
-            channels=DiscordRecorderConstants.DISCORD_CHANNELS,
+    async def _push_to_encoder_stream(
+        self, user_id: int, chunk_idx: int, window_data: bytes | memoryview
+    ) -> int:
+        """
+        Push a window to the user's streaming encoder.
+
+        Args:
+            user_id: Discord user ID
+            chunk_idx: Window index (0-based, monotonically increasing)
+            window_data: PCM bytes for this window
+
+        Returns:
+            Number of bytes of the window the stream consumed. Anything less than
+            len(window_data) (0 when streaming is unavailable) must go through the
+            per-window transcode path; the consumed part is already in the stream's
+            MP3 and must not be written again.
+        """
+        stream = await self._get_encoder_stream(user_id, chunk_idx)
+        if not stream:
+            return 0
+
+        bytes_before = stream.bytes_processed
+        if await stream.push_to_stream(window_data):
+            return len(window_data)
+
+        # Whole milliseconds only, so the remainder starts on a sample boundary
+        # and its timestamp is exact
+        consumed = stream.bytes_processed - bytes_before
+        consumed -= consumed % DiscordRecorderConstants.BYTES_PER_MS
+
+        # Encoder died: finalize what it has and switch this user to per-window transcodes
+        await self.services.logging_service.error(
+            f"Streaming encoder for user {user_id} in meeting {self.meeting_id} stopped accepting "
+            f"data at window {chunk_idx} ({consumed:,} of {len(window_data):,} bytes taken), "
+            f"falling back to per-window transcodes"
+        )
+        self._user_stream_fallback.add(user_id)
+        await self._close_encoder_stream(user_id)
+        return consumed
+
+    async def _close_encoder_stream(self, user_id: int) -> None:
+        """Finalize a user's encoder stream and record the outcome on its temp recording."""
+        stream = self._user_encoder_streams.pop(user_id, None)
+        if not stream:
+            return
+
+        temp_recording_id = self._user_stream_recording_ids.pop(user_id, None)
+        success = await self.services.ffmpeg_service_manager.finish_pcm_to_mp3_stream(stream)
+
+        # Skip database operations during shutdown
+        if self.context.is_shutting_down():
+            return
+
+        if not self.services.sql_recording_service_manager or not temp_recording_id:
+            return
+
+        new_status = TranscodeStatus.DONE if success else TranscodeStatus.FAILED
+        await self.services.sql_recording_service_manager.update_temp_recording_status(
+            temp_recording_id=temp_recording_id, status=new_status
         )
 
+        # Send DM notification to requestor if transcode failed
+        if not success:
+            await self._send_transcode_error_dm(self.meeting_id, temp_recording_id)
+
+    async def _close_encoder_streams(self) -> None:
+        """Finalize all users' encoder streams concurrently."""
+        if not self._user_encoder_streams:
+            return
+
+        user_ids = list(self._user_encoder_streams.keys())
         await self.services.logging_service.info(
-            f"Flushed window {chunk_idx} for user {user_id} in meeting {self.meeting_id} "
-            f"(PCM: {pcm_filename}, size: {len(window_data):,} bytes, duration: {window_duration_ms}ms, "
-            f"timestamp: {chunk_idx * DiscordRecorderConstants.WINDOW_MS}ms)"
+            f"Finalizing {len(user_ids)} streaming encoder(s) for meeting {self.meeting_id}"
         )
 
+        results = await asyncio.gather(
+            *(self._close_encoder_stream(user_id) for user_id in user_ids),
+            return_exceptions=True,
+        )
+        for user_id, result in zip(user_ids, results):
+            if isinstance(result, Exception):
+                await self.services.logging_service.error(
+                    f"Failed to finalize streaming encoder for user {user_id} "
+                    f"in meeting {self.meeting_id}: {result}"
+                )
+
     # -------------------------------------------------------------- #
     # File Operations
     # -------------------------------------------------------------- #
 
-    async def _write_pcm_to_temp(self, filename: str, data: bytes) -> str:
+    async def _write_pcm_to_temp(self, filename: str, data: bytes | memoryview) -> str:
         """
         Write PCM data to temporary storage.
 
@@ -1407,6 +1734,24 @@ class DiscordSessionHandler:
             all_ids.extend(user_ids)
         return all_ids
 
+    def get_user_durations_ms(self) -> dict[int, int]:
+        """
+        Get the duration of each user's recorded track, computed from PCM byte counts.
+
+        Every emitted window (audio, partial or backfilled silence) adds its PCM
+        to the user's track, so after stop this equals the duration of the user's
+        final track without probing the file.
+        """
+        return {
+            user_id: calculate_pcm_duration_ms(
+                byte_count,
+                sample_rate=DiscordRecorderConstants.DISCORD_SAMPLE_RATE,
+                bits_per_sample=DiscordRecorderConstants.DISCORD_BITS_PER_SAMPLE,
+                channels=DiscordRecorderConstants.DISCORD_CHANNELS,
+            )
+            for user_id, byte_count in self._user_emitted_pcm_bytes.items()
+        }
+
     def get_recorded_user_ids(self) -> list[int]:
         """
         Get list of Discord user IDs that have been recorded in this session.
@@ -1475,7 +1820,7 @@ class DiscordSessionHandler:
                 "per_user_stats": {
                     str(uid): {
                         "chunks": len(self._user_temp_recording_ids.get(uid, [])),
-                        "buffer_size_bytes": len(self._user_audio_buffers.get(uid, bytearray())),
+                        "buffer_size_bytes": len(self._user_audio_buffers.get(uid, ())),
                     }
                     for uid in self._user_audio_buffers
                 },
@@ -1506,7 +1851,7 @@ class DiscordSessionHandler:
 
             per_user_stats[str(user_id)] = {
                 "chunks": len(self._user_temp_recording_ids.get(user_id, [])),
-                "buffer_size_bytes": len(self._user_audio_buffers.get(user_id, bytearray())),
+                "buffer_size_bytes": len(self._user_audio_buffers.get(user_id, ())),
                 "transcode_status": {
                     "queued": user_status_counter.get(TranscodeStatus.QUEUED.value, 0),
                     "in_progress": user_status_counter.get(TranscodeStatus.IN_PROGRESS.value, 0),
@@ -1740,6 +2085,10 @@ class DiscordRecorderManagerService(BaseDiscordRecorderServiceManager):
 
         # Stop recording
         await session.stop_recording()
+        user_durations_ms = {
+            str(user_id): duration_ms
+            for user_id, duration_ms in session.get_user_durations_ms().items()
+        }
 
         # Update meeting participants with users who spoke during the meeting
         if self.services.sql_recording_service_manager and recorded_user_ids:
@@ -1796,6 +2145,7 @@ class DiscordRecorderManagerService(BaseDiscordRecorderServiceManager):
         task = asyncio.create_task(
             self._process_recordings_post_stop(
                 meeting_id=meeting_id,
+                user_durations_ms=user_durations_ms,
             )
         )
 
@@ -2113,6 +2463,7 @@ class DiscordRecorderManagerService(BaseDiscordRecorderServiceManager):
         user_id: int | str,
         recordings: list[dict],
         meeting_id: str,
+        duration_ms: int | None = None,
     ) -> str | None:
         """
         Process and concatenate all recordings for a specific user in a meeting.
@@ -2121,6 +2472,7 @@ class DiscordRecorderManagerService(BaseDiscordRecorderServiceManager):
             user_id: Discord user ID
             recordings: List of temp recording dictionaries for this user
             meeting_id: Meeting ID
+            duration_ms: Known duration of the user's track, saves probing the final file
 
         Returns:
             The recording_id of the created persistent recording, or None if failed
@@ -2137,6 +2489,14 @@ class DiscordRecorderManagerService(BaseDiscordRecorderServiceManager):
             mp3_files = []
             for rec in recordings:
                 filename = rec.get("filename")
+
+                # Silence markers have no file yet, render them now
+                if rec.get("silence_ms"):
+                    silence_path = await self._render_silence_marker(rec)
+                    if silence_path:
+                        mp3_files.append(silence_path)
+                    continue
+
                 if filename:
                     # SQL stores PCM filename, convert to MP3 filename
                     mp3_filename = filename.replace(".pcm", ".mp3")
@@ -2191,13 +2551,14 @@ class DiscordRecorderManagerService(BaseDiscordRecorderServiceManager):
                 return None
 
             # Insert persistent recording into SQL
-            # Note: We pass the full path so SHA256 and duration can be calculated,
-            # but insert_persistent_recording will extract just the filename for storage
+            # Note: We pass the full path so SHA256 (and duration, if unknown) can be
+            # calculated, but insert_persistent_recording will extract just the filename for storage
             recording_id = (
                 await self.services.sql_recording_service_manager.insert_persistent_recording(
                     user_id=user_id,
                     meeting_id=meeting_id,
                     filename=output_path,  # Full path for SHA256/duration, will extract basename
+                    duration_ms=duration_ms,
                 )
             )
 
@@ -2249,6 +2610,52 @@ class DiscordRecorderManagerService(BaseDiscordRecorderServiceManager):
             await self._send_concatenation_error_dm(meeting_id, user_id, str(e))
             return None
 
+    async def _render_silence_marker(self, recording: dict) -> str | None:
+        """
+        Render a silence marker temp recording to an MP3 in temp storage.
+
+        The MP3 is generated with FFmpeg's anullsrc in the same format as the
+        transcoded chunks, so it concatenates with them without re-encoding.
+        An already rendered file (e.g. from an earlier attempt) is reused.
+
+        Args:
+            recording: Temp recording dictionary with silence_ms set
+
+        Returns:
+            Path to the silent MP3, or None if rendering failed
+        """
+        mp3_filename = recording["filename"].replace(
+            DiscordRecorderConstants.SILENCE_MARKER_EXTENSION, ".mp3"
+        )
+        mp3_path = os.path.join(
+            self.services.recording_file_service_manager.get_temporary_storage_path(),
+            mp3_filename,
+        )
+
+        loop = asyncio.get_event_loop()
+        if await loop.run_in_executor(None, os.path.exists, mp3_path):
+            return mp3_path
+
+        success, _stdout, stderr = (
+            await self.services.ffmpeg_service_manager.handler.generate_silent_mp3(
+                output_path=mp3_path,
+                duration_ms=recording["silence_ms"],
+                bitrate=DiscordRecorderConstants.MP3_BITRATE,
+            )
+        )
+        if not success:
+            await self.services.logging_service.error(
+                f"Failed to render silence marker {recording.get('id')} "
+                f"({recording['silence_ms']}ms): {stderr}"
+            )
+            return None
+
+        await self.services.logging_service.debug(
+            f"Rendered silence marker {recording.get('id')} to {mp3_filename} "
+            f"({recording['silence_ms']}ms)"
+        )
+        return mp3_path
+
     async def _send_concatenation_error_dm(
         self, meeting_id: str, user_id: int | str, error_details: str
     ) -> None:
@@ -2297,12 +2704,15 @@ class DiscordRecorderManagerService(BaseDiscordRecorderServiceManager):
     async def _process_recordings_post_stop(
         self,
         meeting_id: str,
+        user_durations_ms: dict[str, int] | None = None,
     ) -> None:
         """
         Process recordings after stopping: concatenate files and create persistent recordings.
 
         Args:
             meeting_id: Meeting ID for the recording session
+            user_durations_ms: Track duration per user ID as known by the recorder;
+                users missing here have their final file probed instead
         """
         try:
             # Check if shutdown is in progress before starting
@@ -2356,25 +2766,42 @@ class DiscordRecorderManagerService(BaseDiscordRecorderServiceManager):
                 f"Grouped recordings by user: {len(user_recordings)} users with recordings"
             )
 
-            # Process each user's recordings and collect recording_ids
-            user_recording_mapping = {}
-            for rec_user_id, recordings in user_recordings.items():
-                # Check shutdown before each user processing
-                if self.context.is_shutting_down():
-                    await self.services.logging_service.warning(
-                        f"Shutdown detected, halting remaining user processing for meeting {meeting_id}"
+            # Process users' recordings concurrently (bounded) and collect recording_ids
+            semaphore = asyncio.Semaphore(max(1, DiscordRecorderConstants.POST_STOP_MAX_CONCURRENCY))
+
+            async def process_user(rec_user_id, recordings) -> str | None:
+                async with semaphore:
+                    # Check shutdown before each user processing
+                    if self.context.is_shutting_down():
+                        return None
+                    return await self._process_user_recordings(
+                        user_id=rec_user_id,
+                        recordings=recordings,
+                        meeting_id=meeting_id,
+                        duration_ms=(user_durations_ms or {}).get(str(rec_user_id)),
                     )
-                    return
 
-                recording_id = await self._process_user_recordings(
-                    user_id=rec_user_id,
-                    recordings=recordings,
-                    meeting_id=meeting_id,
+            user_ids = list(user_recordings.keys())
+            results = await asyncio.gather(
+                *(process_user(rec_user_id, user_recordings[rec_user_id]) for rec_user_id in user_ids),
+                return_exceptions=True,
+            )
+
+            if self.context.is_shutting_down():
+                await self.services.logging_service.warning(
+                    f"Shutdown detected, halting remaining user processing for meeting {meeting_id}"
                 )
+                return
 
-                # Track the recording_id for this user
-                if recording_id:
-                    user_recording_mapping[str(rec_user_id)] = recording_id
+            user_recording_mapping = {}
+            for rec_user_id, result in zip(user_ids, results):
+                if isinstance(result, Exception):
+                    await self.services.logging_service.error(
+                        f"Error processing recordings for user {rec_user_id} in meeting {meeting_id}: {result}"
+                    )
+                elif result:
+                    # Track the recording_id for this user
+                    user_recording_mapping[str(rec_user_id)] = result
 
             await self.services.logging_service.info(
                 f"Completed post-stop processing for meeting {meeting_id}"
@@ -2684,7 +3111,7 @@ class DiscordRecorderManagerService(BaseDiscordRecorderServiceManager):
         )
 
         # Delete files and SQL records
-        deleted_count = 0
+        cleaned_ids = []
         for record in old_recordings:
             temp_id = record["id"]
             # Note: The TempRecordingModel only stores filename, not full paths
@@ -2699,7 +3126,9 @@ class DiscordRecorderManagerService(BaseDiscordRecorderServiceManager):
 
                     # Construct PCM and MP3 paths
                     pcm_filename = filename
-                    mp3_filename = filename.replace(".pcm", ".mp3")
+                    mp3_filename = filename.replace(".pcm", ".mp3").replace(
+                        DiscordRecorderConstants.SILENCE_MARKER_EXTENSION, ".mp3"
+                    )
                     pcm_path = os.path.join(temp_path, pcm_filename)
                     mp3_path = os.path.join(temp_path, mp3_filename)
 
@@ -2713,7 +3142,7 @@ class DiscordRecorderManagerService(BaseDiscordRecorderServiceManager):
                     if os.path.exists(pcm_path):
                         await loop.run_in_executor(None, os.remove, pcm_path)
 
-                deleted_count += 1
+                cleaned_ids.append(temp_id)
 
                 await self.services.logging_service.debug(
                     f"Cleaned up temp recording files: {temp_id}"
@@ -2724,10 +3153,10 @@ class DiscordRecorderManagerService(BaseDiscordRecorderServiceManager):
                     f"Failed to clean up temp recording {temp_id}: {e}"
                 )
 
-        # Delete SQL records in batches
-        if deleted_count > 0:
-            temp_ids = [r["id"] for r in old_recordings[:deleted_count]]
-            await self._delete_temp_recordings_batch(temp_ids)
+        # Delete SQL records of the cleaned up files in batches (one statement per batch)
+        deleted_count = len(cleaned_ids)
+        if cleaned_ids:
+            await self._delete_temp_recordings_batch(cleaned_ids)
 
         await self.services.logging_service.info(
             f"Cleanup completed: {deleted_count} temp recordings removed"
@@ -4,6 +4,9 @@
 
 from abc import ABC, abstractmethod
 
+# Block size used when scanning PCM for silence (1s of Discord audio)
+SILENCE_SCAN_BLOCK_BYTES = 192_000
+
 # -------------------------------------------------------------- #
 # PCM Utility Functions
 # -------------------------------------------------------------- #
@@ -141,3 +144,24 @@ class SilentPCM(PCMGenerator):
             return bytes([0x80]) * nbytes
         # Signed PCM silence is 0x00
         return bytes(nbytes)
+
+    def is_silent(self, data: bytes | memoryview) -> bool:
+        """
+        Check whether PCM data is exactly this generator's silence.
+
+        Data is scanned one block at a time, so audio that isn't silent is
+        usually rejected after the first block.
+
+        Args:
+            data: PCM audio data (bytes or any bytes-like view)
+
+        Returns:
+            True if every byte is the silence value (empty data counts as silent)
+        """
+        silence_byte = 0x80 if self.bits_per_sample == 8 and self.unsigned_8bit else 0x00
+        view = memoryview(data).cast("B")
+        for start in range(0, len(view), SILENCE_SCAN_BLOCK_BYTES):
+            block = view[start : start + SILENCE_SCAN_BLOCK_BYTES].tobytes()
+            if block.count(silence_byte) != len(block):
+                return False
+        return True
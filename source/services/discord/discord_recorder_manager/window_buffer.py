@@ -0,0 +1,96 @@
+"""
+Per-user PCM buffer for the recorder's flush path.
+
+The flush cycle cuts each user's audio into fixed 30s windows. Doing that on
+a bytearray (copy the window out, then delete it from the front) copies every
+window twice and shifts the remaining audio each time. PCMWindowBuffer keeps
+the appended blocks as a list of immutable bytes objects instead and hands
+windows out as memoryviews: a window inside one block is a slice of it (no
+copy), a window spanning blocks is assembled with a single join. Consumed
+blocks are simply dropped, so nothing is ever shifted.
+"""
+
+from collections import deque
+
+
+class PCMWindowBuffer:
+    """FIFO of PCM bytes that hands out windows as memoryviews."""
+
+    def __init__(self):
+        self._blocks: deque[bytes] = deque()
+        self._offset = 0  # Read position inside the first block
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def extend(self, data) -> None:
+        """
+        Append PCM data.
+
+        Bytes are stored by reference; other bytes-like objects (which could be
+        mutated later) are copied once.
+
+        Args:
+            data: Bytes-like PCM data
+        """
+        if not data:
+            return
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        self._blocks.append(data)
+        self._size += len(data)
+
+    def take(self, num_bytes: int) -> memoryview:
+        """
+        Remove and return the oldest num_bytes bytes.
+
+        Args:
+            num_bytes: Number of bytes to take (at most len(self))
+
+        Returns:
+            Read-only view of the bytes, valid independently of the buffer
+        """
+        if num_bytes > self._size:
+            raise ValueError(f"Cannot take {num_bytes} bytes from a buffer of {self._size}")
+        if num_bytes <= 0:
+            return memoryview(b"")
+
+        self._size -= num_bytes
+        first = self._blocks[0]
+        end = self._offset + num_bytes
+
+        # Fast path: the window lies inside the first block
+        if end <= len(first):
+            view = memoryview(first)[self._offset : end]
+            self._advance(first, end)
+            return view
+
+        # Window spans blocks: join the pieces once
+        pieces = []
+        remaining = num_bytes
+        while remaining:
+            block = self._blocks[0]
+            end = min(len(block), self._offset + remaining)
+            pieces.append(memoryview(block)[self._offset : end])
+            remaining -= end - self._offset
+            self._advance(block, end)
+        return memoryview(b"".join(pieces))
+
+    def take_all(self) -> memoryview:
+        """Remove and return everything in the buffer."""
+        return self.take(self._size)
+
+    def clear(self) -> None:
+        """Drop all buffered data."""
+        self._blocks.clear()
+        self._offset = 0
+        self._size = 0
+
+    def _advance(self, block: bytes, end: int) -> None:
+        """Move the read position to end within the first block, dropping it when consumed."""
+        if end == len(block):
+            self._blocks.popleft()
+            self._offset = 0
+        else:
+            self._offset = end
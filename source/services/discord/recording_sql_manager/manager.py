@@ -21,10 +21,10 @@ from source.services.manager import Manager
 from source.utils import (
     DISCORD_USER_ID_MIN_LENGTH,
     MEETING_UUID_LENGTH,
-    calculate_audio_file_duration_ms,
     calculate_file_sha256,
     generate_16_char_uuid,
     get_current_timestamp_est,
+    probe_audio_file_duration_ms,
 )
 
 # -------------------------------------------------------------- #
@@ -56,7 +56,12 @@ class SQLRecordingManagerService(Manager):
     # -------------------------------------------------------------- #
 
     async def insert_temp_recording(
-        self, user_id: str, meeting_id: str, start_timestamp_ms: int, filename: str
+        self,
+        user_id: str,
+        meeting_id: str,
+        start_timestamp_ms: int,
+        filename: str,
+        silence_ms: int | None = None,
     ) -> str:
         """
         Insert a new temp recording chunk when PCM file is flushed.
@@ -64,52 +69,93 @@ class SQLRecordingManagerService(Manager):
         Args:
             user_id: Discord User ID of the participant
             meeting_id: Meeting ID (16 chars)
+            start_timestamp_ms: Position of the chunk in the meeting timeline
+            filename: Filename of the chunk in temp storage
+            silence_ms: If set, the chunk is a silence marker of this duration with
+                no audio file; it needs no transcode and is stored as done
 
         Returns:
             temp_recording_id: The generated ID for the temp recording
         """
+        entry_ids = await self.insert_temp_recordings(
+            [
+                {
+                    "user_id": user_id,
+                    "meeting_id": meeting_id,
+                    "start_timestamp_ms": start_timestamp_ms,
+                    "filename": filename,
+                    "silence_ms": silence_ms,
+                }
+            ]
+        )
+        return entry_ids[0]
 
-        # Validate inputs
-        if len(user_id) < DISCORD_USER_ID_MIN_LENGTH:
-            raise ValueError(
-                f"user_id must be at least {DISCORD_USER_ID_MIN_LENGTH} characters long"
-            )
-        if len(meeting_id) < MEETING_UUID_LENGTH:
-            raise ValueError(f"meeting_id must be at least {MEETING_UUID_LENGTH} characters long")
+    async def insert_temp_recordings(self, recordings: list[dict]) -> list[str]:
+        """
+        Insert several temp recording chunks with a single multi-row statement.
 
-        # entry data
-        entry_id = generate_16_char_uuid()
-        timestamp = get_current_timestamp_est()
+        The recorder stages the rows produced during a flush cycle and inserts
+        them together, so a cycle costs one round trip instead of one per window.
 
-        temp_recording = TempRecordingModel(
-            id=entry_id,
-            user_id=user_id,
-            meeting_id=meeting_id,
-            created_at=timestamp,
-            filename=filename,
-            timestamp_ms=start_timestamp_ms,
-            transcode_status=TranscodeStatus.QUEUED.value,
-        )
+        Args:
+            recordings: Chunks to insert, each a dict with the keyword arguments of
+                insert_temp_recording (user_id, meeting_id, start_timestamp_ms,
+                filename and optionally silence_ms)
 
-        # Convert to dict for insertion
-        temp_data = {
-            "id": temp_recording.id,
-            "user_id": temp_recording.user_id,
-            "meeting_id": temp_recording.meeting_id,
-            "created_at": temp_recording.created_at,
-            "filename": temp_recording.filename,
-            "timestamp_ms": temp_recording.timestamp_ms,
-            "transcode_status": temp_recording.transcode_status,
-        }
+        Returns:
+            The generated temp recording IDs, in the order of recordings
+        """
+        if not recordings:
+            return []
+
+        # Validate inputs before anything is written
+        for recording in recordings:
+            if len(recording["user_id"]) < DISCORD_USER_ID_MIN_LENGTH:
+                raise ValueError(
+                    f"user_id must be at least {DISCORD_USER_ID_MIN_LENGTH} characters long"
+                )
+            if len(recording["meeting_id"]) < MEETING_UUID_LENGTH:
+                raise ValueError(
+                    f"meeting_id must be at least {MEETING_UUID_LENGTH} characters long"
+                )
 
-        # Build and execute insert statement
-        stmt = insert(TempRecordingModel).values(**temp_data)
+        timestamp = get_current_timestamp_est()
+        rows = []
+        for recording in recordings:
+            silence_ms = recording.get("silence_ms")
+            rows.append(
+                {
+                    "id": generate_16_char_uuid(),
+                    "user_id": recording["user_id"],
+                    "meeting_id": recording["meeting_id"],
+                    "created_at": timestamp,
+                    "filename": recording["filename"],
+                    "timestamp_ms": recording["start_timestamp_ms"],
+                    "transcode_status": (
+                        TranscodeStatus.QUEUED.value
+                        if silence_ms is None
+                        else TranscodeStatus.DONE.value
+                    ),
+                    "silence_ms": silence_ms,
+                }
+            )
+
+        # Build and execute one multi-row insert statement
+        stmt = insert(TempRecordingModel).values(rows)
         await self.server.sql_client.execute(stmt)
-        await self.services.logging_service.info(
-            f"Inserted temp recording: {entry_id} for meeting {meeting_id}"
-        )
 
-        return entry_id
+        entry_ids = [row["id"] for row in rows]
+        meeting_ids = sorted({row["meeting_id"] for row in rows})
+        if len(entry_ids) == 1:
+            await self.services.logging_service.info(
+                f"Inserted temp recording: {entry_ids[0]} for meeting {meeting_ids[0]}"
+            )
+        else:
+            await self.services.logging_service.info(
+                f"Inserted {len(entry_ids)} temp recordings for meeting(s) {', '.join(meeting_ids)}"
+            )
+
+        return entry_ids
 
     async def delete_temp_recording(self, temp_recording_entry_id: str) -> None:
         """
@@ -192,6 +238,7 @@ class SQLRecordingManagerService(Manager):
         user_id: str,
         meeting_id: str,
         filename: str,
+        duration_ms: int | None = None,
     ) -> str:
         """
         Insert a new persistent recording chunk when PCM file is flushed.
@@ -200,6 +247,8 @@ class SQLRecordingManagerService(Manager):
             user_id: Discord User ID of the participant
             meeting_id: Meeting ID (16 chars)
             filename: Path to the recording file (can be full path or just filename)
+            duration_ms: Duration if already known (e.g. from the PCM byte count),
+                otherwise the file is probed with ffprobe
 
         Returns:
             recording_id: The generated ID for the persistent recording
@@ -219,7 +268,10 @@ class SQLRecordingManagerService(Manager):
 
         # Calculate SHA256 and duration from the file (needs full path)
         sha256 = await calculate_file_sha256(filename)
-        file_duration_ms = calculate_audio_file_duration_ms(filename)
+        if duration_ms is None:
+            file_duration_ms = await probe_audio_file_duration_ms(filename)
+        else:
+            file_duration_ms = duration_ms
 
         # Extract just the filename (not full path) for database storage
         import os
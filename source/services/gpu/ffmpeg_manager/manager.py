@@ -1,6 +1,6 @@
 import asyncio
 import os
-import subprocess
+from collections import deque
 from contextlib import suppress
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
@@ -14,6 +14,20 @@ from source.services.manager import BaseFFmpegServiceManager
 # FFmpeg Manager Service
 # -------------------------------------------------------------- #
 
+# Number of concurrent FFmpeg workers; 0 sizes the pool from the CPU count
+FFMPEG_MAX_WORKERS = int(os.getenv("FFMPEG_MAX_WORKERS", "0"))
+# Minimum number of queued jobs accepted before queue_* calls are rejected
+FFMPEG_QUEUE_SIZE = int(os.getenv("FFMPEG_QUEUE_SIZE", "10"))
+# Maximum run time of a single one-shot FFmpeg conversion
+FFMPEG_TIMEOUT_SECONDS = float(os.getenv("FFMPEG_TIMEOUT_SECONDS", "300"))
+
+
+def default_ffmpeg_worker_count() -> int:
+    """Size of the FFmpeg worker pool: FFMPEG_MAX_WORKERS, or one per CPU core."""
+    if FFMPEG_MAX_WORKERS > 0:
+        return FFMPEG_MAX_WORKERS
+    return max(1, os.cpu_count() or 1)
+
 
 @dataclass
 class FFJob:
@@ -29,6 +43,67 @@ class FFJob:
     meeting_id: str | None = None  # Meeting ID for tracking in jobs_status table
 
 
+class MeetingFairQueue:
+    """
+    Bounded job queue that serves meetings round-robin.
+
+    Jobs are FIFO within a meeting, but each get() moves on to the next meeting
+    with pending work, so a meeting that queues hundreds of chunks cannot hold
+    back another meeting's conversions. Jobs without a meeting_id share one
+    slot in the rotation. The interface mirrors the parts of asyncio.Queue the
+    FFmpeg workers use.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._pending: dict[str | None, deque[FFJob]] = {}
+        self._rotation: deque[str | None] = deque()  # Meetings with pending jobs
+        self._size = 0
+        self._items = asyncio.Semaphore(0)
+        self._slots = asyncio.Semaphore(maxsize)
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def full(self) -> bool:
+        return self._size >= self.maxsize
+
+    def pending_by_meeting(self) -> dict[str | None, int]:
+        """Number of queued jobs per meeting."""
+        return {meeting_id: len(jobs) for meeting_id, jobs in self._pending.items()}
+
+    async def put(self, job: FFJob) -> None:
+        """Enqueue a job, waiting for a free slot if the queue is full."""
+        await self._slots.acquire()
+        jobs = self._pending.get(job.meeting_id)
+        if jobs is None:
+            jobs = self._pending[job.meeting_id] = deque()
+            self._rotation.append(job.meeting_id)
+        jobs.append(job)
+        self._size += 1
+        self._items.release()
+
+    async def get(self) -> FFJob:
+        """Dequeue the next job, taking turns between meetings."""
+        await self._items.acquire()
+        meeting_id = self._rotation.popleft()
+        jobs = self._pending[meeting_id]
+        job = jobs.popleft()
+        if jobs:
+            self._rotation.append(meeting_id)
+        else:
+            del self._pending[meeting_id]
+        self._size -= 1
+        self._slots.release()
+        return job
+
+    def task_done(self) -> None:
+        """Kept for asyncio.Queue compatibility; slots are freed on get()."""
+
+
 class FFmpegHandler:
     def __init__(self, ffmpeg_service_manager: BaseFFmpegServiceManager, ffmpeg_path: str):
         self.ffmpeg_service_manager = ffmpeg_service_manager
@@ -41,24 +116,59 @@ class FFmpegHandler:
     async def validate_ffmpeg(self) -> bool:
         """Validate that FFmpeg is installed and accessible."""
         try:
-            loop = asyncio.get_event_loop()
-            result = await asyncio.wait_for(
-                loop.run_in_executor(
-                    None,
-                    lambda: subprocess.run(
-                        [self.ffmpeg_path, "-version"],
-                        capture_output=True,
-                        timeout=5,
-                        text=True,
-                    ),
-                ),
-                timeout=6.0,  # Slightly longer than subprocess timeout
-            )
-            is_valid = result.returncode == 0
+            is_valid, _, _ = await self._run_ffmpeg([self.ffmpeg_path, "-version"], timeout=5)
             return is_valid
-        except (FileNotFoundError, subprocess.TimeoutExpired, asyncio.TimeoutError, Exception):
+        except Exception:
             return False
 
+    async def _run_ffmpeg(
+        self, cmd: list[str], timeout: float = FFMPEG_TIMEOUT_SECONDS
+    ) -> tuple[bool, str, str]:
+        """
+        Run an FFmpeg command to completion as an asyncio subprocess.
+
+        The process is awaited on the event loop rather than in the default
+        executor, so conversions never hold thread-pool threads. On timeout or
+        cancellation the process is killed and reaped before returning.
+
+        Args:
+            cmd: Full command line, starting with the FFmpeg executable
+            timeout: Maximum run time in seconds
+
+        Returns:
+            Tuple of (success: bool, stdout: str, stderr: str)
+
+        Raises:
+            asyncio.CancelledError: If the calling task is cancelled (after killing FFmpeg)
+        """
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            await self._kill_process(process)
+            return False, "", "FFmpeg process timed out"
+        except asyncio.CancelledError:
+            await self._kill_process(process)
+            raise
+
+        return (
+            process.returncode == 0,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
+
+    @staticmethod
+    async def _kill_process(process: asyncio.subprocess.Process) -> None:
+        """Kill an FFmpeg process and wait for it to exit."""
+        with suppress(ProcessLookupError):
+            process.kill()
+        await process.wait()
+
     # -------------------------------------------------------------- #
     # Media Conversion Methods
     # -------------------------------------------------------------- #
@@ -90,25 +200,7 @@ class FFmpegHandler:
             # Add output path
             cmd.append(output_path)
 
-            # Run FFmpeg process in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            result = await asyncio.wait_for(
-                loop.run_in_executor(
-                    None,
-                    lambda: subprocess.run(
-                        cmd,
-                        capture_output=True,
-                        timeout=300,  # 5 minute timeout
-                        text=True,
-                    ),
-                ),
-                timeout=310.0,  # Slightly longer than subprocess timeout
-            )
-
-            success = result.returncode == 0
-            return success, result.stdout, result.stderr
-        except (subprocess.TimeoutExpired, asyncio.TimeoutError):
-            return False, "", "FFmpeg process timed out"
+            return await self._run_ffmpeg(cmd)
         except Exception as e:
             return False, "", str(e)
 
@@ -147,159 +239,282 @@ class FFmpegHandler:
                 output_path,
             ]
 
-            # Run FFmpeg process in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            result = await asyncio.wait_for(
-                loop.run_in_executor(
-                    None,
-                    lambda: subprocess.run(
-                        cmd,
-                        capture_output=True,
-                        timeout=300,  # 5 minute timeout
-                        text=True,
-                    ),
-                ),
-                timeout=310.0,  # Slightly longer than subprocess timeout
-            )
+            return await self._run_ffmpeg(cmd)
+        except Exception as e:
+            return False, "", str(e)
 
-            success = result.returncode == 0
-            return success, result.stdout, result.stderr
-        except (subprocess.TimeoutExpired, asyncio.TimeoutError):
-            return False, "", "FFmpeg process timed out"
+    async def generate_silent_mp3(
+        self, output_path: str, duration_ms: int, bitrate: str = "128k"
+    ) -> tuple[bool, str, str]:
+        """
+        Generate a silent MP3 with FFmpeg's anullsrc source.
+
+        The output uses the same format as converted Discord PCM (48kHz stereo),
+        so it can be concatenated with transcoded chunks without re-encoding.
+
+        Args:
+            output_path: Path to the output MP3 file
+            duration_ms: Duration of silence in milliseconds
+            bitrate: MP3 bitrate (default: 128k)
+
+        Returns:
+            Tuple of (success: bool, stdout: str, stderr: str)
+        """
+        try:
+            cmd = [
+                self.ffmpeg_path,
+                "-f",
+                "lavfi",  # Input is a filter graph, no file
+                "-i",
+                "anullsrc=r=48000:cl=stereo",  # Silence at Discord's rate and layout
+                "-t",
+                f"{duration_ms / 1000:.3f}",  # Duration in seconds
+                "-codec:a",
+                "libmp3lame",  # MP3 encoder
+                "-b:a",
+                bitrate,  # Output bitrate
+                "-y",  # Overwrite output file
+                output_path,
+            ]
+
+            return await self._run_ffmpeg(cmd)
         except Exception as e:
             return False, "", str(e)
 
-    def create_ffmpeg_stream_process(self) -> "FFmpegConversionStream":
-        return FFmpegConversionStream(self)
+    def create_ffmpeg_stream_process(
+        self, output_file: str, input_options: dict | None = None
+    ) -> "FFmpegConversionStream":
+        """Create a new FFmpeg conversion stream reading from stdin."""
+        return FFmpegConversionStream(
+            self, self.ffmpeg_service_manager, output_file=output_file, input_options=input_options
+        )
 
     def create_pcm_to_mp3_stream_process(self, output_file: str) -> "FFmpegConversionStream":
         """Create a new FFmpeg conversion stream for PCM to MP3 conversion."""
-        return FFmpegConversionStream(self, self.ffmpeg_service_manager, output_file=output_file)
+        # Raw PCM carries no header, so the input format MUST be declared before -i
+        return self.create_ffmpeg_stream_process(
+            output_file,
+            input_options={
+                "-f": "s16le",  # Input format: signed 16-bit little-endian PCM
+                "-ar": "48000",  # Input sample rate: 48kHz (Discord's native rate)
+                "-ac": "2",  # Input channels: stereo
+            },
+        )
 
 
 class FFmpegConversionStream:
+    """
+    Long-lived FFmpeg process fed through stdin.
+
+    Data pushed to the stream is encoded incrementally into output_file, so a
+    caller producing audio over time needs a single process and no intermediate
+    files. Closing stdin (EOF) lets FFmpeg finalize the output.
+    """
+
+    # Amount of FFmpeg stderr kept for diagnostics
+    STDERR_TAIL_BYTES = 8192
+
+    # Pushed data is written and drained in blocks of this size, so when FFmpeg dies
+    # mid-push bytes_processed tells how much of the data it was handed. 320ms of
+    # 48kHz stereo s16 PCM, so blocks end on whole milliseconds of recorder audio
+    WRITE_BLOCK_BYTES = 61_440
+
     def __init__(
         self,
         ffmpeg_handler: FFmpegHandler,
         ffmpeg_service_manager: BaseFFmpegServiceManager,
         output_file: str,
+        input_options: dict | None = None,
     ):
         self.ffmpeg_handler = ffmpeg_handler
         self.ffmpeg_service_manager = ffmpeg_service_manager
         self.output_file = output_file
+        self.input_options = input_options or {}
+
+        # Job tracking (set by FFmpegManagerService when tracked in jobs_status)
+        self.job_id: str | None = None
+        self.meeting_id: str | None = None
 
-        self.subprocess = None
+        self.subprocess: asyncio.subprocess.Process | None = None
         self._is_running = False
         self._bytes_processed = 0
+        self._write_lock = asyncio.Lock()
+        self._stderr_task: asyncio.Task | None = None
+        self._stderr_tail = bytearray()
+        self._holds_file_lock = False
 
     # -------------------------------------------------------------- #
     # Streaming Methods
     # -------------------------------------------------------------- #
 
-    def start_stream(self, options: dict) -> bool:
+    @staticmethod
+    def _options_to_args(options: dict) -> list[str]:
+        """Flatten an options dictionary into FFmpeg command-line arguments."""
+        args = []
+        for key, value in options.items():
+            args.append(key)
+            if value is not None:
+                args.append(str(value))
+        return args
+
+    async def start_stream(self, options: dict) -> bool:
         """
         Start a streaming FFmpeg process.
 
         Args:
-            input_path: Path to the input file or stream
-            output_path: Path to the output file or stream (can be - for stdout)
-            options: Dictionary of FFmpeg options
+            options: Dictionary of FFmpeg output options
 
         Returns:
             True if stream started successfully, False otherwise
         """
+        file_service_manager = self.ffmpeg_service_manager.services.file_service_manager
 
-        # Use File Manager to lock output file
-        self.ffmpeg_handler.ffmpeg_service_manager.services.file_service_manager._acquire_file_lock_oneshot(
-            self.output_file
-        )
+        # Use File Manager to lock output file for the lifetime of the stream
+        await file_service_manager.ensure_parent_dir(self.output_file)
+        await file_service_manager._acquire_file_lock_oneshot(self.output_file)
+        self._holds_file_lock = True
 
         try:
             # Build FFmpeg command for streaming from STDIN
-            cmd = [self.ffmpeg_handler.ffmpeg_path, "-i", "-"]
-
-            # Add options from the dictionary
-            for key, value in options.items():
-                cmd.append(key)
-                if value is not None:
-                    cmd.append(str(value))
+            # Keep stderr quiet so a long-running stream doesn't fill the pipe with progress
+            cmd = [
+                self.ffmpeg_handler.ffmpeg_path,
+                "-hide_banner",
+                "-nostats",
+                "-loglevel",
+                "error",
+                *self._options_to_args(self.input_options),
+                "-i",
+                "-",
+                *self._options_to_args(options),
+                self.output_file,
+            ]
 
-            # Add output path
-            cmd.append(self.output_file)
-
-            # Start the subprocess with pipes for stdin/stdout/stderr
-            self.subprocess = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                bufsize=0,  # Unbuffered
+            self.subprocess = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
             )
+            self._stderr_task = asyncio.create_task(self._drain_stderr())
             self._is_running = True
             return True
         except Exception:
             self._is_running = False
+            await self._release_file_lock()
             return False
 
-    async def close_stream(self) -> None:
-        """Close the streaming FFmpeg process gracefully."""
-        if self.subprocess and self._is_running:
+    async def push_to_stream(self, data: bytes | memoryview) -> bool:
+        """
+        Push data to the FFmpeg input stream.
+
+        Waits for the pipe to drain, so a slow encoder applies backpressure
+        instead of buffering unbounded data in memory. Data is written in
+        WRITE_BLOCK_BYTES blocks and bytes_processed grows with each drained
+        block, so after a failed push it tells how much of `data` FFmpeg took.
+
+        Args:
+            data: Bytes to write to the FFmpeg stdin
+
+        Returns:
+            True if all of the data was written, False if the stream is not running
+            or stopped part way through
+        """
+        async with self._write_lock:
+            if not (self.subprocess and self._is_running and self.subprocess.stdin):
+                return False
+            view = memoryview(data)
             try:
-                # Send QUIT command to FFmpeg
-                if self.subprocess.stdin:
-                    self.subprocess.stdin.write(b"q")
-                    self.subprocess.stdin.flush()
+                for offset in range(0, len(view), self.WRITE_BLOCK_BYTES):
+                    block = view[offset : offset + self.WRITE_BLOCK_BYTES]
+                    self.subprocess.stdin.write(block)
+                    await self.subprocess.stdin.drain()
+                    # Track processed bytes
+                    self._bytes_processed += len(block)
+                return True
+            except (BrokenPipeError, ConnectionResetError):
+                self._is_running = False
+                return False
 
-                # Wait for process to terminate (with timeout) - NON-BLOCKING
-                try:
-                    loop = asyncio.get_event_loop()
-                    stdout_data, stderr_data = await asyncio.wait_for(
-                        loop.run_in_executor(None, self.subprocess.communicate), timeout=5.0
-                    )
+    @property
+    def bytes_processed(self) -> int:
+        """Total bytes handed to FFmpeg through push_to_stream()."""
+        return self._bytes_processed
 
-                    # Log captured stdout and stderr when process exits
-                    if stdout_data:
-                        await self.ffmpeg_handler.ffmpeg_service_manager.services.logging_service.info(
-                            f"FFmpeg STDOUT:\n{stdout_data.decode('utf-8', errors='replace')}"
-                        )
-                    if stderr_data:
-                        await self.ffmpeg_handler.ffmpeg_service_manager.services.logging_service.info(
-                            f"FFmpeg STDERR:\n{stderr_data.decode('utf-8', errors='replace')}"
-                        )
-                except asyncio.TimeoutError:
-                    # Force kill if timeout expires
-                    if self.subprocess.poll() is None:
-                        self.subprocess.kill()
-                        loop = asyncio.get_event_loop()
-                        stdout_data, stderr_data = await loop.run_in_executor(
-                            None, self.subprocess.communicate
-                        )
+    async def close_stream(self, timeout: float = 30.0) -> bool:
+        """
+        Close the streaming FFmpeg process gracefully.
 
-                        # Log captured stdout and stderr from killed process
-                        if stdout_data:
-                            await self.ffmpeg_handler.ffmpeg_service_manager.services.logging_service.info(
-                                f"FFmpeg STDOUT (killed):\n{stdout_data.decode('utf-8', errors='replace')}"
-                            )
-                        if stderr_data:
-                            await self.ffmpeg_handler.ffmpeg_service_manager.services.logging_service.error(
-                                f"FFmpeg STDERR (killed):\n{stderr_data.decode('utf-8', errors='replace')}"
-                            )
+        Args:
+            timeout: Seconds to wait for FFmpeg to finalize before killing it
+
+        Returns:
+            True if FFmpeg exited cleanly, False otherwise
+        """
+        if self.subprocess is None:
+            await self._release_file_lock()
+            return False
 
-            except BrokenPipeError:
-                # Force kill if pipe breaks
-                if self.subprocess.poll() is None:
-                    self.subprocess.kill()
-                    loop = asyncio.get_event_loop()
-                    await loop.run_in_executor(None, self.subprocess.wait)
-            finally:
+        process = self.subprocess
+        logging_service = self.ffmpeg_service_manager.services.logging_service
+        try:
+            async with self._write_lock:
                 self._is_running = False
-                self.subprocess = None
+                # EOF on stdin tells FFmpeg to flush the encoder and write trailers
+                if process.stdin and not process.stdin.is_closing():
+                    process.stdin.close()
+                    with suppress(BrokenPipeError, ConnectionResetError):
+                        await process.stdin.wait_closed()
 
-                # Release file lock
-                self.ffmpeg_handler.ffmpeg_service_manager.services.file_service_manager._release_file_lock_oneshot(
-                    self.output_file
+            try:
+                await asyncio.wait_for(process.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                # Force kill if timeout expires
+                with suppress(ProcessLookupError):
+                    process.kill()
+                await process.wait()
+                await logging_service.error(
+                    f"FFmpeg stream for {self.output_file} did not finish within {timeout}s, killed"
                 )
 
+            if self._stderr_task:
+                with suppress(asyncio.CancelledError):
+                    await self._stderr_task
+
+            # Log captured stderr when process exits
+            if self._stderr_tail:
+                stderr_text = self._stderr_tail.decode("utf-8", errors="replace")
+                if process.returncode == 0:
+                    await logging_service.debug(f"FFmpeg STDERR:\n{stderr_text}")
+                else:
+                    await logging_service.error(f"FFmpeg STDERR:\n{stderr_text}")
+
+            return process.returncode == 0
+        finally:
+            self.subprocess = None
+            self._stderr_task = None
+            await self._release_file_lock()
+
+    async def _drain_stderr(self) -> None:
+        """Continuously read stderr, keeping only the tail for diagnostics."""
+        if not self.subprocess or not self.subprocess.stderr:
+            return
+        while True:
+            chunk = await self.subprocess.stderr.read(4096)
+            if not chunk:
+                break
+            self._stderr_tail.extend(chunk)
+            if len(self._stderr_tail) > self.STDERR_TAIL_BYTES:
+                del self._stderr_tail[: -self.STDERR_TAIL_BYTES]
+
+    async def _release_file_lock(self) -> None:
+        """Release the output file lock if this stream holds it."""
+        if self._holds_file_lock:
+            self._holds_file_lock = False
+            await self.ffmpeg_service_manager.services.file_service_manager._release_file_lock_oneshot(
+                self.output_file
+            )
+
     def get_stream_status(self) -> dict:
         """
         Get the current status of the FFmpeg stream.
@@ -315,35 +530,19 @@ class FFmpegConversionStream:
                 "bytes_processed": self._bytes_processed,
             }
 
-        returncode = self.subprocess.poll()
+        returncode = self.subprocess.returncode
         return {
             "running": self._is_running and returncode is None,
-            "pid": self.subprocess.pid if self.subprocess else None,
+            "pid": self.subprocess.pid,
             "returncode": returncode,
             "bytes_processed": self._bytes_processed,
         }
 
-    def push_to_stream(self, data: bytes) -> None:
-        """
-        Push data to the FFmpeg input stream.
-
-        Args:
-            data: Bytes to write to the FFmpeg stdin
-        """
-        if self.subprocess and self._is_running and self.subprocess.stdin:
-            try:
-                self.subprocess.stdin.write(data)
-                self.subprocess.stdin.flush()
-                # Track processed bytes
-                self._bytes_processed += len(data)
-            except (BrokenPipeError, Exception):
-                self._is_running = False
-
 
 class FFmpegManagerService(BaseFFmpegServiceManager):
     """Service for managing FFmpeg operations."""
 
-    def __init__(self, context: "Context", ffmpeg_path: str):
+    def __init__(self, context: "Context", ffmpeg_path: str, max_workers: int | None = None):
         super().__init__(context)
 
         self.ffmpeg_path = ffmpeg_path
@@ -351,8 +550,9 @@ class FFmpegManagerService(BaseFFmpegServiceManager):
 
         self.ffmpeg_path = os.getenv("FFMPEG_PATH", "ffmpeg")
 
-        self._jobs: asyncio.Queue[FFJob] | None = None
-        self._worker_task: asyncio.Task | None = None
+        self.max_workers = max_workers or default_ffmpeg_worker_count()
+        self._jobs: MeetingFairQueue | None = None
+        self._worker_tasks: list[asyncio.Task] = []
         self._shutdown_requested: bool = False
 
     # -------------------------------------------------------------- #
@@ -365,7 +565,7 @@ class FFmpegManagerService(BaseFFmpegServiceManager):
 
         # Initialize the job queue (needs to be done within an async context)
         if self._jobs is None:
-            self._jobs = asyncio.Queue(maxsize=10)
+            self._jobs = self._create_job_queue()
 
         # Validate FFmpeg installation
         if await self.handler.validate_ffmpeg():
@@ -377,32 +577,51 @@ class FFmpegManagerService(BaseFFmpegServiceManager):
                 f"FFmpeg validation failed at path: {self.ffmpeg_path}"
             )
 
-        # Start the background worker task
-        if not self._worker_task:
-            self._worker_task = asyncio.create_task(self._worker())
-            await self.services.logging_service.info("FFmpeg worker task started")
+        # Start the background worker pool
+        if self._ensure_workers():
+            await self.services.logging_service.info(
+                f"FFmpeg worker pool started ({self.max_workers} workers)"
+            )
 
         return True
 
     async def on_close(self):
         """
-        Gracefully shutdown FFmpeg worker.
+        Gracefully shutdown the FFmpeg worker pool.
 
-        Sets shutdown flag to prevent new jobs, then waits for current job to complete.
+        Sets shutdown flag to prevent new jobs, then stops every worker.
         """
         self._shutdown_requested = True
 
-        # Wait for the worker task to complete (will finish current job)
-        if self._worker_task and not self._worker_task.done():
+        running = [task for task in self._worker_tasks if not task.done()]
+        if running:
             await self.services.logging_service.info(
-                "Waiting for FFmpeg worker to finish current job..."
+                f"Stopping {len(running)} FFmpeg worker(s)..."
             )
-            self._worker_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await self._worker_task
-            await self.services.logging_service.info("FFmpeg worker task stopped")
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            await self.services.logging_service.info("FFmpeg worker tasks stopped")
+        self._worker_tasks = []
         return True
 
+    def _create_job_queue(self) -> MeetingFairQueue:
+        """Create the job queue, with room for at least two jobs per worker."""
+        return MeetingFairQueue(maxsize=max(FFMPEG_QUEUE_SIZE, 2 * self.max_workers))
+
+    def _ensure_workers(self) -> bool:
+        """
+        Start (or restart) workers until the pool has max_workers running tasks.
+
+        Returns:
+            True if any worker was started
+        """
+        self._worker_tasks = [task for task in self._worker_tasks if not task.done()]
+        missing = self.max_workers - len(self._worker_tasks)
+        for _ in range(missing):
+            self._worker_tasks.append(asyncio.create_task(self._worker()))
+        return missing > 0
+
     async def _worker(self):
         """Background worker that processes FFmpeg jobs from the queue."""
         while True:
@@ -547,8 +766,113 @@ class FFmpegManagerService(BaseFFmpegServiceManager):
         """Get the FFmpeg executable path."""
         return self.ffmpeg_path
 
-    async def create_pcm_to_mp3_stream_handler(self):
-        return self.handler.create_pcm_to_mp3_stream_process()
+    async def create_pcm_to_mp3_stream_handler(
+        self,
+        output_path: str,
+        bitrate: str = "128k",
+        job_id: str | None = None,
+        meeting_id: str | None = None,
+    ) -> FFmpegConversionStream | None:
+        """
+        Start a long-lived PCM to MP3 encoder that is fed through push_to_stream().
+
+        Unlike queue_pcm_to_mp3, the stream does not go through the job queue: the
+        process runs for as long as the caller keeps producing audio and must be
+        finished with finish_pcm_to_mp3_stream().
+
+        Args:
+            output_path: Path to the output MP3 file
+            bitrate: MP3 bitrate (default: 128k)
+            job_id: Optional 16-character job ID for tracking in jobs_status table
+            meeting_id: Optional 16-character meeting ID for tracking in jobs_status table
+
+        Returns:
+            The running stream, or None if FFmpeg could not be started
+        """
+        stream = self.handler.create_pcm_to_mp3_stream_process(output_path)
+        stream.job_id = job_id
+        stream.meeting_id = meeting_id
+
+        started = await stream.start_stream(
+            {
+                "-codec:a": "libmp3lame",  # MP3 encoder
+                "-b:a": bitrate,  # Output bitrate
+                "-y": None,  # Overwrite output file
+            }
+        )
+        if not started:
+            await self.services.logging_service.error(
+                f"Failed to start PCM to MP3 stream for {output_path}"
+            )
+            return None
+
+        await self.services.logging_service.info(
+            f"Started PCM to MP3 stream: {output_path} (pid: {stream.get_stream_status()['pid']})"
+        )
+
+        # Log job start in jobs_status table if job tracking is enabled
+        if job_id and meeting_id and self.services.sql_logging_service_manager:
+            from source.server.sql_models import JobsStatus, JobsType
+            from source.utils import get_current_timestamp_est
+
+            try:
+                await self.services.sql_logging_service_manager.log_job_status_event(
+                    job_type=JobsType.TEMP_TRANSCODING,
+                    job_id=job_id,
+                    meeting_id=meeting_id,
+                    created_at=get_current_timestamp_est(),
+                    status=JobsStatus.IN_PROGRESS,
+                    started_at=get_current_timestamp_est(),
+                )
+            except Exception as e:
+                await self.services.logging_service.error(
+                    f"Failed to log temp transcoding stream start status: {str(e)}"
+                )
+
+        return stream
+
+    async def finish_pcm_to_mp3_stream(self, stream: FFmpegConversionStream) -> bool:
+        """
+        Close a stream created by create_pcm_to_mp3_stream_handler and wait for the MP3.
+
+        Args:
+            stream: The stream to finish
+
+        Returns:
+            True if the MP3 was finalized successfully, False otherwise
+        """
+        bytes_processed = stream.get_stream_status()["bytes_processed"]
+        ok = await stream.close_stream()
+
+        if ok:
+            await self.services.logging_service.info(
+                f"PCM to MP3 stream completed: {stream.output_file} ({bytes_processed:,} PCM bytes)"
+            )
+        else:
+            await self.services.logging_service.error(
+                f"PCM to MP3 stream failed for {stream.output_file}"
+            )
+
+        # Log job completion in jobs_status table if job tracking is enabled
+        if stream.job_id and stream.meeting_id and self.services.sql_logging_service_manager:
+            from source.server.sql_models import JobsStatus, JobsType
+            from source.utils import get_current_timestamp_est
+
+            try:
+                await self.services.sql_logging_service_manager.log_job_status_event(
+                    job_type=JobsType.TEMP_TRANSCODING,
+                    job_id=stream.job_id,
+                    meeting_id=stream.meeting_id,
+                    created_at=get_current_timestamp_est(),
+                    status=JobsStatus.COMPLETED if ok else JobsStatus.FAILED,
+                    finished_at=get_current_timestamp_est(),
+                )
+            except Exception as e:
+                await self.services.logging_service.error(
+                    f"Failed to log temp transcoding stream completion status: {str(e)}"
+                )
+
+        return ok
 
     async def queue_pcm_to_mp3(
         self,
@@ -578,13 +902,12 @@ class FFmpegManagerService(BaseFFmpegServiceManager):
         )
 
         if self._jobs is None:
-            self._jobs = asyncio.Queue(maxsize=10)
+            self._jobs = self._create_job_queue()
             await self.services.logging_service.info("Initialized FFmpeg job queue")
 
-        # Start the worker task if not already running
-        if not self._worker_task or self._worker_task.done():
-            self._worker_task = asyncio.create_task(self._worker())
-            await self.services.logging_service.info("Started FFmpeg worker task")
+        # Start the worker pool if not already running
+        if self._ensure_workers():
+            await self.services.logging_service.info("Started FFmpeg worker tasks")
 
         if self._jobs.full():
             await self.services.logging_service.warning("FFmpeg job queue full")
@@ -655,7 +978,6 @@ class FFmpegManagerService(BaseFFmpegServiceManager):
         Args:
             input_path: Path to the input MP3 file
             output_path: Path to the output file
-            options: Dictionary of FFmpeg options
 
         Returns:
             True if conversion was successful, False otherwise
@@ -665,13 +987,12 @@ class FFmpegManagerService(BaseFFmpegServiceManager):
         )
 
         if self._jobs is None:
-            self._jobs = asyncio.Queue(maxsize=10)
+            self._jobs = self._create_job_queue()
             await self.services.logging_service.info("Initialized FFmpeg job queue")
 
-        # Start the worker task if not already running
-        if not self._worker_task or self._worker_task.done():
-            self._worker_task = asyncio.create_task(self._worker())
-            await self.services.logging_service.info("Started FFmpeg worker task")
+        # Start the worker pool if not already running
+        if self._ensure_workers():
+            await self.services.logging_service.info("Started FFmpeg worker tasks")
 
         if self._jobs.full():
             await self.services.logging_service.warning("FFmpeg job queue full")
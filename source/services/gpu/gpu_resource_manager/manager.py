@@ -19,6 +19,13 @@ acquire exclusive GPU access with intelligent priority handling:
    - Only one operation can hold GPU lock at a time
    - Async lock/unlock pattern
    - Automatic priority-based queue management
+   - Scheduler wakes on lock requests and releases (no polling), so handoffs are immediate
+
+3. Resident models:
+   - Models kept loaded between jobs (e.g. the shared embedding model) register themselves
+     with the job types that use them
+   - When any other job type acquires the lock they are offloaded first, so their VRAM
+     goes to the job that now holds the GPU
 
 Usage:
     # In any job that needs GPU:
@@ -32,6 +39,7 @@ from __future__ import annotations
 import asyncio
 import enum
 import random
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -94,6 +102,21 @@ class GPUResourceManager(Manager):
         self._scheduler_running = False
         self._scheduler_task: asyncio.Task | None = None
 
+        # Scheduler wakeup: set on every lock request and release
+        self._scheduler_wakeup = asyncio.Event()
+
+        # Request that has been granted but whose waiter has not yet taken the lock.
+        # The GPU counts as busy until then so a second request can't be granted early.
+        self._granted_request: asyncio.Event | None = None
+
+        # Requests whose waiters were cancelled before being granted
+        self._abandoned_requests: set[asyncio.Event] = set()
+
+        # Models kept loaded between jobs: (name, job types using them, offload callback)
+        self._resident_models: list[
+            tuple[str, set[GPUJobType], Callable[[], Awaitable[None]]]
+        ] = []
+
         # Scheduling parameters
         self.MAX_CONSECUTIVE_TRANSCRIPTION = 2
         self.MAX_CONSECUTIVE_TEXT_EMBEDDING = 2  # Updated to 2
@@ -167,6 +190,45 @@ class GPUResourceManager(Manager):
 
         return _GPULockContext(self, job_type, job_id, metadata or {})
 
+    def register_resident_model(
+        self,
+        name: str,
+        job_types: list[str | GPUJobType],
+        offload: Callable[[], Awaitable[None]],
+    ) -> None:
+        """
+        Register a model that stays loaded on the GPU between the jobs using it.
+
+        Whenever a job of any other type acquires the lock, `offload` is awaited
+        before that job starts, so the model doesn't hold VRAM the job needs.
+
+        Args:
+            name: Model name for logging
+            job_types: GPU job types that use the model (it stays loaded for these)
+            offload: Coroutine function that offloads the model if nobody is using it
+        """
+        types = {GPUJobType(t.lower()) if isinstance(t, str) else t for t in job_types}
+        self._resident_models.append((name, types, offload))
+
+    async def _offload_resident_models(self, job_type: GPUJobType) -> None:
+        """
+        Offload the resident models that the job type acquiring the lock doesn't use.
+
+        Args:
+            job_type: Type of job that now holds the GPU lock
+        """
+        for name, job_types, offload in self._resident_models:
+            if job_type in job_types:
+                continue
+            try:
+                await offload()
+            except Exception as e:
+                if self.services:
+                    await self.services.logging_service.error(
+                        f"Failed to offload resident {name} for {job_type.value} job: "
+                        f"{type(e).__name__}: {str(e)}"
+                    )
+
     async def _request_lock(self, job_type: GPUJobType, job_id: str, metadata: dict) -> None:
         """
         Request GPU lock and wait until it's granted.
@@ -193,15 +255,30 @@ class GPUResourceManager(Manager):
         elif job_type == GPUJobType.MISC_CHAT_JOB:
             await self._misc_chat_queue.put(ready_event)
 
+        # Wake the scheduler so an idle GPU is handed over immediately
+        self._scheduler_wakeup.set()
+
         if self.services:
             await self.services.logging_service.info(
                 f"GPU lock requested by {job_type.value} job {job_id}"
             )
 
         # Wait for the scheduler to grant access
-        await ready_event.wait()
+        try:
+            await ready_event.wait()
+        except asyncio.CancelledError:
+            if ready_event.is_set():
+                # Granted but never taken: hand the grant back to the scheduler
+                if self._granted_request is ready_event:
+                    self._granted_request = None
+                self._scheduler_wakeup.set()
+            else:
+                # Still queued: the scheduler will skip it
+                self._abandoned_requests.add(ready_event)
+            raise
 
         # Now acquire the actual lock (this is just bookkeeping, not blocking)
+        self._granted_request = None
         self._gpu_lock.acquire(job_id=job_id, job_type=job_type.value, metadata=metadata)
 
         # Update statistics
@@ -236,6 +313,9 @@ class GPUResourceManager(Manager):
         # Update consecutive counts
         self._update_stats(job_type)
 
+        # Wake the scheduler to hand the GPU to the next waiter
+        self._scheduler_wakeup.set()
+
         if self.services:
             await self.services.logging_service.info(
                 f"GPU lock released by {job_type.value} job {job_id}"
@@ -340,77 +420,42 @@ class GPUResourceManager(Manager):
         """
         while self._scheduler_running:
             try:
-                # Wait a bit for the current lock holder to finish
-                await asyncio.sleep(0.5)
+                # Sleep until a lock is requested or released
+                await self._scheduler_wakeup.wait()
+                self._scheduler_wakeup.clear()
 
-                # Only schedule next if GPU is not currently locked
-                if self._gpu_lock.is_locked():
+                # Only schedule next if GPU is not currently locked (or about to be)
+                if self._gpu_lock.is_locked() or self._granted_request is not None:
                     continue
 
                 # Check for chatbot requests first (highest priority)
-                if not self._chatbot_queue.empty():
-                    ready_event = await self._chatbot_queue.get()
-                    ready_event.set()
+                if self._grant_next(self._chatbot_queue):
                     continue
 
                 # If no chatbot requests, use round-robin for transcription/embedding/summarization/reranker
                 next_job_type = self._select_next_job_type()
 
                 # Try to schedule the selected job type first
-                scheduled = False
+                preferred_queue = {
+                    GPUJobType.TRANSCRIPTION: self._transcription_queue,
+                    GPUJobType.TEXT_EMBEDDING: self._text_embedding_queue,
+                    GPUJobType.SUMMARIZATION: self._summarization_queue,
+                    GPUJobType.VECTOR_RERANKER: self._vector_reranker_queue,
+                    GPUJobType.MISC_CHAT_JOB: self._misc_chat_queue,
+                }.get(next_job_type)
+                if preferred_queue is not None and self._grant_next(preferred_queue):
+                    continue
 
-                if (
-                    next_job_type == GPUJobType.TRANSCRIPTION
-                    and not self._transcription_queue.empty()
-                ):
-                    ready_event = await self._transcription_queue.get()
-                    ready_event.set()
-                    scheduled = True
-                elif (
-                    next_job_type == GPUJobType.TEXT_EMBEDDING
-                    and not self._text_embedding_queue.empty()
-                ):
-                    ready_event = await self._text_embedding_queue.get()
-                    ready_event.set()
-                    scheduled = True
-                elif (
-                    next_job_type == GPUJobType.SUMMARIZATION
-                    and not self._summarization_queue.empty()
-                ):
-                    ready_event = await self._summarization_queue.get()
-                    ready_event.set()
-                    scheduled = True
-                elif (
-                    next_job_type == GPUJobType.VECTOR_RERANKER
-                    and not self._vector_reranker_queue.empty()
+                # If preferred type is empty, look for ANY work
+                for queue in (
+                    self._transcription_queue,
+                    self._text_embedding_queue,
+                    self._summarization_queue,
+                    self._vector_reranker_queue,
+                    self._misc_chat_queue,
                 ):
-                    ready_event = await self._vector_reranker_queue.get()
-                    ready_event.set()
-                    scheduled = True
-                elif (
-                    next_job_type == GPUJobType.MISC_CHAT_JOB and not self._misc_chat_queue.empty()
-                ):
-                    ready_event = await self._misc_chat_queue.get()
-                    ready_event.set()
-                    scheduled = True
-
-                if not scheduled:
-                    # If preferred type is empty, look for ANY work
-                    if not self._transcription_queue.empty():
-                        ready_event = await self._transcription_queue.get()
-                        ready_event.set()
-                    elif not self._text_embedding_queue.empty():
-                        ready_event = await self._text_embedding_queue.get()
-                        ready_event.set()
-                    elif not self._summarization_queue.empty():
-                        ready_event = await self._summarization_queue.get()
-                        ready_event.set()
-                    elif not self._vector_reranker_queue.empty():
-                        ready_event = await self._vector_reranker_queue.get()
-                        ready_event.set()
-                    elif not self._misc_chat_queue.empty():
-                        ready_event = await self._misc_chat_queue.get()
-                        ready_event.set()
+                    if self._grant_next(queue):
+                        break
 
             except asyncio.CancelledError:
                 break
@@ -420,6 +465,29 @@ class GPUResourceManager(Manager):
                         f"Error in GPU scheduler loop: {type(e).__name__}: {str(e)}"
                     )
                 await asyncio.sleep(1.0)
+                # Re-run scheduling in case requests are still waiting
+                self._scheduler_wakeup.set()
+
+    def _grant_next(self, queue: asyncio.Queue[asyncio.Event]) -> bool:
+        """
+        Grant the GPU to the oldest live request in a queue.
+
+        Args:
+            queue: Priority queue to take the request from
+
+        Returns:
+            True if a request was granted, False if the queue had no live requests
+        """
+        while not queue.empty():
+            ready_event = queue.get_nowait()
+            if ready_event in self._abandoned_requests:
+                self._abandoned_requests.discard(ready_event)
+                continue
+
+            self._granted_request = ready_event
+            ready_event.set()
+            return True
+        return False
 
     def _select_next_job_type(self) -> GPUJobType | None:
         """
@@ -606,6 +674,12 @@ class _GPULockContext:
     async def __aenter__(self):
         """Acquire GPU lock when entering context."""
         await self.manager._request_lock(self.job_type, self.job_id, self.metadata)
+        try:
+            await self.manager._offload_resident_models(self.job_type)
+        except BaseException:
+            # Cancelled while offloading: don't keep the GPU locked
+            await self.manager._release_lock(self.job_type, self.job_id)
+            raise
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
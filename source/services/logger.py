@@ -1,6 +1,7 @@
 import asyncio
 import contextlib
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -13,6 +14,20 @@ if TYPE_CHECKING:
 from source.services.manager import Manager
 from source.utils import get_current_timestamp_est
 
+# Seconds the writer waits after the first queued message so a batch can accumulate
+LOG_FLUSH_INTERVAL = float(os.getenv("LOG_FLUSH_INTERVAL", "0.1"))
+
+# Maximum number of messages waiting to be written (0 = unbounded)
+LOG_QUEUE_MAX_SIZE = int(os.getenv("LOG_QUEUE_MAX_SIZE", "10000"))
+
+# What to do when the queue is full: "block" makes async log calls wait for space,
+# "drop" discards the message. Records from the stdlib logging bridge are always dropped
+# when the queue is full since emit() cannot wait.
+LOG_QUEUE_FULL_POLICY = os.getenv("LOG_QUEUE_FULL_POLICY", "block").lower()
+
+# Upper bound on messages written in a single batch
+LOG_MAX_BATCH_SIZE = 1000
+
 # -------------------------------------------------------------- #
 # Logging Handler to Bridge Built-in Logging to AsyncLoggingService
 # -------------------------------------------------------------- #
@@ -27,35 +42,34 @@ class AsyncLoggingHandler(logging.Handler):
         self._loop = None
 
     def emit(self, record: logging.LogRecord):
-        """Emit a log record to the async logger."""
+        """Emit a log record to the async logger.
+
+        Records are queued without scheduling a task. Records from other threads
+        are handed to the logger's event loop.
+        """
         try:
             # Format the message
             msg = self.format(record)
+            async_logger = self.async_logger
 
-            # Get the event loop
-            try:
-                asyncio.get_running_loop()
-            except RuntimeError:
-                # No running loop, print to console as fallback
-                print(msg, file=sys.stdout, flush=True)
+            if not async_logger._started or not async_logger._writer_ready.is_set():
+                async_logger._write_eager(msg)
                 return
 
-            # Schedule the async log call
-            asyncio.create_task(self._async_emit(msg, record.levelname))
-        except Exception:
-            self.handleError(record)
+            try:
+                running_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                running_loop = None
 
-    async def _async_emit(self, msg: str, level: str):  # noqa: ARG002
-        """Actually emit the log message asynchronously."""
-        # Write directly using the async logger's internal method
-        # to avoid double-formatting
-        try:
-            if self.async_logger._started and self.async_logger._writer_ready.is_set():
-                await self.async_logger._log_queue.put(msg)
+            if running_loop is async_logger._loop:
+                async_logger._enqueue_nowait(msg)
+            elif async_logger._loop is not None and not async_logger._loop.is_closed():
+                async_logger._loop.call_soon_threadsafe(async_logger._enqueue_nowait, msg)
             else:
-                await self.async_logger._write_to_file_eager(msg)
+                # No loop to hand off to, print to console as fallback
+                print(msg, file=sys.stdout, flush=True)
         except Exception:
-            pass  # Silently fail to avoid recursion
+            self.handleError(record)
 
 
 # -------------------------------------------------------------- #
@@ -64,7 +78,11 @@ class AsyncLoggingHandler(logging.Handler):
 
 
 class AsyncLoggingService(Manager):
-    """Async logging service with file locking to prevent concurrent writes."""
+    """Async logging service with a single batched writer.
+
+    Messages are queued and a background task writes them in batches to a log
+    file that stays open for the lifetime of the service.
+    """
 
     def __init__(
         self,
@@ -73,6 +91,9 @@ class AsyncLoggingService(Manager):
         log_file: str | None = None,
         use_timestamp: bool = True,
         console_output: bool = True,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+        max_queue_size: int = LOG_QUEUE_MAX_SIZE,
+        queue_full_policy: str = LOG_QUEUE_FULL_POLICY,
     ):
         """Initialize the async logging service.
 
@@ -84,10 +105,18 @@ class AsyncLoggingService(Manager):
             use_timestamp: If True and log_file is None, create a timestamped log file.
                           If False, uses "app.log" as default.
             console_output: If True, all log messages are also printed to console (stdout).
+            flush_interval: Seconds to let a batch accumulate before writing it
+            max_queue_size: Maximum number of queued messages (0 = unbounded)
+            queue_full_policy: "block" to make log calls wait for space, "drop" to discard
         """
         super().__init__(context)
+        if queue_full_policy not in ("block", "drop"):
+            raise ValueError(f"Invalid queue_full_policy: {queue_full_policy}")
+
         self.log_dir = Path(log_dir)
         self.console_output = console_output
+        self.flush_interval = flush_interval
+        self.queue_full_policy = queue_full_policy
 
         # Generate log file name
         if log_file is None:
@@ -106,8 +135,13 @@ class AsyncLoggingService(Manager):
         self._write_lock = asyncio.Lock()
 
         # Queue for pending log messages
-        self._log_queue: asyncio.Queue = asyncio.Queue()
+        self._log_queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
         self._writer_task: asyncio.Task | None = None
+        self._log_file_handle = None
+        self._dropped_messages = 0
+
+        # Event loop the writer runs on (for records logged from other threads)
+        self._loop: asyncio.AbstractEventLoop | None = None
 
         # Event to signal when the writer task is ready
         self._writer_ready = asyncio.Event()
@@ -126,6 +160,10 @@ class AsyncLoggingService(Manager):
         # Create log directory if it doesn't exist
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
+        # Keep the log file open for the writer
+        self._log_file_handle = await aiofiles.open(self.log_path, mode="a", encoding="utf-8")
+        self._loop = asyncio.get_running_loop()
+
         # Start background writer task
         self._writer_task = asyncio.create_task(self._process_log_queue())
 
@@ -165,7 +203,7 @@ class AsyncLoggingService(Manager):
         """Clean up on close."""
         await super().on_close()
 
-        # Stop the writer task
+        # Stop the writer task (it writes the batch it is holding before exiting)
         if self._writer_task:
             self._writer_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
@@ -174,6 +212,15 @@ class AsyncLoggingService(Manager):
         # Flush remaining logs
         await self._flush_queue()
 
+        # Anything logged from now on is written eagerly
+        self._started = False
+        self._writer_ready.clear()
+
+        if self._log_file_handle is not None:
+            with contextlib.suppress(Exception):
+                await self._log_file_handle.close()
+            self._log_file_handle = None
+
     # -------------------------------------------------------------- #
     # Public Logging Methods
     # -------------------------------------------------------------- #
@@ -191,8 +238,11 @@ class AsyncLoggingService(Manager):
         # If writer task isn't ready yet, write eagerly to ensure no logs are lost
         if not self._started or not self._writer_ready.is_set():
             await self._write_to_file_eager(formatted_message)
-        else:
+        elif self.queue_full_policy == "block":
+            # Backpressure: wait for the writer when the queue is full
             await self._log_queue.put(formatted_message)
+        else:
+            self._enqueue_nowait(formatted_message)
 
     async def debug(self, message: str) -> None:
         """Log a debug message."""
@@ -228,38 +278,96 @@ class AsyncLoggingService(Manager):
     # Private Methods
     # -------------------------------------------------------------- #
 
+    def _enqueue_nowait(self, message: str) -> None:
+        """Queue a message without waiting, dropping it if the queue is full.
+
+        Args:
+            message: The formatted log message to queue
+        """
+        try:
+            self._log_queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self._dropped_messages += 1
+
+    def _take_batch(self, batch: list[str]) -> None:
+        """Move queued messages into the batch without waiting.
+
+        Args:
+            batch: Batch to extend (up to LOG_MAX_BATCH_SIZE messages)
+        """
+        while len(batch) < LOG_MAX_BATCH_SIZE:
+            try:
+                batch.append(self._log_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
     async def _process_log_queue(self) -> None:
-        """Process log messages from the queue continuously."""
+        """Process log messages from the queue in batches."""
+        batch: list[str] = []
         try:
             # Signal that the writer task is ready
             self._writer_ready.set()
 
             while True:
-                message = await self._log_queue.get()
-                await self._write_to_file(message)
-                self._log_queue.task_done()
+                batch.append(await self._log_queue.get())
+
+                # Let more messages accumulate so they share one write
+                if self.flush_interval > 0:
+                    await asyncio.sleep(self.flush_interval)
+                self._take_batch(batch)
+
+                await self._write_batch(batch)
+                for _ in batch:
+                    self._log_queue.task_done()
+                batch = []
         except asyncio.CancelledError:
-            pass
+            # Don't lose messages already taken off the queue
+            if batch:
+                await self._write_batch(batch)
+                for _ in batch:
+                    self._log_queue.task_done()
 
-    async def _write_to_file(self, message: str) -> None:
-        """Write a message to the log file with locking.
+    async def _write_batch(self, messages: list[str]) -> None:
+        """Write a batch of messages to the log file with a single write.
 
         Args:
-            message: The formatted log message to write
+            messages: The formatted log messages to write
         """
-        # Always print to console (stdout) with immediate flush for all log messages
+        if self._dropped_messages:
+            timestamp = get_current_timestamp_est().isoformat()
+            messages = [
+                *messages,
+                f"[{timestamp}] [WARNING] Log queue full, dropped {self._dropped_messages} messages",
+            ]
+            self._dropped_messages = 0
+
+        text = "\n".join(messages) + "\n"
+
+        # Print all messages to console (stdout) with one flush per batch
         if self.console_output:
-            print(message, file=sys.stdout, flush=True)
+            sys.stdout.write(text)
+            sys.stdout.flush()
 
         async with self._write_lock:
             try:
-                async with aiofiles.open(self.log_path, mode="a", encoding="utf-8") as f:
-                    await f.write(message + "\n")
+                if self._log_file_handle is None:
+                    self._write_eager(text[:-1], console=False)
+                else:
+                    await self._log_file_handle.write(text)
+                    await self._log_file_handle.flush()
             except Exception as e:
                 # Print to stderr if file write fails
                 error_msg = f"[ERROR] Failed to write to log file: {e}"
                 print(error_msg, file=sys.stderr, flush=True)
 
+    async def _write_to_file(self, message: str) -> None:
+        """Write a single message to the log file.
+
+        Args:
+            message: The formatted log message to write
+        """
+        await self._write_batch([message])
+
     async def _write_to_file_eager(self, message: str) -> None:
         """Write a message eagerly (synchronously) when the writer task isn't ready.
 
@@ -269,8 +377,17 @@ class AsyncLoggingService(Manager):
         Args:
             message: The formatted log message to write
         """
+        self._write_eager(message)
+
+    def _write_eager(self, message: str, console: bool = True) -> None:
+        """Synchronously append a message to the log file.
+
+        Args:
+            message: The formatted log message to write
+            console: If True, also print the message to stdout (when console output is on)
+        """
         # Always print to console (stdout) with immediate flush for all log messages
-        if self.console_output:
+        if console and self.console_output:
             print(message, file=sys.stdout, flush=True)
 
         # Write to file eagerly without waiting for queue processing
@@ -288,9 +405,9 @@ class AsyncLoggingService(Manager):
 
     async def _flush_queue(self) -> None:
         """Flush all remaining messages from the queue."""
-        while not self._log_queue.empty():
-            try:
-                message = self._log_queue.get_nowait()
-                await self._write_to_file(message)
-            except asyncio.QueueEmpty:
-                break
+        while not self._log_queue.empty() or self._dropped_messages:
+            batch: list[str] = []
+            self._take_batch(batch)
+            await self._write_batch(batch)
+            for _ in batch:
+                self._log_queue.task_done()
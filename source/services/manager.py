@@ -431,6 +431,11 @@ class BaseFileServiceManager(Manager):
         """Update a file."""
         pass
 
+    @abstractmethod
+    async def append_file(self, filename: str, data: bytes) -> None:
+        """Append data to a file, creating it if needed."""
+        pass
+
     @abstractmethod
     async def get_folder_contents(self, folder_path: str) -> list[str]:
         """Get the contents of a folder."""
@@ -615,21 +620,29 @@ class BaseFFmpegServiceManager(Manager):
         pass
 
     @abstractmethod
-    async def create_pcm_to_mp3_stream_handler(self) -> Any:
-        """Create a PCM to MP3 stream handler."""
+    async def create_pcm_to_mp3_stream_handler(
+        self,
+        output_path: str,
+        bitrate: str = "128k",
+        job_id: str | None = None,
+        meeting_id: str | None = None,
+    ) -> Any:
+        """Start a long-lived PCM to MP3 stream handler writing to output_path."""
         pass
 
     @abstractmethod
-    async def queue_mp3_to_whisper_format_job(
-        self, input_path: str, output_path: str, options: dict
-    ) -> bool:
+    async def finish_pcm_to_mp3_stream(self, stream: Any) -> bool:
+        """Close a PCM to MP3 stream handler and wait for its output to be finalized."""
+        pass
+
+    @abstractmethod
+    async def queue_mp3_to_whisper_format_job(self, input_path: str, output_path: str) -> bool:
         """
         Convert an MP3 file to Whisper-compatible format.
 
         Args:
             input_path: Path to the input MP3 file
             output_path: Path to the output file
-            options: Dictionary of FFmpeg options
 
         Returns:
             True if conversion was successful, False otherwise
@@ -321,18 +321,13 @@ async def generate_and_store_reel_embeddings(
     async with services.gpu_resource_manager.acquire_lock(
         job_type="misc_chat_job", job_id=f"reels-embedding-{message_id}"
     ):
-        # Import and use the same embedding handler as transcription service
+        # Use the same shared embedding model as the transcription service
         from source.services.transcription.text_embedding_manager.manager import (
-            EmbeddingModelHandler,
+            get_shared_embedding_model,
         )
 
-        handler = EmbeddingModelHandler()
-
-        try:
-            # Load model (synchronous operation, run in executor)
-            await asyncio.get_event_loop().run_in_executor(None, handler.load_model)
-
-            await services.logging_service.info("Embedding model loaded for reel storage")
+        async with get_shared_embedding_model().use() as handler:
+            await services.logging_service.info("Embedding model ready for reel storage")
 
             # Generate embedding for the summary text only (no segmentation)
             embedding = await asyncio.get_event_loop().run_in_executor(
@@ -342,11 +337,6 @@ async def generate_and_store_reel_embeddings(
 
             await services.logging_service.info("Generated embedding for reel")
 
-        finally:
-            # Always offload model
-            await asyncio.get_event_loop().run_in_executor(None, handler.offload_model)
-            await services.logging_service.info("Embedding model offloaded")
-
     # Step 3: Store in ChromaDB
     vector_db_client = services.server.vector_db_client
     collection_name = f"reels_{guild_id}"
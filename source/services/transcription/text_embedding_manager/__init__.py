@@ -5,11 +5,15 @@ This package contains the job manager for creating text embeddings of compiled t
 """
 
 from source.services.transcription.text_embedding_manager.manager import (
+    SharedEmbeddingModel,
     TextEmbeddingJob,
     TextEmbeddingJobManagerService,
+    get_shared_embedding_model,
 )
 
 __all__ = [
+    "SharedEmbeddingModel",
     "TextEmbeddingJob",
     "TextEmbeddingJobManagerService",
+    "get_shared_embedding_model",
 ]
@@ -3,7 +3,8 @@ Text Embedding Job Manager Service.
 
 This service manages the generation of text embeddings from compiled meeting transcripts
 for use in Retrieval-Augmented Generation (RAG) systems. It handles:
-- GPU-aware model loading and offloading
+- GPU-aware model loading and offloading (one shared model, evicted after EMBEDDING_MODEL_IDLE_TIMEOUT idle seconds
+  or as soon as a job that doesn't use it takes the GPU lock)
 - Segmentation with overlapping context windows
 - Batch embedding generation
 - ChromaDB storage in per-guild collections
@@ -31,8 +32,9 @@ from __future__ import annotations
 
 import asyncio
 import gc
-import json
 import os
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -51,8 +53,21 @@ from source.services.transcription.text_embedding_manager.summary_partitioner im
 from source.services.transcription.text_embedding_manager.text_partitioner import (
     partition_transcript_segments,
 )
+from source.services.transcription.transcription_file_manager import decode_transcript
 from source.utils import generate_16_char_uuid
 
+# Default sentence-transformers model used for all embeddings
+DEFAULT_EMBEDDING_MODEL = "BAAI/bge-large-en-v1.5"
+
+# Seconds an unused shared embedding model stays loaded (0 = offload as soon as it's idle).
+# The resident model holds ~1.3 GB of VRAM. It is offloaded early when a job type outside
+# EMBEDDING_MODEL_GPU_JOB_TYPES (whisper transcription, summarization, reranking) takes the
+# GPU lock, but chatbot Ollama calls share the GPU with it; lower this on small GPUs.
+EMBEDDING_MODEL_IDLE_TIMEOUT = float(os.getenv("EMBEDDING_MODEL_IDLE_TIMEOUT", "300"))
+
+# GPU job types that use the shared embedding model; it stays loaded between these
+EMBEDDING_MODEL_GPU_JOB_TYPES = ["text_embedding", "chatbot", "misc_chat_job"]
+
 # -------------------------------------------------------------- #
 # Embedding Model Handler
 # -------------------------------------------------------------- #
@@ -65,10 +80,11 @@ class EmbeddingModelHandler:
     Manages loading, offloading, and inference for the BAAI/bge-large-en-v1.5
     sentence transformer model.
 
-    Note: Load/offload is currently manual per-job, similar to whisper/ollama pattern.
+    Note: Load/offload is manual. Jobs and tools should go through
+    SharedEmbeddingModel so a single loaded model is reused between calls.
     """
 
-    def __init__(self, model_name: str = "BAAI/bge-large-en-v1.5"):
+    def __init__(self, model_name: str = DEFAULT_EMBEDDING_MODEL):
         """
         Initialize the embedding model handler.
 
@@ -163,6 +179,175 @@ class EmbeddingModelHandler:
         return False
 
 
+class SharedEmbeddingModel:
+    """
+    Reference-counted, process-wide holder for an EmbeddingModelHandler.
+
+    The model is loaded by the first user and kept resident while anyone holds
+    a reference. Once the last reference is released it stays loaded for
+    idle_timeout seconds, so back-to-back embedding jobs and chatbot searches
+    reuse the same model instead of reloading it every time. The text embedding
+    service also registers it with the GPU resource manager, which offloads it
+    when a job type that doesn't use it acquires the GPU.
+
+    Usage:
+        shared_model = get_shared_embedding_model()
+        async with shared_model.use() as handler:
+            embeddings = await asyncio.to_thread(handler.encode, texts)
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        idle_timeout: float = EMBEDDING_MODEL_IDLE_TIMEOUT,
+        handler_factory: Callable[[str], EmbeddingModelHandler] = EmbeddingModelHandler,
+    ):
+        """
+        Initialize the shared model holder (the model itself is loaded lazily).
+
+        Args:
+            model_name: Name of the sentence-transformers model to use
+            idle_timeout: Seconds to keep the model loaded after the last reference is released
+            handler_factory: Callable creating the underlying handler from a model name
+        """
+        self.model_name = model_name
+        self.idle_timeout = idle_timeout
+        self._handler = handler_factory(model_name)
+
+        self._lock = asyncio.Lock()
+        self._ref_count = 0
+        self._release_generation = 0
+        self._evict_task: asyncio.Task | None = None
+        self._evicting = False
+
+        # Statistics
+        self._load_count = 0
+        self._use_count = 0
+
+    @asynccontextmanager
+    async def use(self) -> AsyncIterator[EmbeddingModelHandler]:
+        """
+        Hold a reference to the loaded model for the duration of the block.
+
+        Yields:
+            The loaded EmbeddingModelHandler
+        """
+        await self.acquire()
+        try:
+            yield self._handler
+        finally:
+            await self.release()
+
+    async def acquire(self) -> EmbeddingModelHandler:
+        """Take a reference, loading the model if needed."""
+        # Count the reference before waiting so a pending eviction sees it
+        self._ref_count += 1
+        self._use_count += 1
+        self._cancel_idle_eviction()
+
+        try:
+            async with self._lock:
+                if not self._handler.is_loaded():
+                    await asyncio.to_thread(self._handler.load_model)
+                    self._load_count += 1
+        except BaseException:
+            self._ref_count -= 1
+            raise
+
+        return self._handler
+
+    async def release(self) -> None:
+        """Drop a reference, scheduling idle eviction when it was the last one."""
+        self._ref_count = max(0, self._ref_count - 1)
+        if self._ref_count > 0:
+            return
+
+        self._release_generation += 1
+        if self.idle_timeout <= 0:
+            await self._evict_if_idle(self._release_generation)
+            return
+
+        self._cancel_idle_eviction()
+        self._evict_task = asyncio.create_task(
+            self._evict_after(self.idle_timeout, self._release_generation)
+        )
+
+    async def close(self) -> None:
+        """Offload the model immediately if nobody is using it (e.g. on shutdown or GPU handoff)."""
+        self._cancel_idle_eviction()
+        await self._evict_if_idle(self._release_generation)
+
+    def is_loaded(self) -> bool:
+        """Check if the shared model is currently loaded."""
+        return self._handler.is_loaded()
+
+    @property
+    def ref_count(self) -> int:
+        """Number of callers currently holding the model."""
+        return self._ref_count
+
+    def get_status(self) -> dict[str, Any]:
+        """Return a point-in-time view of the shared model."""
+        return {
+            "model_name": self.model_name,
+            "loaded": self.is_loaded(),
+            "ref_count": self._ref_count,
+            "idle_timeout": self.idle_timeout,
+            "load_count": self._load_count,
+            "use_count": self._use_count,
+        }
+
+    def _cancel_idle_eviction(self) -> None:
+        """Cancel a pending idle eviction that hasn't started offloading yet."""
+        if self._evict_task and not self._evict_task.done() and not self._evicting:
+            self._evict_task.cancel()
+        self._evict_task = None
+
+    async def _evict_after(self, delay: float, generation: int) -> None:
+        """Offload the model after `delay` seconds unless it was used in the meantime."""
+        with suppress(asyncio.CancelledError):
+            await asyncio.sleep(delay)
+            await self._evict_if_idle(generation)
+
+    async def _evict_if_idle(self, generation: int) -> None:
+        """Offload the model if no reference was taken since release `generation`."""
+        async with self._lock:
+            if (
+                self._ref_count > 0
+                or generation != self._release_generation
+                or not self._handler.is_loaded()
+            ):
+                return
+
+            self._evicting = True
+            try:
+                # Shield the offload so a cancelled waiter can't leave it half done
+                await asyncio.shield(asyncio.to_thread(self._handler.offload_model))
+            finally:
+                self._evicting = False
+
+
+# Shared embedding models by model name
+_shared_embedding_models: dict[str, SharedEmbeddingModel] = {}
+
+
+def get_shared_embedding_model(model_name: str = DEFAULT_EMBEDDING_MODEL) -> SharedEmbeddingModel:
+    """
+    Get the process-wide shared embedding model for a model name.
+
+    Args:
+        model_name: Name of the sentence-transformers model
+
+    Returns:
+        The SharedEmbeddingModel for that model (created on first use)
+    """
+    shared_model = _shared_embedding_models.get(model_name)
+    if shared_model is None:
+        shared_model = SharedEmbeddingModel(model_name)
+        _shared_embedding_models[model_name] = shared_model
+    return shared_model
+
+
 # -------------------------------------------------------------- #
 # Text Embedding Job
 # -------------------------------------------------------------- #
@@ -322,10 +507,10 @@ class TextEmbeddingJob(Job):
                 )
                 return None
 
-            # Read the JSON file
-            async with aiofiles.open(file_path, encoding="utf-8") as f:
+            # Read the transcript file (any stored format)
+            async with aiofiles.open(file_path, "rb") as f:
                 content = await f.read()
-                compiled_transcript = json.loads(content)
+            compiled_transcript = decode_transcript(content)
 
             # Validate structure
             if "segments" not in compiled_transcript:
@@ -372,14 +557,9 @@ class TextEmbeddingJob(Job):
                 f"Acquired GPU lock for embedding generation (meeting: {self.meeting_id})"
             )
 
-            # Create model handler
-            handler = EmbeddingModelHandler()
-
-            try:
-                # Load model
-                await asyncio.get_event_loop().run_in_executor(None, handler.load_model)
-
-                await self.services.logging_service.info("Embedding model loaded successfully")
+            # Reuse the shared model (loaded once, kept resident between jobs)
+            async with get_shared_embedding_model().use() as handler:
+                await self.services.logging_service.info("Embedding model ready")
 
                 # Extract text from partitions
                 # Handle both transcript format (contextualized_text) and summary format (text)
@@ -400,12 +580,6 @@ class TextEmbeddingJob(Job):
 
                 await self.services.logging_service.info(f"Generated {len(embeddings)} embeddings")
 
-            finally:
-                # Always offload model
-                await asyncio.get_event_loop().run_in_executor(None, handler.offload_model)
-
-                await self.services.logging_service.info("Embedding model offloaded")
-
         # GPU lock automatically released here
         return embeddings
 
@@ -663,6 +837,14 @@ class TextEmbeddingJobManagerService(BaseTextEmbeddingJobManagerService):
             on_job_failed=self._on_job_failed,
         )
 
+        # Free the resident model's VRAM when whisper or summarization jobs take the GPU
+        if self.services.gpu_resource_manager:
+            self.services.gpu_resource_manager.register_resident_model(
+                "embedding model",
+                EMBEDDING_MODEL_GPU_JOB_TYPES,
+                get_shared_embedding_model().close,
+            )
+
         await self.services.logging_service.info("TextEmbeddingJobManagerService initialized")
 
         return True
@@ -673,6 +855,9 @@ class TextEmbeddingJobManagerService(BaseTextEmbeddingJobManagerService):
             # Note: JobQueue doesn't have explicit cleanup, but we can clear references
             self._job_queue = None
 
+        # Release the resident embedding model
+        await get_shared_embedding_model().close()
+
         await self.services.logging_service.info("TextEmbeddingJobManagerService closed")
 
         return True
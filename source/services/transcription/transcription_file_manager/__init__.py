@@ -4,10 +4,16 @@ Transcription File Manager Package.
 This package contains the file manager for handling transcription JSON files.
 """
 
+from source.services.transcription.transcription_file_manager.encoding import (
+    decode_transcript,
+    encode_transcript,
+)
 from source.services.transcription.transcription_file_manager.manager import (
     TranscriptionFileManagerService,
 )
 
 __all__ = [
     "TranscriptionFileManagerService",
+    "decode_transcript",
+    "encode_transcript",
 ]
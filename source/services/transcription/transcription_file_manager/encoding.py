@@ -0,0 +1,343 @@
+"""
+On-Disk Transcript Encoding.
+
+Transcripts and compilations used to be written as json.dumps(indent=2), and
+every consumer parses the whole file back. Indentation is a large share of a
+transcript's size (segments and words are deeply nested), so files are now
+written in a compact format chosen by configuration:
+
+- pretty:  json.dumps(indent=2), the original format
+- json:    minified JSON (default)
+- msgpack: MessagePack, smaller and much faster to parse (needs ormsgpack)
+
+optionally compressed with gzip or zstd (zstd needs zstandard).
+
+Filenames keep their .json extension because SQL rows and consumers refer to
+them by name. Readers never need to know how a file was written:
+decode_transcript detects the compression and format from the leading bytes,
+so files written before this change, or under another configuration, still load.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import struct
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
+
+try:
+    import ormsgpack
+except ImportError:
+    ormsgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# -------------------------------------------------------------- #
+# Configuration
+# -------------------------------------------------------------- #
+
+TRANSCRIPT_FORMATS = ("pretty", "json", "msgpack")
+TRANSCRIPT_COMPRESSIONS = ("none", "gzip", "zstd")
+
+TRANSCRIPT_FORMAT = os.getenv("TRANSCRIPT_FORMAT", "json").lower()
+TRANSCRIPT_COMPRESSION = os.getenv("TRANSCRIPT_COMPRESSION", "none").lower()
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# Streamed output is gathered into blocks of this size before each write
+WRITE_BLOCK_SIZE = 1 << 16
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# A transcript is a map: fixmap (0x80-0x8f), map16 (0xde) or map32 (0xdf).
+# None of these can start a JSON document.
+MSGPACK_MAP_PREFIXES = frozenset([*range(0x80, 0x90), 0xDE, 0xDF])
+
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+# -------------------------------------------------------------- #
+# Encoding
+# -------------------------------------------------------------- #
+
+
+def encode_transcript(data: Any, fmt: str | None = None, compression: str | None = None) -> bytes:
+    """
+    Serialize a transcript for storage.
+
+    Args:
+        data: JSON-compatible transcript data
+        fmt: One of TRANSCRIPT_FORMATS (defaults to TRANSCRIPT_FORMAT)
+        compression: One of TRANSCRIPT_COMPRESSIONS (defaults to TRANSCRIPT_COMPRESSION)
+
+    Returns:
+        The encoded file contents
+
+    Raises:
+        ValueError: If the format or compression is unknown
+        RuntimeError: If the library the format or compression needs is not installed
+    """
+    fmt, compression = _resolve(fmt, compression)
+
+    if fmt == "msgpack":
+        raw = _packb(data)
+    elif fmt == "pretty":
+        raw = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    else:
+        raw = _COMPACT_ENCODER.encode(data).encode("utf-8")
+
+    if compression == "gzip":
+        return gzip.compress(raw, compresslevel=GZIP_LEVEL, mtime=0)
+    if compression == "zstd":
+        return _zstd().ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+    return raw
+
+
+def write_transcript_stream(
+    file_path: str,
+    header: dict,
+    list_key: str,
+    items: Iterable[Any],
+    item_count: int,
+    fmt: str | None = None,
+    compression: str | None = None,
+    pretty_item: Callable[[Any], str] | None = None,
+) -> int:
+    """
+    Stream a document of header fields followed by one long list into a file (blocking).
+
+    The output is identical to encode_transcript({**header, list_key: list(items)}),
+    but the items are never held in memory together. The file is written next to
+    file_path and moved into place once complete.
+
+    Args:
+        file_path: Where to write the document
+        header: Fields written before the list
+        list_key: Key of the list
+        items: The list's items, consumed once
+        item_count: Number of items (MessagePack writes the list length first)
+        fmt: One of TRANSCRIPT_FORMATS (defaults to TRANSCRIPT_FORMAT)
+        compression: One of TRANSCRIPT_COMPRESSIONS (defaults to TRANSCRIPT_COMPRESSION)
+        pretty_item: Faster equivalent of indent_json(item, 4) for the pretty format
+
+    Returns:
+        Number of items written
+
+    Raises:
+        ValueError: If the format or compression is unknown, or items does not
+            yield item_count items
+        RuntimeError: If the library the format or compression needs is not installed
+    """
+    fmt, compression = _resolve(fmt, compression)
+
+    count = 0
+
+    def counted() -> Iterator[Any]:
+        nonlocal count
+        for item in items:
+            count += 1
+            yield item
+
+    if fmt == "msgpack":
+        chunks = _msgpack_chunks(header, list_key, counted(), item_count)
+    elif fmt == "pretty":
+        chunks = _pretty_chunks(header, list_key, counted(), pretty_item)
+    else:
+        chunks = _compact_chunks(header, list_key, counted())
+
+    temp_path = f"{file_path}.tmp"
+    try:
+        with _open_for_write(temp_path, compression) as f:
+            block = []
+            block_size = 0
+            for chunk in chunks:
+                block.append(chunk)
+                block_size += len(chunk)
+                if block_size >= WRITE_BLOCK_SIZE:
+                    f.write(b"".join(block))
+                    block.clear()
+                    block_size = 0
+            f.write(b"".join(block))
+        if fmt == "msgpack" and count != item_count:
+            raise ValueError(f"Expected {item_count} items in {list_key!r}, got {count}")
+        os.replace(temp_path, file_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    return count
+
+
+def indent_json(value: Any, indent: int) -> str:
+    """Dump a value as it appears nested `indent` spaces deep in json.dumps(indent=2)."""
+    return json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n" + " " * indent)
+
+
+# -------------------------------------------------------------- #
+# Decoding
+# -------------------------------------------------------------- #
+
+
+def decode_transcript(data: bytes) -> Any:
+    """
+    Parse a stored transcript in any supported format and compression.
+
+    Args:
+        data: File contents
+
+    Returns:
+        The transcript data
+
+    Raises:
+        RuntimeError: If the library needed to read the file is not installed
+        ValueError: If the file is not valid in the detected format
+    """
+    if data[:4] == ZSTD_MAGIC:
+        # Streamed frames carry no content size, which one-shot decompress() requires
+        decompressor = _zstd().ZstdDecompressor().decompressobj()
+        try:
+            data = decompressor.decompress(data)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Corrupt zstd transcript: {e}") from e
+    elif data[:2] == GZIP_MAGIC:
+        try:
+            data = gzip.decompress(data)
+        except (OSError, EOFError) as e:
+            raise ValueError(f"Corrupt gzip transcript: {e}") from e
+
+    if data[:1] and data[0] in MSGPACK_MAP_PREFIXES:
+        return _msgpack().unpackb(data)
+    return json.loads(data.decode("utf-8"))
+
+
+# -------------------------------------------------------------- #
+# Helpers
+# -------------------------------------------------------------- #
+
+
+def _resolve(fmt: str | None, compression: str | None) -> tuple[str, str]:
+    fmt = (fmt or TRANSCRIPT_FORMAT).lower()
+    compression = (compression or TRANSCRIPT_COMPRESSION).lower()
+    if fmt not in TRANSCRIPT_FORMATS:
+        raise ValueError(f"Unknown transcript format {fmt!r}, expected one of {TRANSCRIPT_FORMATS}")
+    if compression not in TRANSCRIPT_COMPRESSIONS:
+        raise ValueError(
+            f"Unknown transcript compression {compression!r}, "
+            f"expected one of {TRANSCRIPT_COMPRESSIONS}"
+        )
+    return fmt, compression
+
+
+def _msgpack():
+    if ormsgpack is None:
+        raise RuntimeError("ormsgpack is required for msgpack transcripts (pip install ormsgpack)")
+    return ormsgpack
+
+
+def _zstd():
+    if zstandard is None:
+        raise RuntimeError(
+            "zstandard is required for zstd-compressed transcripts (pip install zstandard)"
+        )
+    return zstandard
+
+
+def _packb(value: Any) -> bytes:
+    packb = _msgpack().packb
+    try:
+        return packb(value)
+    except TypeError:
+        # Non-string keys, e.g. summary_layers levels
+        return packb(_string_keys(value))
+
+
+def _string_keys(value: Any) -> Any:
+    """Convert non-string dict keys as json.dumps does, so every format loads the same data."""
+    if isinstance(value, dict):
+        return {
+            (key if isinstance(key, str) else json.dumps(key)): _string_keys(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_string_keys(item) for item in value]
+    return value
+
+
+@contextmanager
+def _open_for_write(path: str, compression: str) -> Iterator[BinaryIO]:
+    with open(path, "wb") as f:
+        if compression == "gzip":
+            with gzip.GzipFile(
+                filename="", mode="wb", compresslevel=GZIP_LEVEL, fileobj=f, mtime=0
+            ) as gz:
+                yield gz
+        elif compression == "zstd":
+            compressor = _zstd().ZstdCompressor(level=ZSTD_LEVEL)
+            with compressor.stream_writer(f, closefd=False) as zf:
+                yield zf
+        else:
+            yield f
+
+
+def _pretty_chunks(
+    header: dict, list_key: str, items: Iterable[Any], pretty_item: Callable[[Any], str] | None
+) -> Iterator[bytes]:
+    format_item = pretty_item or (lambda item: indent_json(item, 4))
+    parts = ["{\n"]
+    for key, value in header.items():
+        parts.append(f"  {json.dumps(key)}: {indent_json(value, 2)},\n")
+    parts.append(f"  {json.dumps(list_key)}: [")
+    yield "".join(parts).encode("utf-8")
+
+    first = True
+    for item in items:
+        separator = "\n    " if first else ",\n    "
+        yield (separator + format_item(item)).encode("utf-8")
+        first = False
+    yield b"]\n}" if first else b"\n  ]\n}"
+
+
+def _compact_chunks(header: dict, list_key: str, items: Iterable[Any]) -> Iterator[bytes]:
+    encode = _COMPACT_ENCODER.encode
+    parts = ["{"]
+    for key, value in header.items():
+        parts.append(f"{encode(key)}:{encode(value)},")
+    parts.append(f"{encode(list_key)}:[")
+    yield "".join(parts).encode("utf-8")
+
+    first = True
+    for item in items:
+        yield (encode(item) if first else "," + encode(item)).encode("utf-8")
+        first = False
+    yield b"]}"
+
+
+def _msgpack_chunks(
+    header: dict, list_key: str, items: Iterable[Any], item_count: int
+) -> Iterator[bytes]:
+    parts = [_msgpack_container_header(len(header) + 1, 0x80, 0xDE)]
+    for key, value in header.items():
+        parts.append(_packb(key))
+        parts.append(_packb(value))
+    parts.append(_packb(list_key))
+    parts.append(_msgpack_container_header(item_count, 0x90, 0xDC))
+    yield b"".join(parts)
+
+    for item in items:
+        yield _packb(item)
+
+
+def _msgpack_container_header(length: int, fix_prefix: int, prefix16: int) -> bytes:
+    """MessagePack map or array header; the 32-bit type follows the 16-bit one."""
+    if length < 16:
+        return bytes([fix_prefix | length])
+    if length < 1 << 16:
+        return struct.pack(">BH", prefix16, length)
+    return struct.pack(">BI", prefix16 + 1, length)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
@@ -13,6 +12,10 @@ from sqlalchemy import delete, insert, select
 
 from source.server.sql_models import UserTranscriptsModel
 from source.services.manager import BaseTranscriptionFileServiceManager
+from source.services.transcription.transcription_file_manager.encoding import (
+    decode_transcript,
+    encode_transcript,
+)
 from source.utils import calculate_file_sha256, generate_16_char_uuid, get_current_timestamp_est
 
 # -------------------------------------------------------------- #
@@ -106,9 +109,8 @@ class TranscriptionFileManagerService(BaseTranscriptionFileServiceManager):
         file_path = os.path.abspath(os.path.join(self.storage_path, filename))
 
         try:
-            # Convert to JSON bytes
-            json_content = json.dumps(transcript_data, indent=2, ensure_ascii=False)
-            data_bytes = json_content.encode("utf-8")
+            # Encode in the configured transcript format
+            data_bytes = encode_transcript(transcript_data)
 
             # Use file_manager's atomic save operation
             await self.services.file_service_manager.save_file(file_path, data_bytes)
@@ -180,7 +182,7 @@ class TranscriptionFileManagerService(BaseTranscriptionFileServiceManager):
 
             # Use file_manager's read operation (accepts absolute paths)
             data_bytes = await self.services.file_service_manager.read_file(file_path)
-            transcript_data = json.loads(data_bytes.decode("utf-8"))
+            transcript_data = decode_transcript(data_bytes)
 
             await self.services.logging_service.info(f"Retrieved transcription: {transcript_id}")
 
@@ -381,15 +383,14 @@ class TranscriptionFileManagerService(BaseTranscriptionFileServiceManager):
             # Build absolute path to ensure file_manager doesn't double-join
             file_path = os.path.abspath(os.path.join(self.storage_path, filename))
 
-            # Convert transcript data to JSON bytes
-            json_content = json.dumps(transcript_data, indent=2, ensure_ascii=False)
-            data_bytes = json_content.encode("utf-8")
+            # Encode in the configured transcript format
+            data_bytes = encode_transcript(transcript_data)
 
             # Use file_manager's update operation (accepts absolute paths)
             await self.services.file_service_manager.update_file(file_path, data_bytes)
 
             await self.services.logging_service.info(
-                f"Updated transcription file: {filename} ({len(json_content)} bytes)"
+                f"Updated transcription file: {filename} ({len(data_bytes)} bytes)"
             )
 
             return True
@@ -537,9 +538,8 @@ class TranscriptionFileManagerService(BaseTranscriptionFileServiceManager):
         file_path = os.path.abspath(os.path.join(self.compilations_storage_path, filename))
 
         try:
-            # Convert to JSON bytes
-            json_content = json.dumps(compiled_data, indent=2, ensure_ascii=False)
-            data_bytes = json_content.encode("utf-8")
+            # Encode in the configured transcript format
+            data_bytes = encode_transcript(compiled_data)
 
             # Ensure parent directory exists
             loop = asyncio.get_event_loop()
@@ -595,7 +595,7 @@ class TranscriptionFileManagerService(BaseTranscriptionFileServiceManager):
 
             # Read the JSON file using file_manager
             data_bytes = await self.services.file_service_manager.read_file(file_path)
-            compiled_data = json.loads(data_bytes.decode("utf-8"))
+            compiled_data = decode_transcript(data_bytes)
 
             await self.services.logging_service.info(
                 f"Retrieved compiled transcription for meeting: {meeting_id}"
@@ -644,9 +644,8 @@ class TranscriptionFileManagerService(BaseTranscriptionFileServiceManager):
                 )
                 return False
 
-            # Convert compiled data to JSON bytes
-            json_content = json.dumps(compiled_data, indent=2, ensure_ascii=False)
-            data_bytes = json_content.encode("utf-8")
+            # Encode in the configured transcript format
+            data_bytes = encode_transcript(compiled_data)
 
             # Use file_manager's update operation
             await self.services.file_service_manager.update_file(file_path, data_bytes)
@@ -17,12 +17,21 @@ The normalized format is:
     },
     "content": "text content"
 }
+
+Each user's segments are already time-ordered, so compilation is a k-way merge:
+segments are normalized one transcript at a time into a per-user spool file,
+then the spools are merged by start time and streamed into the compilation.
+Memory stays proportional to the number of users rather than total segments.
 """
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import json
+import os
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
 if TYPE_CHECKING:
     from source.context import Context
@@ -31,8 +40,103 @@ if TYPE_CHECKING:
 from source.server.sql_models import JobsStatus, JobsType
 from source.services.common.job import Job, JobQueue
 from source.services.manager import Manager
+from source.services.transcription.transcription_file_manager.encoding import (
+    indent_json,
+    write_transcript_stream,
+)
 from source.utils import generate_16_char_uuid, get_current_timestamp_est
 
+COMPILATIONS_STORAGE_PATH = os.path.join("assets/data/transcriptions", "compilations", "storage")
+
+
+# -------------------------------------------------------------- #
+# Segment Streams
+# -------------------------------------------------------------- #
+
+
+def _segment_start(segment: dict) -> float:
+    return segment["timestamp"]["start_time"]
+
+
+def _write_segment_spool(spool_path: str, segments: list[dict]) -> None:
+    """Write normalized segments to a spool file, one JSON object per line (blocking)."""
+    with open(spool_path, "w", encoding="utf-8") as f:
+        for segment in segments:
+            f.write(json.dumps(segment, ensure_ascii=False))
+            f.write("\n")
+
+
+def _read_segment_spool(spool_path: str) -> Iterator[dict]:
+    """Stream the segments of a spool file."""
+    with open(spool_path, encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+_SEGMENT_TEMPLATE = (
+    "{{\n"
+    '      "timestamp": {{\n'
+    '        "start_time": {start_time},\n'
+    '        "end_time": {end_time}\n'
+    "      }},\n"
+    '      "speaker": {{\n'
+    '        "user_id": {user_id},\n'
+    '        "user_transcription_file": {user_transcription_file}\n'
+    "      }},\n"
+    '      "content": {content}\n'
+    "    }}"
+)
+
+
+def _format_segment(segment: dict) -> str:
+    """
+    Render a normalized segment as it appears in the compilation's segment list.
+
+    Same output as indent_json(segment, 4), but json.dumps with indent runs the
+    pure-Python encoder, which dominates compilation time for long meetings.
+    """
+    timestamp = segment["timestamp"]
+    speaker = segment["speaker"]
+    if len(segment) != 3 or len(timestamp) != 2 or len(speaker) != 2:
+        return indent_json(segment, 4)
+
+    encode = _ENCODER.encode
+    return _SEGMENT_TEMPLATE.format(
+        start_time=encode(timestamp["start_time"]),
+        end_time=encode(timestamp["end_time"]),
+        user_id=encode(speaker["user_id"]),
+        user_transcription_file=encode(speaker["user_transcription_file"]),
+        content=encode(segment["content"]),
+    )
+
+
+def _write_compilation_file(file_path: str, header: dict, spool_paths: list[str]) -> int:
+    """
+    Merge per-user spools by start time and stream them into a compilation file (blocking).
+
+    The output is identical to encode_transcript({**header, "segments": [...]}) in the
+    configured transcript format.
+
+    Args:
+        file_path: Where to write the compilation
+        header: Compilation fields written before the segments, including segment_count
+        spool_paths: Time-ordered spool files, in transcript order (ties keep this order)
+
+    Returns:
+        Number of segments written
+    """
+    merged = heapq.merge(*(_read_segment_spool(path) for path in spool_paths), key=_segment_start)
+    return write_transcript_stream(
+        file_path,
+        header,
+        "segments",
+        merged,
+        header["segment_count"],
+        pretty_item=_format_segment,
+    )
+
 
 @dataclass
 class TranscriptionCompilationJob(Job):
@@ -64,9 +168,9 @@ class TranscriptionCompilationJob(Job):
 
         This will:
         1. Fetch all transcription files for the meeting
-        2. Parse and normalize each transcription into the standard format
-        3. Merge and sort all transcriptions by timestamp
-        4. Save the compiled result to data/compilations/storage/
+        2. Parse and normalize each transcription into a time-ordered spool file
+        3. Merge the spools by timestamp
+        4. Stream the compiled result to data/compilations/storage/
         """
         if not self.services:
             raise RuntimeError("ServicesManager not provided to TranscriptionCompilationJob")
@@ -92,69 +196,34 @@ class TranscriptionCompilationJob(Job):
                 f"Retrieved {len(transcription_metadata)} transcription files for meeting {self.meeting_id}"
             )
 
-            # Step 2: Load all transcription JSON files and extract meaningful data
-            all_segments = []
-
-            for metadata in transcription_metadata:
-                transcript_id = metadata["id"]
-                user_id = metadata["user_id"]
-                filename = metadata["filename"]
+            # Step 2: Normalize each transcription into a spool file, one at a time
+            storage_path = await self._ensure_storage_path()
+            spool_paths = []
 
-                await self.services.logging_service.info(
-                    f"Processing transcription {transcript_id} for user {user_id}: {filename}"
+            try:
+                segment_count = await self._spool_transcriptions(
+                    transcription_metadata, storage_path, spool_paths
                 )
 
-                # Retrieve the full transcription data
-                transcription_data = (
-                    await self.services.transcription_file_service_manager.retrieve_transcription(
-                        transcript_id
-                    )
+                await self.services.logging_service.info(
+                    f"Compiled {segment_count} segments from {len(transcription_metadata)} transcriptions"
                 )
 
-                if not transcription_data:
-                    await self.services.logging_service.warning(
-                        f"Failed to retrieve transcription data for {transcript_id}, skipping..."
-                    )
-                    continue
-
-                # Extract segments from whisper data and normalize to standard format
-                whisper_data = transcription_data.get("whisper_data", {})
-                segments = whisper_data.get("segments", [])
-
-                for segment in segments:
-                    # Extract only the meaningful data per text segment
-                    normalized_segment = {
-                        "timestamp": {
-                            "start_time": segment.get("start", 0.0),
-                            "end_time": segment.get("end", 0.0),
-                        },
-                        "speaker": {
-                            "user_id": user_id,
-                            "user_transcription_file": filename,
-                        },
-                        "content": segment.get("text", "").strip(),
-                    }
-                    all_segments.append(normalized_segment)
-
-            # Step 3: Sort all segments by start time
-            all_segments.sort(key=lambda x: x["timestamp"]["start_time"])
-
-            await self.services.logging_service.info(
-                f"Compiled {len(all_segments)} segments from {len(transcription_metadata)} transcriptions"
-            )
-
-            # Step 4: Create the new JSON object with compiled data
-            compilation_result = {
-                "meeting_id": self.meeting_id,
-                "compiled_at": get_current_timestamp_est().isoformat(),
-                "transcript_count": len(transcription_metadata),
-                "user_ids": list({m["user_id"] for m in transcription_metadata}),
-                "segment_count": len(all_segments),
-                "segments": all_segments,
-            }
-
-            # Step 5: Save the compilation to file
-            await self._save_compilation(compilation_result)
+                # Step 3: Describe the compilation; segments are merged in while saving
+                header = {
+                    "meeting_id": self.meeting_id,
+                    "compiled_at": get_current_timestamp_est().isoformat(),
+                    "transcript_count": len(transcription_metadata),
+                    "user_ids": list({m["user_id"] for m in transcription_metadata}),
+                    "segment_count": segment_count,
+                }
+
+                # Step 4: Merge the spools into the compilation file
+                await self._save_compilation(header, spool_paths, storage_path)
+            finally:
+                for spool_path in spool_paths:
+                    if os.path.exists(spool_path):
+                        os.remove(spool_path)
 
             await self.services.logging_service.info(
                 f"Completed transcription compilation for meeting {self.meeting_id}"
@@ -166,48 +235,120 @@ class TranscriptionCompilationJob(Job):
             )
             raise
 
-    async def _save_compilation(self, compilation_data: dict) -> str:
+    async def _spool_transcriptions(
+        self, transcription_metadata: list[dict], storage_path: str, spool_paths: list[str]
+    ) -> int:
         """
-        Save the compiled transcription JSON object to a file and database.
+        Normalize each transcription's segments into its own time-ordered spool file.
+
+        Only one transcription is held in memory at a time.
 
         Args:
-            compilation_data: The compiled transcription data
+            transcription_metadata: Transcriptions of the meeting
+            storage_path: Directory for the spool files
+            spool_paths: Receives the path of each spool as it is written
+
+        Returns:
+            Total number of segments spooled
+        """
+        loop = asyncio.get_running_loop()
+        segment_count = 0
+
+        for metadata in transcription_metadata:
+            transcript_id = metadata["id"]
+            user_id = metadata["user_id"]
+            filename = metadata["filename"]
+
+            await self.services.logging_service.info(
+                f"Processing transcription {transcript_id} for user {user_id}: {filename}"
+            )
+
+            # Retrieve the full transcription data
+            transcription_data = (
+                await self.services.transcription_file_service_manager.retrieve_transcription(
+                    transcript_id
+                )
+            )
+
+            if not transcription_data:
+                await self.services.logging_service.warning(
+                    f"Failed to retrieve transcription data for {transcript_id}, skipping..."
+                )
+                continue
+
+            # Extract segments from whisper data and normalize to standard format
+            whisper_data = transcription_data.get("whisper_data", {})
+            segments = []
+
+            for segment in whisper_data.get("segments", []):
+                # Extract only the meaningful data per text segment
+                normalized_segment = {
+                    "timestamp": {
+                        "start_time": segment.get("start", 0.0),
+                        "end_time": segment.get("end", 0.0),
+                    },
+                    "speaker": {
+                        "user_id": user_id,
+                        "user_transcription_file": filename,
+                    },
+                    "content": segment.get("text", "").strip(),
+                }
+                segments.append(normalized_segment)
+
+            # Whisper emits segments in order; only sort a transcript that is not
+            if any(
+                _segment_start(a) > _segment_start(b) for a, b in zip(segments, segments[1:])
+            ):
+                segments.sort(key=_segment_start)
+
+            spool_path = os.path.join(storage_path, f".{self.job_id}_{len(spool_paths)}.spool")
+            spool_paths.append(spool_path)
+            await loop.run_in_executor(None, _write_segment_spool, spool_path, segments)
+            segment_count += len(segments)
+
+        return segment_count
+
+    async def _ensure_storage_path(self) -> str:
+        """Create the compilations storage directory if needed and return it."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, lambda: os.makedirs(COMPILATIONS_STORAGE_PATH, exist_ok=True)
+        )
+        return COMPILATIONS_STORAGE_PATH
+
+    async def _save_compilation(
+        self, header: dict, spool_paths: list[str], storage_path: str
+    ) -> str:
+        """
+        Merge the segment spools into the compilation file and create its SQL entry.
+
+        Args:
+            header: Compilation fields written before the segments
+            spool_paths: Per-transcription spool files from _spool_transcriptions
+            storage_path: Compilations storage directory
 
         Returns:
             The compiled transcript ID
         """
-        import asyncio
-        import json
-        import os
         from datetime import datetime
 
-        import aiofiles
         from sqlalchemy import insert
 
         from source.server.sql_models import CompiledTranscriptsModel
-        from source.utils import calculate_file_sha256, generate_16_char_uuid
-
-        # Create compilations directory if it doesn't exist
-        base_path = "assets/data/transcriptions"
-        compilations_path = os.path.join(base_path, "compilations")
-        storage_path = os.path.join(compilations_path, "storage")
-
-        loop = asyncio.get_event_loop()
-        if not await loop.run_in_executor(None, os.path.exists, compilations_path):
-            await loop.run_in_executor(None, os.makedirs, compilations_path)
-        if not await loop.run_in_executor(None, os.path.exists, storage_path):
-            await loop.run_in_executor(None, os.makedirs, storage_path)
+        from source.utils import calculate_file_sha256
 
         # Generate filename: transcript_{meeting_id}.json
         filename = f"transcript_{self.meeting_id}.json"
         file_path = os.path.join(storage_path, filename)
 
-        # Save the JSON object to file
-        async with aiofiles.open(file_path, mode="w", encoding="utf-8") as f:
-            await f.write(json.dumps(compilation_data, indent=2, ensure_ascii=False))
+        # Stream the merged segments to file
+        loop = asyncio.get_running_loop()
+        segment_count = await loop.run_in_executor(
+            None, _write_compilation_file, file_path, header, spool_paths
+        )
 
         await self.services.logging_service.info(
-            f"Saved compilation to {filename} ({len(compilation_data['segments'])} segments)"
+            f"Saved compilation to {filename} ({segment_count} segments)"
         )
 
         # Calculate SHA256 hash
@@ -4,6 +4,8 @@ Transcription Job Manager Service.
 This service manages a queue of transcription jobs that are created when
 recording sessions are completed. It uses an event-based job queue that:
 - Processes one transcription job at a time
+- Transcribes the user tracks of a job concurrently, up to a configurable fan-out
+- Transcribes long tracks in overlapping time slices (see slicing.py)
 - Automatically activates when jobs are added
 - Remains idle when no jobs are pending
 - Tracks job status in the SQL database
@@ -11,8 +13,11 @@ recording sessions are completed. It uses an event-based job queue that:
 
 from __future__ import annotations
 
+import asyncio
+import os
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
 if TYPE_CHECKING:
     from source.context import Context
@@ -21,8 +26,96 @@ if TYPE_CHECKING:
 from source.server.sql_models import JobsStatus, JobsType
 from source.services.common.job import Job, JobQueue
 from source.services.manager import Manager
+from source.services.transcription.transcription_job_manager.slicing import (
+    SLICE_MAX_RETRIES,
+    AudioSlice,
+    extract_slice,
+    plan_slices,
+    stitch_whisper_results,
+)
+from source.services.transcription.transcription_job_manager.vad import (
+    VAD_ENABLED,
+    OffsetMap,
+    prepare_voiced_audio,
+    remap_whisper_timestamps,
+)
 from source.utils import generate_16_char_uuid, get_current_timestamp_est
 
+# Recordings of one meeting transcribed concurrently (0 = one per Whisper backend)
+TRANSCRIPTION_FAN_OUT = int(os.getenv("TRANSCRIPTION_FAN_OUT", "0"))
+
+# Once a job has held the GPU this long, new inferences wait for it to be released and re-acquired
+TRANSCRIPTION_GPU_MAX_HOLD_SECONDS = float(os.getenv("TRANSCRIPTION_GPU_MAX_HOLD_SECONDS", "60"))
+
+
+def transcription_fan_out(whisper_client: Any) -> int:
+    """
+    Number of recordings a transcription job processes concurrently.
+
+    Args:
+        whisper_client: The Whisper client (a WhisperServerPool exposes its size)
+
+    Returns:
+        TRANSCRIPTION_FAN_OUT if set, otherwise the number of Whisper backends
+    """
+    if TRANSCRIPTION_FAN_OUT > 0:
+        return TRANSCRIPTION_FAN_OUT
+    return max(1, getattr(whisper_client, "size", 1))
+
+
+class _SharedGPULock:
+    """
+    GPU lock shared by the concurrent inferences of one job.
+
+    The first inference to start acquires the GPU lock and the last one to
+    finish releases it, so other job types can still take the GPU between
+    a job's inferences. With a single inference in flight this is the same
+    as acquiring the lock per recording.
+
+    Once the lock has been held for max_hold_seconds, new inferences stop
+    joining and wait for it to be released and re-acquired, which bounds
+    how long other job types wait behind a busy job.
+    """
+
+    def __init__(
+        self,
+        gpu_resource_manager: Any,
+        max_hold_seconds: float = TRANSCRIPTION_GPU_MAX_HOLD_SECONDS,
+        **lock_kwargs: Any,
+    ):
+        self._gpu_resource_manager = gpu_resource_manager
+        self._max_hold_seconds = max_hold_seconds
+        self._lock_kwargs = lock_kwargs
+        self._holders = 0
+        self._lock_context = None
+        self._acquired_at = 0.0
+        self._transition = asyncio.Lock()
+        self._released = asyncio.Event()
+
+    @asynccontextmanager
+    async def hold(self) -> AsyncIterator[None]:
+        """Hold the GPU lock for the duration of the block."""
+        loop = asyncio.get_running_loop()
+        async with self._transition:
+            if self._holders and loop.time() - self._acquired_at >= self._max_hold_seconds:
+                await self._released.wait()
+            if self._holders == 0:
+                lock_context = self._gpu_resource_manager.acquire_lock(**self._lock_kwargs)
+                await lock_context.__aenter__()
+                self._lock_context = lock_context
+                self._acquired_at = loop.time()
+                self._released.clear()
+            self._holders += 1
+
+        try:
+            yield
+        finally:
+            self._holders -= 1
+            if self._holders == 0:
+                lock_context, self._lock_context = self._lock_context, None
+                await lock_context.__aexit__(None, None, None)
+                self._released.set()
+
 
 @dataclass
 class TranscriptionJob(Job):
@@ -67,16 +160,47 @@ class TranscriptionJob(Job):
             f"Starting transcription for meeting {self.meeting_id} with {len(self.recording_ids)} recordings"
         )
 
-        # Process each recording
-        for recording_id in self.recording_ids:
-            try:
-                await self._transcribe_recording(recording_id)
-            except Exception as e:
-                await self.services.logging_service.error(
-                    f"Failed to transcribe recording {recording_id}: {type(e).__name__}: {str(e)}"
-                )
-                # Continue with other recordings even if one fails
+        whisper_client = self.services.server.whisper_server_client
+        fan_out = transcription_fan_out(whisper_client)
+        slots = asyncio.Semaphore(fan_out)
+        gpu_lock = _SharedGPULock(
+            self.services.gpu_resource_manager,
+            job_type="transcription",
+            job_id=self.job_id,
+            metadata={"meeting_id": self.meeting_id},
+        )
+
+        await self.services.logging_service.info(
+            f"Transcribing up to {fan_out} recordings of meeting {self.meeting_id} concurrently"
+        )
+
+        async def transcribe(recording_id: str) -> tuple[str, str] | None:
+            async with slots:
+                try:
+                    return await self._transcribe_recording(recording_id, gpu_lock)
+                except Exception as e:
+                    await self.services.logging_service.error(
+                        f"Failed to transcribe recording {recording_id}: {type(e).__name__}: {str(e)}"
+                    )
+                    # Continue with other recordings even if one fails
+                    return None
+
+        # Process recordings concurrently, up to the fan-out
+        results = await asyncio.gather(
+            *(transcribe(recording_id) for recording_id in self.recording_ids)
+        )
+
+        # Record results in recording order, independent of completion order
+        for result in results:
+            if result is None:
                 continue
+            user_id, transcript_id = result
+
+            # Track the transcript ID for compilation
+            self.transcript_ids.append(transcript_id)
+
+            # Track user_id -> transcript_id mapping for SQL update
+            self.user_transcript_mapping[user_id] = transcript_id
 
         await self.services.logging_service.info(
             f"Completed transcription for meeting {self.meeting_id}"
@@ -86,15 +210,19 @@ class TranscriptionJob(Job):
     # Transcription Methods
     # -------------------------------------------------------------- #
 
-    async def _transcribe_recording(self, recording_id: str) -> None:
+    async def _transcribe_recording(
+        self, recording_id: str, gpu_lock: _SharedGPULock
+    ) -> tuple[str, str] | None:
         """
         Transcribe a single recording file.
 
         Args:
             recording_id: The recording ID to transcribe
-        """
-        import os
+            gpu_lock: GPU lock shared with the job's other recordings
 
+        Returns:
+            Tuple of (user_id, transcript_id), or None if the recording was not found
+        """
         # Get recording metadata from SQL
         recording = await self.services.sql_recording_service_manager.get_recording_by_id(
             recording_id
@@ -104,7 +232,7 @@ class TranscriptionJob(Job):
             await self.services.logging_service.warning(
                 f"Recording {recording_id} not found in database"
             )
-            return
+            return None
 
         user_id = recording["user_id"]
         filename = recording["filename"]
@@ -122,66 +250,72 @@ class TranscriptionJob(Job):
             await self.services.logging_service.error(
                 f"Recording file not found: {audio_file_path}"
             )
-            return
+            return None
+
+        # Trim silence on the CPU before taking the GPU lock
+        whisper_input_path, offset_map = await self._prepare_voiced_audio(
+            recording_id, audio_file_path
+        )
 
         # Send to Whisper for transcription WITH GPU LOCK
         try:
-            # Acquire GPU lock before calling Whisper
-            async with self.services.gpu_resource_manager.acquire_lock(
-                job_type="transcription",
-                job_id=self.job_id,
-                metadata={
-                    "meeting_id": self.meeting_id,
-                    "recording_id": recording_id,
-                    "user_id": user_id,
-                },
-            ):
-                # GPU is now locked - perform transcription
-                transcript_text = await self.services.server.whisper_server_client.inference(
-                    audio_path=audio_file_path,
-                    word_timestamps=True,
-                    response_format="verbose_json",
-                    temperature="0.0",
-                    temperature_inc="0.2",
-                    language="en",
-                )
-
+            if offset_map is not None and not offset_map.regions:
+                # Entire track is silent - nothing to send to Whisper
                 await self.services.logging_service.info(
-                    f"Successfully transcribed recording {recording_id}"
+                    f"Recording {recording_id} contains no voiced audio, skipping Whisper"
                 )
-
-                # Prepare transcript data
-                transcript_data = {
-                    "meeting_id": self.meeting_id,
-                    "user_id": user_id,
-                    "recording_id": recording_id,
-                    "whisper_data": transcript_text,
-                    "created_at": get_current_timestamp_est().isoformat(),
-                    "summary_layers": {},  # dict[int, dict[int, str]]
-                    "summary": "",  # Overall summary string
-                }
-
-                # Save transcription to file and database
-                # File will be saved as: data/transcriptions/storage/transcript_{meeting_id}_{user_id}_{transcript_id}.json
-                transcript_id, transcript_filename = (
-                    await self.services.transcription_file_service_manager.save_transcription(
-                        transcript_data=transcript_data,
-                        meeting_id=self.meeting_id,
-                        user_id=user_id,
+                transcript_text = {"text": "", "segments": []}
+            else:
+                # Duration of the audio sent to Whisper, used to decide on slicing
+                if offset_map is not None:
+                    audio_ms = offset_map.trimmed_ms
+                else:
+                    audio_ms = recording.get("duration_in_ms") or 0
+
+                slices = plan_slices(audio_ms)
+                if len(slices) > 1 and self.services.ffmpeg_service_manager:
+                    transcript_text = await self._transcribe_slices(
+                        recording_id, whisper_input_path, slices, audio_ms, gpu_lock
                     )
-                )
+                else:
+                    transcript_text = await self._inference(whisper_input_path, gpu_lock)
 
                 await self.services.logging_service.info(
-                    f"Saved transcription {transcript_id} to {transcript_filename}"
+                    f"Successfully transcribed recording {recording_id}"
                 )
 
-                # Track the transcript ID for compilation
-                self.transcript_ids.append(transcript_id)
+                # Map timestamps from the trimmed audio back onto the original recording
+                if offset_map is not None:
+                    transcript_text = remap_whisper_timestamps(transcript_text, offset_map)
+
+            # Prepare transcript data
+            transcript_data = {
+                "meeting_id": self.meeting_id,
+                "user_id": user_id,
+                "recording_id": recording_id,
+                "whisper_data": transcript_text,
+                "created_at": get_current_timestamp_est().isoformat(),
+                "summary_layers": {},  # dict[int, dict[int, str]]
+                "summary": "",  # Overall summary string
+            }
+            if offset_map is not None:
+                transcript_data["vad"] = offset_map.to_dict()
+
+            # Save transcription to file and database
+            # File will be saved as: data/transcriptions/storage/transcript_{meeting_id}_{user_id}_{transcript_id}.json
+            transcript_id, transcript_filename = (
+                await self.services.transcription_file_service_manager.save_transcription(
+                    transcript_data=transcript_data,
+                    meeting_id=self.meeting_id,
+                    user_id=user_id,
+                )
+            )
 
-                # Track user_id -> transcript_id mapping for SQL update
-                self.user_transcript_mapping[user_id] = transcript_id
+            await self.services.logging_service.info(
+                f"Saved transcription {transcript_id} to {transcript_filename}"
+            )
 
-            # GPU lock automatically released here
+            return user_id, transcript_id
 
         except Exception as e:
             await self.services.logging_service.error(
@@ -189,6 +323,143 @@ class TranscriptionJob(Job):
             )
             raise
 
+        finally:
+            if whisper_input_path != audio_file_path and os.path.exists(whisper_input_path):
+                os.remove(whisper_input_path)
+
+    async def _inference(self, audio_path: str, gpu_lock: _SharedGPULock) -> dict | str:
+        """
+        Send one audio file to Whisper while holding the GPU lock.
+
+        Args:
+            audio_path: Audio file to transcribe
+            gpu_lock: GPU lock shared with the job's other recordings
+
+        Returns:
+            Whisper's verbose_json response
+        """
+        # Hold the GPU lock (shared with this job's other recordings) while calling Whisper
+        async with gpu_lock.hold():
+            # GPU is now locked - perform transcription
+            return await self.services.server.whisper_server_client.inference(
+                audio_path=audio_path,
+                word_timestamps=True,
+                response_format="verbose_json",
+                temperature="0.0",
+                temperature_inc="0.2",
+                language="en",
+            )
+
+    async def _transcribe_slices(
+        self,
+        recording_id: str,
+        audio_path: str,
+        slices: list[AudioSlice],
+        total_ms: int,
+        gpu_lock: _SharedGPULock,
+    ) -> dict | str:
+        """
+        Transcribe a long track slice by slice and stitch the results.
+
+        Each slice is cut on the CPU, transcribed under its own GPU lock hold and
+        retried up to SLICE_MAX_RETRIES times on its own.
+
+        Args:
+            recording_id: The recording ID (used to name slice files)
+            audio_path: The audio sent to Whisper (trimmed or full track)
+            slices: Slices planned with plan_slices
+            total_ms: Duration of audio_path
+            gpu_lock: GPU lock shared with the job's other recordings
+
+        Returns:
+            Whisper's verbose_json response for the whole track
+        """
+        await self.services.logging_service.info(
+            f"Transcribing recording {recording_id} in {len(slices)} slices "
+            f"({total_ms / 1000:.1f}s of audio)"
+        )
+
+        ffmpeg_path = self.services.ffmpeg_service_manager.get_ffmpeg_path()
+        temp_path = self.services.recording_file_service_manager.get_temporary_storage_path()
+
+        results = []
+        for audio_slice in slices:
+            slice_path = os.path.join(
+                temp_path, f"slice_{self.job_id}_{recording_id}_{audio_slice.index}.wav"
+            )
+            try:
+                await extract_slice(ffmpeg_path, audio_path, slice_path, audio_slice)
+
+                attempt = 0
+                while True:
+                    try:
+                        whisper_data = await self._inference(slice_path, gpu_lock)
+                        break
+                    except Exception as e:
+                        if attempt >= SLICE_MAX_RETRIES:
+                            raise
+                        attempt += 1
+                        await self.services.logging_service.warning(
+                            f"Slice {audio_slice.index + 1}/{len(slices)} of recording "
+                            f"{recording_id} failed, retrying "
+                            f"(attempt {attempt}/{SLICE_MAX_RETRIES}): {e}"
+                        )
+            finally:
+                if os.path.exists(slice_path):
+                    os.remove(slice_path)
+
+            results.append((audio_slice, whisper_data))
+
+        return stitch_whisper_results(results, total_ms)
+
+    async def _prepare_voiced_audio(
+        self, recording_id: str, audio_file_path: str
+    ) -> tuple[str, OffsetMap | None]:
+        """
+        Trim silence from a recording before it is sent to Whisper.
+
+        Args:
+            recording_id: The recording ID (used to name the trimmed file)
+            audio_file_path: Path to the full recording
+
+        Returns:
+            Tuple of (path to send to Whisper, offset map or None if untrimmed).
+            An offset map with no regions means the recording is entirely silent.
+        """
+        if not VAD_ENABLED or not self.services.ffmpeg_service_manager:
+            return audio_file_path, None
+
+        temp_path = self.services.recording_file_service_manager.get_temporary_storage_path()
+        trimmed_path = os.path.join(temp_path, f"vad_{self.job_id}_{recording_id}.wav")
+
+        try:
+            offset_map = await prepare_voiced_audio(
+                ffmpeg_path=self.services.ffmpeg_service_manager.get_ffmpeg_path(),
+                input_path=audio_file_path,
+                output_path=trimmed_path,
+            )
+        except Exception as e:
+            await self.services.logging_service.warning(
+                f"Voice activity trimming failed for recording {recording_id}, "
+                f"sending full track: {e}"
+            )
+            return audio_file_path, None
+
+        if offset_map is None:
+            await self.services.logging_service.info(
+                f"Recording {recording_id} is mostly voiced, sending full track"
+            )
+            return audio_file_path, None
+
+        if offset_map.regions:
+            await self.services.logging_service.info(
+                f"Trimmed recording {recording_id} to {len(offset_map.regions)} voiced regions: "
+                f"{offset_map.trimmed_ms / 1000:.1f}s of {offset_map.total_ms / 1000:.1f}s"
+            )
+            return trimmed_path, offset_map
+
+        return audio_file_path, offset_map
+
 
 class BaseTranscriptionJobManagerService(Manager):
     """Base class for transcription job manager service."""
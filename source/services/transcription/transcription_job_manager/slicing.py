@@ -0,0 +1,211 @@
+"""
+Time-Sliced Transcription of Long Tracks.
+
+A multi-hour participant track sent to Whisper as one request holds the GPU
+for the whole inference, and a failure restarts the entire track. Long tracks
+are instead cut into fixed-duration slices that overlap their neighbours by a
+few seconds. Each slice is transcribed (and retried) on its own, and the
+results are stitched back together on the track timeline.
+
+Stitching:
+Consecutive slices share `overlap_ms` of audio. The cut between them is placed
+in the middle of the overlap; every segment is kept by the slice whose half of
+the overlap contains the segment's midpoint, so words spoken across a slice
+boundary are transcribed with context on both sides and appear exactly once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import os
+from dataclasses import dataclass
+
+# -------------------------------------------------------------- #
+# Configuration
+# -------------------------------------------------------------- #
+
+# Tracks longer than this are transcribed in slices (0 disables slicing)
+SLICE_SECONDS = int(os.getenv("TRANSCRIPTION_SLICE_SECONDS", "600"))
+SLICE_OVERLAP_SECONDS = int(os.getenv("TRANSCRIPTION_SLICE_OVERLAP_SECONDS", "5"))
+
+# Retries per slice before the whole recording is failed
+SLICE_MAX_RETRIES = int(os.getenv("TRANSCRIPTION_SLICE_RETRIES", "2"))
+
+SLICE_SAMPLE_RATE = 16000  # Whisper's native sample rate
+SLICE_CHANNELS = 1
+
+
+# -------------------------------------------------------------- #
+# Data Structures
+# -------------------------------------------------------------- #
+
+
+@dataclass
+class AudioSlice:
+    """
+    A slice of a track, in milliseconds on the track timeline.
+
+    Audio from start_ms to end_ms is transcribed; only segments whose midpoint
+    falls in [keep_start_ms, keep_end_ms) are kept when stitching.
+    """
+
+    index: int
+    start_ms: int
+    end_ms: int
+    keep_start_ms: int
+    keep_end_ms: int
+
+    @property
+    def duration_ms(self) -> int:
+        return self.end_ms - self.start_ms
+
+
+# -------------------------------------------------------------- #
+# Planning and Stitching
+# -------------------------------------------------------------- #
+
+
+def plan_slices(
+    total_ms: int,
+    slice_ms: int = SLICE_SECONDS * 1000,
+    overlap_ms: int = SLICE_OVERLAP_SECONDS * 1000,
+) -> list[AudioSlice]:
+    """
+    Cut a track into overlapping fixed-duration slices.
+
+    Args:
+        total_ms: Duration of the track
+        slice_ms: Duration of each slice (the last one may be shorter)
+        overlap_ms: Audio shared by consecutive slices
+
+    Returns:
+        Slices covering the track; a single slice if the track fits in one
+
+    Raises:
+        ValueError: If overlap_ms is not smaller than slice_ms
+    """
+    if slice_ms <= 0 or total_ms <= slice_ms:
+        return [AudioSlice(0, 0, total_ms, 0, total_ms)]
+    if not 0 <= overlap_ms < slice_ms:
+        raise ValueError("Slice overlap must be non-negative and shorter than the slice")
+
+    step_ms = slice_ms - overlap_ms
+    bounds = []
+    start_ms = 0
+    while True:
+        end_ms = min(start_ms + slice_ms, total_ms)
+        bounds.append((start_ms, end_ms))
+        if end_ms >= total_ms:
+            break
+        start_ms += step_ms
+
+    slices = []
+    for index, (start_ms, end_ms) in enumerate(bounds):
+        keep_start_ms = 0 if index == 0 else (start_ms + bounds[index - 1][1]) // 2
+        keep_end_ms = (
+            total_ms if index == len(bounds) - 1 else (bounds[index + 1][0] + end_ms) // 2
+        )
+        slices.append(AudioSlice(index, start_ms, end_ms, keep_start_ms, keep_end_ms))
+    return slices
+
+
+def stitch_whisper_results(
+    results: list[tuple[AudioSlice, dict | str]], total_ms: int
+) -> dict | str:
+    """
+    Merge per-slice Whisper responses into one response for the whole track.
+
+    Args:
+        results: (slice, verbose_json response) pairs in slice order
+        total_ms: Duration of the track
+
+    Returns:
+        A verbose_json-shaped dict with segment and word timestamps on the track
+        timeline (plain text responses are joined instead)
+    """
+    if any(not isinstance(whisper_data, dict) for _, whisper_data in results):
+        return " ".join(str(whisper_data).strip() for _, whisper_data in results).strip()
+
+    stitched = {key: value for key, value in results[0][1].items() if key != "segments"}
+    segments = []
+    for audio_slice, whisper_data in results:
+        offset_seconds = audio_slice.start_ms / 1000.0
+        for segment in whisper_data.get("segments", []) or []:
+            segment = copy.deepcopy(segment)
+            _shift_timestamps(segment, offset_seconds)
+            for word in segment.get("words", []) or []:
+                _shift_timestamps(word, offset_seconds)
+
+            midpoint_ms = (segment.get("start", 0.0) + segment.get("end", 0.0)) * 500.0
+            if audio_slice.keep_start_ms <= midpoint_ms < audio_slice.keep_end_ms or (
+                audio_slice.keep_end_ms == total_ms and midpoint_ms >= total_ms
+            ):
+                segment["id"] = len(segments)
+                segments.append(segment)
+
+    stitched["segments"] = segments
+    stitched["text"] = "".join(segment.get("text", "") for segment in segments)
+    stitched["duration"] = total_ms / 1000.0
+    return stitched
+
+
+def _shift_timestamps(item: dict, offset_seconds: float) -> None:
+    """Move a segment's or word's start/end from slice time to track time."""
+    for key in ("start", "end"):
+        if key in item:
+            item[key] = round(float(item[key]) + offset_seconds, 3)
+
+
+# -------------------------------------------------------------- #
+# File Pipeline
+# -------------------------------------------------------------- #
+
+
+async def extract_slice(
+    ffmpeg_path: str, input_path: str, output_path: str, audio_slice: AudioSlice
+) -> None:
+    """
+    Write one slice of an audio file to a 16 kHz mono WAV.
+
+    Args:
+        ffmpeg_path: FFmpeg executable
+        input_path: Track to cut (any format ffmpeg can decode)
+        output_path: Where to write the slice
+        audio_slice: The slice to extract
+
+    Raises:
+        RuntimeError: If ffmpeg fails
+    """
+    process = await asyncio.create_subprocess_exec(
+        ffmpeg_path,
+        "-nostdin",
+        "-v",
+        "error",
+        "-y",
+        "-ss",
+        f"{audio_slice.start_ms / 1000.0:.3f}",
+        "-t",
+        f"{audio_slice.duration_ms / 1000.0:.3f}",
+        "-i",
+        input_path,
+        "-ac",
+        str(SLICE_CHANNELS),
+        "-ar",
+        str(SLICE_SAMPLE_RATE),
+        output_path,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        _, stderr = await process.communicate()
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+    if process.returncode != 0:
+        raise RuntimeError(
+            f"ffmpeg failed to extract slice {audio_slice.index} of {input_path}: "
+            f"{stderr.decode('utf-8', errors='replace')}"
+        )
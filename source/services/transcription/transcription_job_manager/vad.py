@@ -0,0 +1,438 @@
+"""
+Voice Activity Trimming for Transcription.
+
+Per-user recordings are mostly silence: every 30s window a participant was quiet
+(or absent) is backfilled with SilentPCM. Sending that silence to Whisper costs
+GPU time for nothing, so before transcription we run a cheap CPU-side energy
+detector over the decoded audio, keep only the voiced regions, and record an
+offset map so that the timestamps Whisper returns for the trimmed audio can be
+translated back onto the original recording timeline.
+
+Pipeline:
+1. Decode the recording to 16 kHz mono s16le with ffmpeg (Whisper's native format)
+2. Compute per-frame RMS energy (dBFS) and threshold it into voiced regions
+3. Write the voiced regions, separated by a short silence spacer, to a WAV file
+4. After inference, remap segment/word timestamps with OffsetMap.to_original_seconds
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import copy
+import os
+import wave
+from dataclasses import dataclass, field
+
+import aiofiles
+import aiofiles.os
+import numpy as np
+
+# -------------------------------------------------------------- #
+# Configuration
+# -------------------------------------------------------------- #
+
+VAD_ENABLED = os.getenv("TRANSCRIPTION_VAD_ENABLED", "true").lower() == "true"
+VAD_THRESHOLD_DBFS = float(os.getenv("TRANSCRIPTION_VAD_THRESHOLD_DBFS", "-50"))
+
+# Skip trimming when it would remove less than this fraction of the audio
+VAD_MIN_SAVINGS_RATIO = float(os.getenv("TRANSCRIPTION_VAD_MIN_SAVINGS", "0.1"))
+
+VAD_SAMPLE_RATE = 16000  # Whisper's native sample rate
+VAD_CHANNELS = 1
+VAD_FRAME_MS = 30
+VAD_MIN_SPEECH_MS = 90  # Ignore clicks shorter than this
+VAD_PADDING_MS = 300  # Keep this much context around each voiced region
+VAD_MERGE_GAP_MS = 1000  # Merge regions separated by less than this
+VAD_SPACER_MS = 250  # Silence inserted between regions in the trimmed audio
+
+_SAMPLE_WIDTH = 2  # s16le
+_READ_CHUNK_BYTES = 1 << 16
+
+
+# -------------------------------------------------------------- #
+# Data Structures
+# -------------------------------------------------------------- #
+
+
+@dataclass
+class VoicedRegion:
+    """A voiced region of the original recording, in milliseconds."""
+
+    start_ms: int
+    end_ms: int
+
+    @property
+    def duration_ms(self) -> int:
+        return self.end_ms - self.start_ms
+
+
+@dataclass
+class OffsetMap:
+    """
+    Maps timestamps in the trimmed audio back to the original recording.
+
+    The trimmed audio is the concatenation of `regions`, each followed by
+    `spacer_ms` of silence (except the last).
+    """
+
+    regions: list[VoicedRegion]
+    total_ms: int
+    spacer_ms: int = VAD_SPACER_MS
+    _trimmed_starts: list[int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        starts = []
+        cursor = 0
+        for region in self.regions:
+            starts.append(cursor)
+            cursor += region.duration_ms + self.spacer_ms
+        self._trimmed_starts = starts
+
+    @property
+    def voiced_ms(self) -> int:
+        """Total duration of voiced audio kept."""
+        return sum(r.duration_ms for r in self.regions)
+
+    @property
+    def trimmed_ms(self) -> int:
+        """Duration of the trimmed audio (voiced audio plus spacers)."""
+        if not self.regions:
+            return 0
+        return self.voiced_ms + self.spacer_ms * (len(self.regions) - 1)
+
+    def to_original_ms(self, trimmed_ms: float, is_end: bool = False) -> float:
+        """
+        Translate a position in the trimmed audio to the original recording.
+
+        Args:
+            trimmed_ms: Position in the trimmed audio, in milliseconds
+            is_end: Whether this is an end timestamp; ends that fall exactly on a
+                region boundary are attributed to the preceding region
+
+        Returns:
+            Position in the original recording, in milliseconds
+        """
+        if not self.regions:
+            return trimmed_ms
+
+        if is_end:
+            index = bisect.bisect_left(self._trimmed_starts, trimmed_ms) - 1
+        else:
+            index = bisect.bisect_right(self._trimmed_starts, trimmed_ms) - 1
+        index = max(0, min(index, len(self.regions) - 1))
+
+        region = self.regions[index]
+        # Positions inside a spacer are clamped to the end of the preceding region
+        offset = min(max(trimmed_ms - self._trimmed_starts[index], 0), region.duration_ms)
+        return region.start_ms + offset
+
+    def to_original_seconds(self, trimmed_seconds: float, is_end: bool = False) -> float:
+        """Seconds variant of to_original_ms, rounded to milliseconds."""
+        return round(self.to_original_ms(trimmed_seconds * 1000.0, is_end=is_end) / 1000.0, 3)
+
+    def to_dict(self) -> dict:
+        """Serialize for storage alongside the transcript."""
+        return {
+            "total_ms": self.total_ms,
+            "voiced_ms": self.voiced_ms,
+            "spacer_ms": self.spacer_ms,
+            "regions": [[r.start_ms, r.end_ms] for r in self.regions],
+        }
+
+
+# -------------------------------------------------------------- #
+# Energy Detection
+# -------------------------------------------------------------- #
+
+
+def frame_energies_dbfs(
+    pcm: bytes,
+    sample_rate: int = VAD_SAMPLE_RATE,
+    channels: int = VAD_CHANNELS,
+    frame_ms: int = VAD_FRAME_MS,
+) -> np.ndarray:
+    """
+    Compute the RMS energy of each complete frame of s16le PCM, in dBFS.
+
+    Args:
+        pcm: Signed 16-bit little-endian PCM (interleaved if multi-channel)
+        sample_rate: Sample rate in Hz
+        channels: Number of interleaved channels
+        frame_ms: Frame length in milliseconds
+
+    Returns:
+        Array with one dBFS value per frame (digital silence is -inf)
+    """
+    samples_per_frame = sample_rate * frame_ms // 1000 * channels
+    samples = np.frombuffer(pcm, dtype="<i2")
+    frame_count = len(samples) // samples_per_frame
+    if frame_count == 0:
+        return np.empty(0, dtype=np.float64)
+
+    frames = samples[: frame_count * samples_per_frame].reshape(frame_count, samples_per_frame)
+    rms = np.sqrt(np.mean(frames.astype(np.float64) ** 2, axis=1))
+    with np.errstate(divide="ignore"):
+        return 20.0 * np.log10(rms / 32768.0)
+
+
+def detect_voiced_regions(
+    energies_dbfs: np.ndarray,
+    total_ms: int,
+    frame_ms: int = VAD_FRAME_MS,
+    threshold_dbfs: float = VAD_THRESHOLD_DBFS,
+    min_speech_ms: int = VAD_MIN_SPEECH_MS,
+    padding_ms: int = VAD_PADDING_MS,
+    merge_gap_ms: int = VAD_MERGE_GAP_MS,
+) -> list[VoicedRegion]:
+    """
+    Turn per-frame energies into padded, merged voiced regions.
+
+    Args:
+        energies_dbfs: Per-frame energies from frame_energies_dbfs
+        total_ms: Duration of the audio, used to clamp padded regions
+        frame_ms: Frame length the energies were computed with
+        threshold_dbfs: Frames louder than this are considered voiced
+        min_speech_ms: Discard voiced runs shorter than this
+        padding_ms: Context kept before and after each voiced run
+        merge_gap_ms: Merge runs whose padded gap is shorter than this
+
+    Returns:
+        Sorted, non-overlapping voiced regions in milliseconds
+    """
+    voiced = np.asarray(energies_dbfs) > threshold_dbfs
+    if not voiced.any():
+        return []
+
+    # Find run boundaries of consecutive voiced frames
+    padded = np.concatenate(([False], voiced, [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    run_starts, run_ends = edges[0::2], edges[1::2]
+
+    regions: list[VoicedRegion] = []
+    for start_frame, end_frame in zip(run_starts, run_ends):
+        if (end_frame - start_frame) * frame_ms < min_speech_ms:
+            continue
+
+        start_ms = max(0, int(start_frame) * frame_ms - padding_ms)
+        end_ms = min(total_ms, int(end_frame) * frame_ms + padding_ms)
+
+        if regions and start_ms - regions[-1].end_ms < merge_gap_ms:
+            regions[-1].end_ms = max(regions[-1].end_ms, end_ms)
+        else:
+            regions.append(VoicedRegion(start_ms=start_ms, end_ms=end_ms))
+
+    return regions
+
+
+def find_voiced_regions(
+    pcm: bytes,
+    sample_rate: int = VAD_SAMPLE_RATE,
+    channels: int = VAD_CHANNELS,
+    **kwargs,
+) -> list[VoicedRegion]:
+    """
+    Detect voiced regions in an in-memory s16le PCM buffer.
+
+    Args:
+        pcm: Signed 16-bit little-endian PCM
+        sample_rate: Sample rate in Hz
+        channels: Number of interleaved channels
+        **kwargs: Tuning parameters forwarded to detect_voiced_regions
+
+    Returns:
+        Sorted, non-overlapping voiced regions in milliseconds
+    """
+    frame_ms = kwargs.get("frame_ms", VAD_FRAME_MS)
+    energies = frame_energies_dbfs(pcm, sample_rate, channels, frame_ms)
+    total_ms = len(pcm) * 1000 // (sample_rate * channels * _SAMPLE_WIDTH)
+    return detect_voiced_regions(energies, total_ms, **kwargs)
+
+
+def extract_voiced_pcm(
+    pcm: bytes,
+    offset_map: OffsetMap,
+    sample_rate: int = VAD_SAMPLE_RATE,
+    channels: int = VAD_CHANNELS,
+) -> bytes:
+    """
+    Concatenate the voiced regions of an in-memory PCM buffer.
+
+    Args:
+        pcm: Signed 16-bit little-endian PCM
+        offset_map: Offset map describing the regions to keep
+        sample_rate: Sample rate in Hz
+        channels: Number of interleaved channels
+
+    Returns:
+        Trimmed PCM (regions separated by offset_map.spacer_ms of silence)
+    """
+    bytes_per_ms = sample_rate * channels * _SAMPLE_WIDTH // 1000
+    spacer = bytes(offset_map.spacer_ms * bytes_per_ms)
+
+    parts = []
+    for index, region in enumerate(offset_map.regions):
+        if index:
+            parts.append(spacer)
+        parts.append(pcm[region.start_ms * bytes_per_ms : region.end_ms * bytes_per_ms])
+    return b"".join(parts)
+
+
+# -------------------------------------------------------------- #
+# Whisper Result Remapping
+# -------------------------------------------------------------- #
+
+
+def remap_whisper_timestamps(whisper_data: dict | str, offset_map: OffsetMap) -> dict | str:
+    """
+    Translate segment and word timestamps from trimmed audio to the original recording.
+
+    Args:
+        whisper_data: verbose_json response from Whisper (plain text is returned unchanged)
+        offset_map: Offset map used to build the trimmed audio
+
+    Returns:
+        A copy of whisper_data with remapped timestamps
+    """
+    if not isinstance(whisper_data, dict):
+        return whisper_data
+
+    result = copy.deepcopy(whisper_data)
+    for segment in result.get("segments", []) or []:
+        if "start" in segment:
+            segment["start"] = offset_map.to_original_seconds(float(segment["start"]))
+        if "end" in segment:
+            segment["end"] = offset_map.to_original_seconds(float(segment["end"]), is_end=True)
+        for word in segment.get("words", []) or []:
+            if "start" in word:
+                word["start"] = offset_map.to_original_seconds(float(word["start"]))
+            if "end" in word:
+                word["end"] = offset_map.to_original_seconds(float(word["end"]), is_end=True)
+
+    if "duration" in result:
+        result["duration"] = offset_map.total_ms / 1000.0
+    return result
+
+
+# -------------------------------------------------------------- #
+# File Pipeline
+# -------------------------------------------------------------- #
+
+
+async def prepare_voiced_audio(
+    ffmpeg_path: str,
+    input_path: str,
+    output_path: str,
+    threshold_dbfs: float = VAD_THRESHOLD_DBFS,
+    min_savings_ratio: float = VAD_MIN_SAVINGS_RATIO,
+) -> OffsetMap | None:
+    """
+    Write the voiced regions of an audio file to a 16 kHz mono WAV.
+
+    The recording is decoded once with ffmpeg; decoded PCM is spooled to a
+    temporary file next to output_path while frame energies are computed, so
+    memory stays bounded for multi-hour tracks. File I/O runs off the event loop.
+
+    Args:
+        ffmpeg_path: FFmpeg executable
+        input_path: Recording to analyse (any format ffmpeg can decode)
+        output_path: Where to write the trimmed WAV
+        threshold_dbfs: Energy threshold for voiced frames
+        min_savings_ratio: Minimum fraction of audio that must be removed for trimming
+            to be worthwhile
+
+    Returns:
+        OffsetMap for the written file; an OffsetMap with no regions if the
+        recording is entirely silent (nothing is written); or None if trimming
+        would not save enough to be worth it (nothing is written)
+
+    Raises:
+        RuntimeError: If ffmpeg fails to decode the input
+    """
+    spool_path = f"{output_path}.pcm"
+    bytes_per_frame = VAD_SAMPLE_RATE * VAD_FRAME_MS // 1000 * VAD_CHANNELS * _SAMPLE_WIDTH
+
+    process = await asyncio.create_subprocess_exec(
+        ffmpeg_path,
+        "-nostdin",
+        "-v",
+        "error",
+        "-i",
+        input_path,
+        "-f",
+        "s16le",
+        "-ac",
+        str(VAD_CHANNELS),
+        "-ar",
+        str(VAD_SAMPLE_RATE),
+        "-",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    energies: list[np.ndarray] = []
+    total_bytes = 0
+    remainder = b""
+    try:
+        async with aiofiles.open(spool_path, "wb") as spool:
+            while True:
+                chunk = await process.stdout.read(_READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                await spool.write(chunk)
+                total_bytes += len(chunk)
+
+                data = remainder + chunk
+                usable = len(data) - len(data) % bytes_per_frame
+                if usable:
+                    energies.append(frame_energies_dbfs(data[:usable]))
+                remainder = data[usable:]
+
+        stderr = await process.stderr.read()
+        if await process.wait() != 0:
+            raise RuntimeError(
+                f"ffmpeg failed to decode {input_path}: {stderr.decode('utf-8', errors='replace')}"
+            )
+
+        total_ms = total_bytes * 1000 // (VAD_SAMPLE_RATE * VAD_CHANNELS * _SAMPLE_WIDTH)
+        all_energies = np.concatenate(energies) if energies else np.empty(0)
+        regions = detect_voiced_regions(all_energies, total_ms, threshold_dbfs=threshold_dbfs)
+        offset_map = OffsetMap(regions=regions, total_ms=total_ms)
+
+        if not regions:
+            return offset_map
+        if offset_map.trimmed_ms > total_ms * (1.0 - min_savings_ratio):
+            return None
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, _write_voiced_wav, spool_path, offset_map, output_path)
+        return offset_map
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        if await aiofiles.os.path.exists(spool_path):
+            await aiofiles.os.remove(spool_path)
+
+
+def _write_voiced_wav(pcm_path: str, offset_map: OffsetMap, output_path: str) -> None:
+    """Copy the voiced regions of a spooled PCM file into a WAV file (blocking)."""
+    bytes_per_ms = VAD_SAMPLE_RATE * VAD_CHANNELS * _SAMPLE_WIDTH // 1000
+    spacer = bytes(offset_map.spacer_ms * bytes_per_ms)
+
+    with open(pcm_path, "rb") as src, wave.open(output_path, "wb") as dst:
+        dst.setnchannels(VAD_CHANNELS)
+        dst.setsampwidth(_SAMPLE_WIDTH)
+        dst.setframerate(VAD_SAMPLE_RATE)
+
+        for index, region in enumerate(offset_map.regions):
+            if index:
+                dst.writeframes(spacer)
+            src.seek(region.start_ms * bytes_per_ms)
+            remaining = region.duration_ms * bytes_per_ms
+            while remaining > 0:
+                chunk = src.read(min(remaining, _READ_CHUNK_BYTES))
+                if not chunk:
+                    break
+                dst.writeframes(chunk)
+                remaining -= len(chunk)
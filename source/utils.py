@@ -2,7 +2,6 @@ import hashlib
 import logging
 import os
 import platform
-import subprocess
 import uuid
 from datetime import datetime
 from zoneinfo import ZoneInfo
@@ -69,8 +68,15 @@ async def calculate_file_sha256(file_path: str) -> str:
     return await loop.run_in_executor(None, _hash_file)
 
 
-def calculate_audio_file_duration_ms(file_path: str) -> int:
-    """Calculate the duration of an audio file in milliseconds."""
+async def probe_audio_file_duration_ms(file_path: str, timeout: float = 30.0) -> int:
+    """
+    Probe the duration of an audio file in milliseconds with ffprobe.
+
+    ffprobe runs as an asyncio subprocess, so probing does not block the event
+    loop. Returns 0 if the file can't be probed.
+    """
+    import asyncio
+
     ffprobe_executable = os.environ.get(
         (
             "WINDOWS_FFPROBE_PATH"
@@ -92,12 +98,30 @@ def calculate_audio_file_duration_ms(file_path: str) -> int:
     ]
 
     try:
-        output = subprocess.check_output(command, stderr=subprocess.STDOUT)
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+    except OSError as e:
+        logger.warning(f"Failed to run ffprobe for {file_path}: {e}")
+        return 0
+
+    try:
+        output, _ = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        logger.warning(f"ffprobe timed out for {file_path}")
+        return 0
+
+    try:
         duration = float(output)
-        return int(duration * 1000)  # Convert to milliseconds
-    except subprocess.CalledProcessError:
-        # TODO: Add proper logging service here
+    except ValueError:
+        logger.warning(f"ffprobe could not read duration of {file_path}: {output!r}")
         return 0
+    return int(duration * 1000)  # Convert to milliseconds
 
 
 # -------------------------------------------------------------- #
@@ -0,0 +1,51 @@
+"""
+Stub whisper.cpp server for wrapper tests.
+
+Accepts whisper-server's command line and serves its health check and
+/inference routes without a model. Each inference returns an empty
+transcription tagged with the stub's PID, so tests can tell which process
+answered. STUB_WHISPER_DELAY (seconds) slows every inference down.
+"""
+
+import argparse
+import json
+import os
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self._reply(200, {"status": "ok"})
+
+    def do_POST(self):
+        if self.path != "/inference":
+            self._reply(404, {"error": "not found"})
+            return
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(float(os.getenv("STUB_WHISPER_DELAY", "0")))
+        self._reply(200, {"text": "", "segments": [], "pid": os.getpid()})
+
+    def _reply(self, status: int, body: dict) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, required=True)
+    args, _ = parser.parse_known_args()
+
+    ThreadingHTTPServer((args.host, args.port), StubHandler).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -307,6 +307,54 @@ def mock_discord_user_in_voice(
     return mock_discord_context
 
 
+@pytest.fixture
+def make_session_handler():
+    """
+    Factory for a recorder DiscordSessionHandler with mocked services.
+
+    The handler has no voice connection, no FFmpeg manager and no bot. PCM
+    writes and MP3 transcodes are stubbed, so flushes only record calls.
+
+    Factory args:
+        meeting_id: Meeting the handler records
+        insert_temp_recordings: Replacement for the SQL batch insert; defaults to an
+            AsyncMock returning one "temp{index:012d}" id per row
+        queue_transcode: Replacement for _queue_pcm_to_mp3_transcode; defaults to an AsyncMock
+    """
+    from source.services.discord.discord_recorder_manager.manager import DiscordSessionHandler
+
+    def make(
+        meeting_id: str = "meeting-1",
+        insert_temp_recordings=None,
+        queue_transcode=None,
+    ) -> DiscordSessionHandler:
+        if insert_temp_recordings is None:
+            insert_temp_recordings = AsyncMock(
+                side_effect=lambda rows: [f"temp{index:012d}" for index in range(len(rows))]
+            )
+
+        context = MagicMock()
+        context.services_manager.logging_service = AsyncMock()
+        context.services_manager.ffmpeg_service_manager = None
+        context.services_manager.sql_recording_service_manager.insert_temp_recordings = (
+            insert_temp_recordings
+        )
+        context.bot = None
+        handler = DiscordSessionHandler(
+            discord_voice_client=MagicMock(),
+            channel_id=123,
+            meeting_id=meeting_id,
+            user_id="bot",
+            guild_id="guild-1",
+            context=context,
+        )
+        handler._write_pcm_to_temp = AsyncMock(return_value="/tmp/chunk.pcm")
+        handler._queue_pcm_to_mp3_transcode = queue_transcode or AsyncMock()
+        return handler
+
+    return make
+
+
 # ============================================================================
 # Database Fixtures - Environment-Aware
 # ============================================================================
@@ -0,0 +1,109 @@
+"""
+Unit tests for the batched AsyncLoggingService writer.
+
+The writer keeps the log file open and writes queued messages in batches.
+"""
+
+import asyncio
+import logging
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from source.services.logger import AsyncLoggingHandler, AsyncLoggingService
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def restore_root_handlers():
+    """on_start installs the logging bridge on the root logger; undo that afterwards."""
+    root_logger = logging.getLogger()
+    handlers = list(root_logger.handlers)
+    yield
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    for handler in handlers:
+        root_logger.addHandler(handler)
+
+
+async def _start_logger(tmp_path, **kwargs) -> AsyncLoggingService:
+    logger = AsyncLoggingService(
+        SimpleNamespace(server_manager=None),
+        log_dir=str(tmp_path),
+        log_file="test.log",
+        console_output=False,
+        **kwargs,
+    )
+    await logger.on_start(None)
+    return logger
+
+
+async def test_messages_are_written_in_batches(tmp_path, restore_root_handlers):
+    """Many log calls share a handful of writes to the open file."""
+    logger = await _start_logger(tmp_path, flush_interval=0.05)
+
+    writes = 0
+    original_write = logger._log_file_handle.write
+
+    async def counting_write(data):
+        nonlocal writes
+        writes += 1
+        return await original_write(data)
+
+    logger._log_file_handle.write = counting_write
+
+    for i in range(500):
+        await logger.info(f"message {i}")
+    await asyncio.wait_for(logger._log_queue.join(), timeout=5)
+
+    assert writes <= 5
+    await logger.on_close()
+
+    lines = (tmp_path / "test.log").read_text().splitlines()
+    assert [line.rsplit(" ", 1)[-1] for line in lines[1:]] == [str(i) for i in range(500)]
+
+
+async def test_drop_policy_bounds_queue(tmp_path, restore_root_handlers):
+    """With the drop policy a full queue discards messages and reports the count."""
+    logger = await _start_logger(tmp_path, flush_interval=0.05, max_queue_size=10, queue_full_policy="drop")
+    await asyncio.wait_for(logger._log_queue.join(), timeout=5)
+
+    # Nothing yields to the writer in between, so only the first 10 fit
+    for i in range(25):
+        await logger.info(f"message {i}")
+    assert logger._log_queue.qsize() == 10
+
+    await logger.on_close()
+
+    content = (tmp_path / "test.log").read_text()
+    assert "message 9" in content
+    assert "message 10" not in content
+    assert "dropped 15 messages" in content
+
+
+async def test_handler_accepts_records_from_other_threads(tmp_path, restore_root_handlers):
+    """Stdlib records emitted off the event loop thread reach the log file."""
+    logger = await _start_logger(tmp_path, flush_interval=0)
+    handler = AsyncLoggingHandler(logger)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    record_logger = logging.getLogger("test_async_logger.thread")
+    record_logger.propagate = False
+    record_logger.addHandler(handler)
+
+    try:
+        record_logger.warning("from loop thread")
+        thread = threading.Thread(target=record_logger.warning, args=("from worker thread",))
+        thread.start()
+        thread.join()
+
+        await asyncio.sleep(0.05)
+        await asyncio.wait_for(logger._log_queue.join(), timeout=5)
+    finally:
+        record_logger.removeHandler(handler)
+        await logger.on_close()
+
+    content = (tmp_path / "test.log").read_text()
+    assert "from loop thread" in content
+    assert "from worker thread" in content
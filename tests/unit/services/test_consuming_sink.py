@@ -0,0 +1,79 @@
+"""
+Unit tests for ConsumingWaveSink and the recorder's incremental sink reads.
+
+The flush cycle drains the sink instead of re-reading an ever-growing
+buffer, so memory for a long meeting stays bounded by one flush interval
+per user.
+"""
+
+import tracemalloc
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from source.services.discord.discord_recorder_manager.consuming_sink import ConsumingWaveSink
+from source.services.discord.discord_recorder_manager.manager import DiscordRecorderConstants
+
+pytestmark = pytest.mark.unit
+
+
+def test_consume_returns_new_data_only():
+    """Each consume hands over what was written since the previous one."""
+    sink = ConsumingWaveSink()
+    sink.write(b"ab", 1)
+    sink.write(b"cd", 1)
+    sink.write(b"xy", 2)
+
+    assert sink.consume(1) == b"abcd"
+    assert sink.consume(1) == b""
+
+    sink.write(b"ef", 1)
+    assert sink.consume_all() == {1: b"ef", 2: b"xy"}
+    assert sink.buffered_bytes() == 0
+    assert sink.bytes_written == {1: 6, 2: 2}
+
+
+async def test_three_hour_session_memory_is_bounded(make_session_handler):
+    """Simulated 3 hour meeting: resident audio never exceeds ~one flush per user."""
+    users = [1, 2]
+    interval_s = DiscordRecorderConstants.FLUSH_INTERVAL_SECONDS
+    cycles = 3 * 3600 // interval_s
+    block = b"\x01" * (DiscordRecorderConstants.BYTES_PER_MS * interval_s * 1000)
+
+    handler = make_session_handler()
+    handler._sink = ConsumingWaveSink()
+    start = datetime(2025, 1, 1, 12, 0, 0)
+    handler.start_time = start
+    clock = {"now": start}
+
+    windows = {user_id: 0 for user_id in users}
+
+    async def flush_user_window(user_id, chunk_idx, window_data):
+        # Don't keep references to the window, only count it
+        windows[user_id] += 1
+
+    handler._flush_user_window = flush_user_window
+
+    tracemalloc.start()
+    try:
+        with patch(
+            "source.services.discord.discord_recorder_manager.manager.get_current_timestamp_est",
+            side_effect=lambda: clock["now"],
+        ):
+            for cycle in range(1, cycles + 1):
+                for user_id in users:
+                    handler._sink.write(block, user_id)
+                clock["now"] = start + timedelta(seconds=cycle * interval_s)
+
+                await handler._extract_user_audio_from_sink()
+                await handler._flush_all_users()
+                assert handler._sink.buffered_bytes() == 0
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Without draining, the sink alone would hold ~2 GB per user by now
+    ceiling = len(users) * (len(block) + 2 * DiscordRecorderConstants.WINDOW_BYTES)
+    assert peak < ceiling
+    assert all(count >= cycles * interval_s // 30 - 1 for count in windows.values())
@@ -0,0 +1,173 @@
+"""
+Unit tests for append-only conversation persistence.
+
+Conversations are saved as a JSON snapshot plus a JSON Lines journal. Saving a
+message appends a constant amount of data, and reading a conversation replays
+the journal on top of the snapshot.
+"""
+
+import os
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from source.services.chat.conversation_file_manager.manager import (
+    ConversationFileManagerService,
+    replay_conversation_journal,
+)
+from source.services.chat.conversation_manager.in_memory_cache import (
+    Conversation,
+    Message,
+    MessageType,
+)
+from source.services.common.file_manager.manager import FileManagerService
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def conversation_files(tmp_path):
+    """Conversation file manager backed by a real file manager (no server)."""
+    context = SimpleNamespace(server_manager=None)
+    services = SimpleNamespace(logging_service=AsyncMock())
+
+    file_manager = FileManagerService(context, str(tmp_path))
+    file_manager.services = services
+    services.file_service_manager = file_manager
+
+    conversation_storage_path = tmp_path / "conversations"
+    conversation_storage_path.mkdir()
+    manager = ConversationFileManagerService(context, str(conversation_storage_path))
+    manager.services = services
+    return manager
+
+
+def _conversation(conversation_files) -> Conversation:
+    return Conversation(
+        thread_id="thread-1",
+        created_at=datetime(2025, 1, 1, 12, 0, 0),
+        guild_id="guild-1",
+        guild_name="Guild",
+        requester="user-1",
+        conversation_file_manager=conversation_files,
+    )
+
+
+def _message(i: int) -> Message:
+    return Message(
+        created_at=datetime(2025, 1, 1, 12, 0, 0),
+        message_type=MessageType.CHAT,
+        message_content=f"message {i} " + "x" * 200,
+        requester=f"user-{i % 3}",
+    )
+
+
+async def test_saves_append_and_reads_replay(conversation_files):
+    """Saved changes round-trip through snapshot + journal."""
+    conversation = _conversation(conversation_files)
+    conversation.add_message(_message(0))
+    assert await conversation.save_conversation()
+
+    for i in range(1, 6):
+        conversation.add_message(_message(i))
+        assert await conversation.save_conversation()
+
+    # Summary inserted mid-history and originals hidden, as context cleaning does
+    conversation.insert_message(3, _message(99))
+    conversation.set_message_context(0, False)
+    conversation.cleanup_log.append({"logs": ["cleaned"]})
+    assert await conversation.save_conversation()
+
+    journal_path = conversation_files._build_journal_path(conversation.filename)
+    assert os.path.exists(journal_path)
+
+    data = await conversation_files.retrieve_conversation(conversation.filename)
+    assert data == conversation.to_json()
+
+
+async def test_compaction_truncates_journal(conversation_files):
+    """Writing the full snapshot folds the journal into it."""
+    conversation = _conversation(conversation_files)
+    conversation.add_message(_message(0))
+    await conversation.save_conversation()
+    conversation.add_message(_message(1))
+    await conversation.save_conversation()
+
+    journal_path = conversation_files._build_journal_path(conversation.filename)
+    assert os.path.exists(journal_path)
+
+    await conversation_files.update_conversation(conversation.filename, conversation.to_json())
+    assert not os.path.exists(journal_path)
+    assert await conversation_files.retrieve_conversation(conversation.filename) == conversation.to_json()
+
+
+def test_replay_is_idempotent_and_skips_known_messages():
+    """Records already present in the snapshot are not applied twice."""
+    snapshot = {
+        "history": [{"uuid": "a", "is_context": True}, {"uuid": "b", "is_context": True}],
+        "cleanup_log": [{"n": 0}],
+    }
+    records = [
+        {"op": "message", "after": "b", "message": {"uuid": "b", "is_context": True}},
+        {"op": "message", "after": "b", "message": {"uuid": "c", "is_context": True}},
+        {"op": "message", "after": "a", "message": {"uuid": "s", "is_context": True}},
+        {"op": "context", "uuid": "a", "is_context": False},
+        {"op": "cleanup", "index": 0, "entry": {"n": 0}},
+        {"op": "cleanup", "index": 1, "entry": {"n": 1}},
+        {"op": "meta", "summary": "done"},
+    ]
+
+    replay_conversation_journal(snapshot, records)
+
+    assert [m["uuid"] for m in snapshot["history"]] == ["a", "s", "b", "c"]
+    assert snapshot["history"][0]["is_context"] is False
+    assert snapshot["cleanup_log"] == [{"n": 0}, {"n": 1}]
+    assert snapshot["summary"] == "done"
+
+
+async def test_long_thread_write_cost_stays_constant(conversation_files):
+    """A 2,000-message thread writes O(1) bytes per message."""
+    written: list[int] = []
+    file_manager = conversation_files.services.file_service_manager
+    for name in ("save_file", "update_file", "append_file"):
+        original = getattr(file_manager, name)
+
+        async def spy(filepath, data, _original=original):
+            written.append(len(data))
+            await _original(filepath, data)
+
+        setattr(file_manager, name, spy)
+
+    conversation = _conversation(conversation_files)
+    for i in range(2000):
+        conversation.add_message(_message(i))
+        assert await conversation.save_conversation()
+
+    snapshot_bytes = len(str(conversation.to_json()))
+    total_written = sum(written)
+
+    # Rewriting the snapshot on every save would write ~1000x the final snapshot size
+    assert total_written < 5 * snapshot_bytes
+    assert await conversation_files.retrieve_conversation(conversation.filename) == conversation.to_json()
+
+
+async def test_failed_journal_append_is_logged_and_snapshot_rewritten(conversation_files):
+    conversation = _conversation(conversation_files)
+    conversation.add_message(_message(0))
+    assert await conversation.save_conversation()
+
+    conversation.add_message(_message(1))
+    append = conversation_files.append_conversation_journal
+    conversation_files.append_conversation_journal = AsyncMock(side_effect=OSError("disk full"))
+    assert not await conversation.save_conversation()
+
+    logging_service = conversation_files.services.logging_service
+    assert "disk full" in logging_service.error.await_args.args[0]
+
+    # The next save writes the full snapshot, so message 1 is not lost
+    conversation_files.append_conversation_journal = append
+    assert await conversation.save_conversation()
+    data = await conversation_files.retrieve_conversation(conversation.filename)
+    assert len(data["history"]) == 2
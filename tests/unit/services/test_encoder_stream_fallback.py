@@ -0,0 +1,78 @@
+"""
+Unit tests for the recorder's fallback when a streaming encoder dies.
+
+A window the encoder took only part of is finished through the per-window
+transcode path (or a silence marker), starting where the encoder stopped, so
+no audio is written twice and the timeline doesn't shift.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from source.services.discord.discord_recorder_manager.manager import DiscordRecorderConstants
+
+pytestmark = pytest.mark.unit
+
+USER_ID = 111111111111111111
+WINDOW_MS = DiscordRecorderConstants.WINDOW_MS
+BYTES_PER_MS = DiscordRecorderConstants.BYTES_PER_MS
+
+
+class _DyingStream:
+    """Encoder stream that takes `accepted` bytes of the next push and then stops."""
+
+    def __init__(self, accepted: int):
+        self.accepted = accepted
+        self.bytes_processed = 0
+
+    async def push_to_stream(self, data) -> bool:
+        self.bytes_processed += min(self.accepted, len(data))
+        return self.accepted >= len(data)
+
+
+def _streaming_handler(make_session_handler, stream: _DyingStream):
+    handler = make_session_handler()
+    handler._get_encoder_stream = AsyncMock(return_value=stream)
+    handler._close_encoder_stream = AsyncMock()
+    return handler
+
+
+async def test_partially_streamed_window_transcodes_only_the_rest(make_session_handler):
+    handler = _streaming_handler(make_session_handler, _DyingStream(accepted=1000 * BYTES_PER_MS))
+    window = bytes(range(256)) * (DiscordRecorderConstants.WINDOW_BYTES // 256)
+
+    await handler._flush_user_window(USER_ID, 2, memoryview(window))
+
+    written = handler._write_pcm_to_temp.await_args.args[1]
+    assert bytes(written) == window[1000 * BYTES_PER_MS :]
+    [(_, row, _)] = handler._staged_temp_recordings
+    assert row["start_timestamp_ms"] == 2 * WINDOW_MS + 1000
+    assert USER_ID in handler._user_stream_fallback
+    handler._close_encoder_stream.assert_awaited_once_with(USER_ID)
+    # The whole window still counts towards the track length
+    assert handler.get_user_durations_ms()[USER_ID] == WINDOW_MS
+
+
+async def test_unaligned_take_is_rounded_down_to_whole_milliseconds(make_session_handler):
+    handler = _streaming_handler(make_session_handler, _DyingStream(accepted=BYTES_PER_MS + 7))
+    window = b"\x01" * DiscordRecorderConstants.WINDOW_BYTES
+
+    await handler._flush_user_window(USER_ID, 0, window)
+
+    written = handler._write_pcm_to_temp.await_args.args[1]
+    assert len(written) == len(window) - BYTES_PER_MS
+    [(_, row, _)] = handler._staged_temp_recordings
+    assert row["start_timestamp_ms"] == 1
+
+
+async def test_partially_streamed_silence_marks_only_the_rest(make_session_handler):
+    handler = _streaming_handler(make_session_handler, _DyingStream(accepted=4000 * BYTES_PER_MS))
+    handler._user_encoder_streams[USER_ID] = object()
+
+    await handler._flush_user_backfill(USER_ID, 3)
+
+    handler._write_pcm_to_temp.assert_not_awaited()
+    [(_, row, _)] = handler._staged_temp_recordings
+    assert row["start_timestamp_ms"] == 3 * WINDOW_MS + 4000
+    assert row["silence_ms"] == WINDOW_MS - 4000
@@ -0,0 +1,95 @@
+"""
+Unit tests for the streaming PCM to MP3 encoder.
+
+Runs a real FFmpeg process fed through stdin, the way the Discord recorder
+feeds one long-lived encoder per user.
+"""
+
+import os
+import shutil
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from source.services.discord.discord_recorder_manager.pcm_generator import SilentPCM
+from source.services.gpu.ffmpeg_manager.manager import FFmpegHandler
+
+pytestmark = pytest.mark.unit
+
+FFMPEG_PATH = os.getenv("FFMPEG_PATH") or shutil.which("ffmpeg")
+
+
+@pytest.fixture
+def ffmpeg_handler():
+    """FFmpeg handler backed by a minimal services stub."""
+    if not FFMPEG_PATH:
+        pytest.skip("FFmpeg not found")
+
+    services = SimpleNamespace(
+        file_service_manager=SimpleNamespace(
+            ensure_parent_dir=AsyncMock(),
+            _acquire_file_lock_oneshot=AsyncMock(),
+            _release_file_lock_oneshot=AsyncMock(),
+        ),
+        logging_service=AsyncMock(),
+    )
+    manager = SimpleNamespace(services=services)
+    return FFmpegHandler(manager, FFMPEG_PATH)
+
+
+async def test_stream_encodes_pushed_windows(ffmpeg_handler, tmp_path):
+    """Several pushed windows end up in one finalized MP3."""
+    output = tmp_path / "user_stream.mp3"
+    silence = SilentPCM(sample_rate=48000, channels=2)
+
+    stream = ffmpeg_handler.create_pcm_to_mp3_stream_process(str(output))
+    assert await stream.start_stream({"-codec:a": "libmp3lame", "-b:a": "128k", "-y": None})
+
+    for _ in range(3):
+        assert await stream.push_to_stream(silence.generate(2_000))
+
+    assert await stream.close_stream()
+    assert stream.get_stream_status()["bytes_processed"] == 3 * 2_000 * 192
+    assert output.stat().st_size > 0
+
+    file_service_manager = ffmpeg_handler.ffmpeg_service_manager.services.file_service_manager
+    file_service_manager._acquire_file_lock_oneshot.assert_awaited_once_with(str(output))
+    file_service_manager._release_file_lock_oneshot.assert_awaited_once_with(str(output))
+
+
+async def test_push_after_close_is_rejected(ffmpeg_handler, tmp_path):
+    """A closed stream refuses data so callers can fall back."""
+    stream = ffmpeg_handler.create_pcm_to_mp3_stream_process(str(tmp_path / "closed.mp3"))
+    assert await stream.start_stream({"-codec:a": "libmp3lame", "-y": None})
+    assert await stream.close_stream()
+
+    assert await stream.push_to_stream(b"\x00" * 3840) is False
+
+
+class _DyingStdin:
+    """stdin of an FFmpeg process that dies after taking `accepted_blocks` blocks."""
+
+    def __init__(self, accepted_blocks: int):
+        self.accepted_blocks = accepted_blocks
+        self.written = 0
+
+    def write(self, data) -> None:
+        self.written += len(data)
+
+    async def drain(self) -> None:
+        if self.accepted_blocks == 0:
+            raise BrokenPipeError
+        self.accepted_blocks -= 1
+
+
+async def test_failed_push_reports_bytes_taken(ffmpeg_handler, tmp_path):
+    """When FFmpeg dies mid-push, bytes_processed counts only the drained blocks."""
+    stream = ffmpeg_handler.create_pcm_to_mp3_stream_process(str(tmp_path / "dying.mp3"))
+    stream.subprocess = SimpleNamespace(stdin=_DyingStdin(accepted_blocks=2))
+    stream._is_running = True
+    block = stream.WRITE_BLOCK_BYTES
+
+    assert await stream.push_to_stream(b"\x00" * (5 * block)) is False
+    assert stream.bytes_processed == 2 * block
+    assert await stream.push_to_stream(b"\x00" * block) is False
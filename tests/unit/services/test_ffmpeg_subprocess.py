@@ -0,0 +1,88 @@
+"""
+Unit tests for FFmpegHandler's one-shot conversions.
+
+Conversions run as asyncio subprocesses instead of subprocess.run in the
+default executor, and a timed out or cancelled conversion kills FFmpeg.
+"""
+
+import asyncio
+import os
+import shutil
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from source.services.discord.discord_recorder_manager.pcm_generator import SilentPCM
+from source.services.gpu.ffmpeg_manager.manager import FFmpegHandler
+
+pytestmark = pytest.mark.unit
+
+FFMPEG_PATH = os.getenv("FFMPEG_PATH") or shutil.which("ffmpeg")
+
+# Realtime-paced silence, so the command runs for as long as the test needs
+SLOW_COMMAND = ["-re", "-f", "lavfi", "-i", "anullsrc", "-t", "30", "-f", "null", "-"]
+
+
+@pytest.fixture
+def ffmpeg_handler():
+    if not FFMPEG_PATH:
+        pytest.skip("FFmpeg not found")
+    return FFmpegHandler(SimpleNamespace(), FFMPEG_PATH)
+
+
+@pytest.fixture
+def spawned():
+    """Record every process started through asyncio.create_subprocess_exec."""
+    processes = []
+    original = asyncio.create_subprocess_exec
+
+    async def create_subprocess_exec(*args, **kwargs):
+        process = await original(*args, **kwargs)
+        processes.append(process)
+        return process
+
+    with patch("asyncio.create_subprocess_exec", create_subprocess_exec):
+        yield processes
+
+
+async def test_conversion_does_not_use_the_executor(ffmpeg_handler, tmp_path):
+    """convert_pcm_to_mp3 completes without taking a thread-pool thread."""
+    pcm = tmp_path / "chunk.pcm"
+    pcm.write_bytes(SilentPCM().generate(1_000))
+    mp3 = tmp_path / "chunk.mp3"
+
+    loop = asyncio.get_running_loop()
+    with patch.object(loop, "run_in_executor", side_effect=AssertionError("executor used")):
+        ok, _, stderr = await ffmpeg_handler.convert_pcm_to_mp3(str(pcm), str(mp3))
+
+    assert ok, stderr
+    assert mp3.stat().st_size > 0
+
+
+async def test_timeout_kills_ffmpeg(ffmpeg_handler, spawned):
+    ok, _, stderr = await ffmpeg_handler._run_ffmpeg([FFMPEG_PATH, *SLOW_COMMAND], timeout=0.5)
+
+    assert not ok
+    assert stderr == "FFmpeg process timed out"
+    assert spawned[0].returncode is not None
+
+
+async def test_cancellation_kills_ffmpeg(ffmpeg_handler, spawned):
+    task = asyncio.create_task(ffmpeg_handler._run_ffmpeg([FFMPEG_PATH, *SLOW_COMMAND]))
+    await asyncio.sleep(0.5)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert spawned[0].returncode is not None
+
+
+async def test_missing_executable_reports_failure(tmp_path):
+    handler = FFmpegHandler(SimpleNamespace(), str(tmp_path / "missing-ffmpeg"))
+
+    ok, _, stderr = await handler.convert_file("in.mp3", str(tmp_path / "out.wav"), {"-y": None})
+
+    assert not ok
+    assert stderr
+    assert await handler.validate_ffmpeg() is False
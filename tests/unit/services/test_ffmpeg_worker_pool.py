@@ -0,0 +1,119 @@
+"""
+Unit tests for the FFmpeg worker pool.
+
+FFmpegManagerService runs several workers over a MeetingFairQueue, so
+conversions for different meetings run in parallel and take turns instead
+of waiting behind one meeting's backlog.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from source.services.gpu.ffmpeg_manager.manager import (
+    FFJob,
+    FFmpegManagerService,
+    MeetingFairQueue,
+)
+
+pytestmark = pytest.mark.unit
+
+FFMPEG_SECONDS = 0.2
+
+
+def _job(meeting_id: str, index: int) -> FFJob:
+    return FFJob(
+        input_path=f"{meeting_id}_{index}.pcm",
+        output_path=f"{meeting_id}_{index}.mp3",
+        options={},
+        fut=asyncio.get_running_loop().create_future(),
+        is_pcm_to_mp3=True,
+        meeting_id=meeting_id,
+    )
+
+
+async def test_queue_alternates_between_meetings():
+    """A meeting with a large backlog does not delay another meeting's jobs."""
+    queue = MeetingFairQueue(maxsize=10)
+    for index in range(5):
+        await queue.put(_job("big", index))
+    for index in range(2):
+        await queue.put(_job("small", index))
+
+    order = [(await queue.get()).input_path for _ in range(7)]
+    assert order == [
+        "big_0.pcm",
+        "small_0.pcm",
+        "big_1.pcm",
+        "small_1.pcm",
+        "big_2.pcm",
+        "big_3.pcm",
+        "big_4.pcm",
+    ]
+    assert queue.empty()
+
+
+async def test_put_waits_for_a_free_slot():
+    """Like asyncio.Queue, put() blocks while the queue is full."""
+    queue = MeetingFairQueue(maxsize=1)
+    await queue.put(_job("a", 0))
+    assert queue.full()
+
+    blocked = asyncio.create_task(queue.put(_job("a", 1)))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    await queue.get()
+    await asyncio.wait_for(blocked, timeout=1)
+    assert queue.qsize() == 1
+
+
+class _StubFFmpegHandler:
+    """Stands in for FFmpeg: each conversion takes a fixed time."""
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.finished: list[str] = []
+
+    async def convert_pcm_to_mp3(self, input_path: str, output_path: str, bitrate: str):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(FFMPEG_SECONDS)
+        self.running -= 1
+        self.finished.append(input_path)
+        return True, "", ""
+
+
+async def test_pool_runs_meetings_in_parallel_and_fairly():
+    """Jobs run max_workers at a time, and a late small meeting is not starved."""
+    service = FFmpegManagerService(SimpleNamespace(server_manager=None), "ffmpeg", max_workers=2)
+    handler = _StubFFmpegHandler()
+    service.handler = handler
+    service.services = SimpleNamespace(
+        logging_service=AsyncMock(),
+        file_service_manager=SimpleNamespace(ensure_parent_dir=AsyncMock()),
+        sql_logging_service_manager=None,
+    )
+
+    for index in range(8):
+        assert await service.queue_pcm_to_mp3(
+            f"big_{index}.pcm", f"big_{index}.mp3", meeting_id="big"
+        )
+    assert await service.queue_pcm_to_mp3("small_0.pcm", "small_0.mp3", meeting_id="small")
+
+    try:
+        await asyncio.wait_for(_drain(handler, expected=9), timeout=5)
+    finally:
+        await service.on_close()
+
+    assert handler.max_running == 2
+    # The small meeting queued last but is served as soon as a worker frees up
+    assert handler.finished.index("small_0.pcm") < 4
+
+
+async def _drain(handler: _StubFFmpegHandler, expected: int):
+    while len(handler.finished) < expected:
+        await asyncio.sleep(0.01)
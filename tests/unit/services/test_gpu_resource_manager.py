@@ -0,0 +1,90 @@
+"""
+Unit tests for the GPU resource manager scheduler.
+
+The scheduler is event driven, so lock handoffs should not wait on a timer.
+No GPU is needed: the lock is pure bookkeeping.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from source.services.gpu.gpu_resource_manager.manager import GPUResourceManager
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+async def gpu_manager():
+    """GPU resource manager with its scheduler running (no services attached)."""
+    manager = GPUResourceManager(SimpleNamespace(server_manager=None))
+    await manager._start_scheduler()
+    yield manager
+    await manager._stop_scheduler()
+
+
+async def test_acquire_release_round_trips_are_fast(gpu_manager):
+    """Micro-benchmark: sequential round-trips don't pay a polling interval."""
+    rounds = 50
+    start = time.perf_counter()
+    for i in range(rounds):
+        async with gpu_manager.acquire_lock("chatbot", job_id=f"job-{i}"):
+            pass
+    elapsed = time.perf_counter() - start
+
+    # A 0.5s poll would need ~25s for 50 rounds
+    assert elapsed / rounds < 0.01
+    assert gpu_manager.get_status()["stats"]["total_chatbot_locks"] == rounds
+
+
+async def test_contended_lock_is_exclusive(gpu_manager):
+    """Concurrent jobs never hold the lock at the same time."""
+    holders = 0
+    max_holders = 0
+
+    async def job(job_type: str, i: int) -> None:
+        nonlocal holders, max_holders
+        async with gpu_manager.acquire_lock(job_type, job_id=f"{job_type}-{i}"):
+            holders += 1
+            max_holders = max(max_holders, holders)
+            await asyncio.sleep(0)
+            holders -= 1
+
+    job_types = ["transcription", "text_embedding", "summarization", "chatbot", "misc_chat_job"]
+    await asyncio.wait_for(
+        asyncio.gather(*(job(job_types[i % len(job_types)], i) for i in range(40))),
+        timeout=5,
+    )
+
+    assert max_holders == 1
+    assert not gpu_manager._gpu_lock.is_locked()
+
+
+async def test_cancelled_waiter_does_not_stall_queue(gpu_manager):
+    """A waiter cancelled while queued is skipped instead of blocking the GPU."""
+    release_first = asyncio.Event()
+
+    async def holder() -> None:
+        async with gpu_manager.acquire_lock("transcription", job_id="holder"):
+            await release_first.wait()
+
+    holder_task = asyncio.create_task(holder())
+    await asyncio.sleep(0.01)
+
+    abandoned = asyncio.create_task(_acquire_once(gpu_manager, "transcription", "abandoned"))
+    await asyncio.sleep(0.01)
+    abandoned.cancel()
+
+    release_first.set()
+    await holder_task
+
+    # The next request is served even though the abandoned one was queued first
+    await asyncio.wait_for(_acquire_once(gpu_manager, "transcription", "next"), timeout=1)
+    assert not gpu_manager._gpu_lock.is_locked()
+
+
+async def _acquire_once(manager: GPUResourceManager, job_type: str, job_id: str) -> None:
+    async with manager.acquire_lock(job_type, job_id=job_id):
+        pass
@@ -0,0 +1,158 @@
+"""
+Unit tests for coalesced job status logging.
+
+SQLLoggingManagerService buffers job status events and writes only the latest
+state of each job per flush interval (and on close).
+"""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from source.server.sql_models import JobsStatus, JobsType
+from source.services.common.sql_logging_manager.manager import SQLLoggingManagerService
+
+pytestmark = pytest.mark.unit
+
+MEETING_ID = "meeting-00000001"
+CREATED = datetime(2025, 1, 1, 12, 0, 0)
+STARTED = datetime(2025, 1, 1, 12, 0, 1)
+FINISHED = datetime(2025, 1, 1, 12, 0, 2)
+
+
+def _service(flush_interval: float) -> SQLLoggingManagerService:
+    service = SQLLoggingManagerService(
+        SimpleNamespace(server_manager=None), flush_interval=flush_interval
+    )
+    service.server = SimpleNamespace(sql_client=SimpleNamespace(execute=AsyncMock()))
+    service.services = SimpleNamespace(logging_service=AsyncMock())
+    return service
+
+
+async def _log_conversion(service: SQLLoggingManagerService, job_id: str) -> None:
+    """The three events FFmpegManagerService emits for one conversion."""
+    common = dict(
+        job_type=JobsType.TEMP_TRANSCODING, job_id=job_id, meeting_id=MEETING_ID, created_at=CREATED
+    )
+    await service.log_job_status_event(status=JobsStatus.PENDING, **common)
+    await service.log_job_status_event(
+        status=JobsStatus.IN_PROGRESS, started_at=STARTED, **common
+    )
+    await service.log_job_status_event(
+        status=JobsStatus.COMPLETED, finished_at=FINISHED, **common
+    )
+
+
+def _written(service: SQLLoggingManagerService) -> list[dict]:
+    return [
+        call.args[0].compile().params
+        for call in service.server.sql_client.execute.await_args_list
+    ]
+
+
+async def test_latest_status_per_job_is_written_once():
+    service = _service(flush_interval=60)
+    for index in range(10):
+        await _log_conversion(service, f"job{index:013d}")
+    service.server.sql_client.execute.assert_not_awaited()
+
+    assert await service.flush_job_status_events() == 10
+
+    written = _written(service)
+    assert len(written) == 10
+    assert all(params["status"] == JobsStatus.COMPLETED.value for params in written)
+    assert all(params["started_at"] == STARTED for params in written)
+    assert all(params["finished_at"] == FINISHED for params in written)
+    assert await service.flush_job_status_events() == 0
+
+
+async def test_flush_loop_and_close_write_pending_events():
+    service = _service(flush_interval=0.05)
+    service._flush_task = asyncio.create_task(service._flush_loop())
+    try:
+        await _log_conversion(service, "job0000000000001")
+        await asyncio.sleep(0.2)
+        assert len(_written(service)) == 1
+
+        # Buffered at shutdown: written by on_close
+        await service.log_job_status_event(
+            job_type=JobsType.TEMP_TRANSCODING,
+            job_id="job0000000000002",
+            meeting_id=MEETING_ID,
+            created_at=CREATED,
+            status=JobsStatus.PENDING,
+        )
+    finally:
+        await service.on_close()
+
+    assert [params["id"] for params in _written(service)] == [
+        "job0000000000001",
+        "job0000000000002",
+    ]
+
+
+async def test_failed_write_is_retried_on_next_flush():
+    service = _service(flush_interval=60)
+    service.server.sql_client.execute.side_effect = [ConnectionError("db restarting"), None]
+    await _log_conversion(service, "job0000000000001")
+
+    assert await service.flush_job_status_events() == 0
+    assert await service.flush_job_status_events() == 1
+
+    written = _written(service)
+    assert [params["status"] for params in written] == [JobsStatus.COMPLETED.value] * 2
+    assert await service.flush_job_status_events() == 0
+
+
+async def test_newer_event_wins_over_failed_write():
+    """An event logged while its job's write fails keeps its status; gaps are filled in."""
+    service = _service(flush_interval=60)
+    common = dict(
+        job_type=JobsType.TRANSCRIBING,
+        job_id="job0000000000001",
+        meeting_id=MEETING_ID,
+        created_at=CREATED,
+    )
+    await service.log_job_status_event(status=JobsStatus.IN_PROGRESS, started_at=STARTED, **common)
+
+    calls = []
+
+    async def fail_first_write(stmt):
+        calls.append(stmt)
+        if len(calls) == 1:
+            # The job finishes while its IN_PROGRESS write is failing
+            await service.log_job_status_event(
+                status=JobsStatus.COMPLETED, finished_at=FINISHED, **common
+            )
+            raise ConnectionError("db restarting")
+
+    service.server.sql_client.execute.side_effect = fail_first_write
+
+    assert await service.flush_job_status_events() == 0
+    assert await service.flush_job_status_events() == 1
+
+    final = _written(service)[-1]
+    assert final["status"] == JobsStatus.COMPLETED.value
+    assert final["started_at"] == STARTED
+    assert final["finished_at"] == FINISHED
+
+
+async def test_zero_interval_writes_through():
+    service = _service(flush_interval=0)
+    await _log_conversion(service, "job0000000000001")
+    assert len(_written(service)) == 3
+
+
+async def test_invalid_event_is_rejected_immediately():
+    service = _service(flush_interval=60)
+    with pytest.raises(ValueError):
+        await service.log_job_status_event(
+            job_type=JobsType.TEMP_TRANSCODING,
+            job_id="short",
+            meeting_id=MEETING_ID,
+            created_at=CREATED,
+            status=JobsStatus.PENDING,
+        )
@@ -0,0 +1,102 @@
+"""
+Unit tests for the keyed job queue.
+
+Jobs sharing a key run in order, different keys run in parallel, and the
+number of jobs executing at once never exceeds max_concurrency.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+
+from source.services.common.job import Job, JobStatus, KeyedJobQueue
+
+pytestmark = pytest.mark.unit
+
+
+@dataclass
+class RecordingJob(Job):
+    """Job that records start/finish order and sleeps to simulate work."""
+
+    key: str = ""
+    duration: float = 0.01
+    fail_times: int = 0
+    log: list = field(default_factory=list)
+    tracker: dict = field(default_factory=dict)
+
+    async def execute(self) -> None:
+        self.tracker["running"] = self.tracker.get("running", 0) + 1
+        self.tracker["peak"] = max(self.tracker.get("peak", 0), self.tracker["running"])
+        self.log.append(("start", self.job_id))
+        try:
+            await asyncio.sleep(self.duration)
+            if self.fail_times > 0:
+                self.fail_times -= 1
+                raise RuntimeError("transient")
+        finally:
+            self.tracker["running"] -= 1
+            self.log.append(("end", self.job_id))
+
+
+async def test_same_key_jobs_run_in_order():
+    """Jobs for one key never overlap and keep FIFO order."""
+    log: list = []
+    tracker: dict = {}
+    queue = KeyedJobQueue(key_fn=lambda job: job.key, max_concurrency=4)
+
+    for i in range(5):
+        await queue.add_job(RecordingJob(job_id=f"a{i}", key="a", log=log, tracker=tracker))
+    await asyncio.wait_for(queue.wait_until_empty(), timeout=2)
+
+    assert log == [event for i in range(5) for event in (("start", f"a{i}"), ("end", f"a{i}"))]
+    assert tracker["peak"] == 1
+    await queue.stop()
+
+
+async def test_different_keys_run_in_parallel_up_to_limit():
+    """Distinct keys overlap, bounded by max_concurrency."""
+    tracker: dict = {}
+    completed: list[str] = []
+    queue = KeyedJobQueue(
+        key_fn=lambda job: job.key,
+        max_concurrency=3,
+        on_job_complete=lambda job: completed.append(job.job_id),
+    )
+
+    jobs = [RecordingJob(job_id=f"t{i}", key=f"thread-{i}", duration=0.05, tracker=tracker) for i in range(6)]
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for job in jobs:
+        await queue.add_job(job)
+    await asyncio.wait_for(queue.wait_until_empty(), timeout=2)
+    elapsed = loop.time() - start
+
+    assert tracker["peak"] == 3
+    # Six 50ms jobs, three at a time: about two rounds rather than six
+    assert elapsed < 0.25
+    assert sorted(completed) == sorted(job.job_id for job in jobs)
+    assert queue.get_statistics()["total_processed"] == 6
+    await queue.stop()
+
+
+async def test_retry_stays_ahead_of_later_jobs_for_key():
+    """A retried job runs again before the next job queued under its key."""
+    log: list = []
+    failed: list[str] = []
+    queue = KeyedJobQueue(
+        key_fn=lambda job: job.key,
+        max_retries=1,
+        on_job_failed=lambda job: failed.append(job.job_id),
+    )
+
+    flaky = RecordingJob(job_id="flaky", key="a", fail_times=1, log=log)
+    after = RecordingJob(job_id="after", key="a", log=log)
+    await queue.add_job(flaky)
+    await queue.add_job(after)
+    await asyncio.wait_for(queue.wait_until_empty(), timeout=2)
+
+    assert [job_id for event, job_id in log if event == "start"] == ["flaky", "flaky", "after"]
+    assert flaky.status == JobStatus.COMPLETED
+    assert failed == []
+    await queue.stop()
@@ -0,0 +1,66 @@
+"""
+Unit tests for the recorder's per-user PCM window buffer.
+
+Windows are handed out as memoryviews: slices of the appended blocks when a
+window fits in one block, a single join otherwise. Nothing is shifted.
+"""
+
+import pytest
+
+from source.services.discord.discord_recorder_manager.manager import DiscordRecorderConstants
+from source.services.discord.discord_recorder_manager.window_buffer import PCMWindowBuffer
+
+pytestmark = pytest.mark.unit
+
+WINDOW_BYTES = DiscordRecorderConstants.WINDOW_BYTES
+FRAME_BYTES = DiscordRecorderConstants.FRAME_BYTES
+
+
+def test_take_returns_data_in_order():
+    """Windows come out in order, whether inside one block or across several."""
+    buffer = PCMWindowBuffer()
+    buffer.extend(b"abcdef")
+    buffer.extend(bytearray(b"gh"))
+    buffer.extend(b"ijkl")
+
+    assert len(buffer) == 12
+    assert buffer.take(4) == b"abcd"
+    assert buffer.take(5) == b"efghi"
+    assert len(buffer) == 3
+    assert buffer.take_all() == b"jkl"
+    assert len(buffer) == 0
+
+    with pytest.raises(ValueError):
+        buffer.take(1)
+
+
+def test_window_inside_one_block_is_not_copied():
+    """A window that fits in an appended block is a view of that block."""
+    block = bytes(2 * WINDOW_BYTES)
+    buffer = PCMWindowBuffer()
+    buffer.extend(block)
+
+    window = buffer.take(WINDOW_BYTES)
+    assert window.obj is block
+    assert len(window) == WINDOW_BYTES
+
+
+def test_windows_match_bytearray_slicing():
+    """Uneven blocks and gap padding produce the same windows as slicing one bytearray."""
+    blocks = [bytes([i + 1]) * (WINDOW_BYTES // 3 + i * FRAME_BYTES) for i in range(10)]
+    blocks.insert(4, bytes(3 * FRAME_BYTES))
+
+    reference = bytearray()
+    buffer = PCMWindowBuffer()
+    expected, windows = [], []
+    for block in blocks:
+        reference.extend(block)
+        buffer.extend(block)
+        while len(reference) >= WINDOW_BYTES:
+            expected.append(bytes(reference[:WINDOW_BYTES]))
+            del reference[:WINDOW_BYTES]
+        while len(buffer) >= WINDOW_BYTES:
+            windows.append(bytes(buffer.take(WINDOW_BYTES)))
+
+    assert windows == expected
+    assert bytes(buffer.take_all()) == bytes(reference)
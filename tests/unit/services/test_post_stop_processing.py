@@ -0,0 +1,111 @@
+"""
+Unit tests for concurrent post-stop recording processing.
+
+Each user's final track is assembled independently, so after /stop the
+users are processed concurrently up to POST_STOP_MAX_CONCURRENCY.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from source.services.discord.discord_recorder_manager.manager import (
+    DiscordRecorderConstants,
+    DiscordRecorderManagerService,
+)
+
+pytestmark = pytest.mark.unit
+
+FFMPEG_SECONDS = 0.3
+
+
+class _StubFFmpegHandler:
+    """Stands in for FFmpeg: each concatenation takes a fixed time."""
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def convert_file(self, input_path: str, output_path: str, options: dict):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(FFMPEG_SECONDS)
+        with open(output_path, "wb") as f:
+            f.write(b"mp3")
+        self.running -= 1
+        return True, "", ""
+
+
+def _manager(tmp_path, handler: _StubFFmpegHandler) -> DiscordRecorderManagerService:
+    manager = DiscordRecorderManagerService.__new__(DiscordRecorderManagerService)
+    manager.context = SimpleNamespace(
+        bot=SimpleNamespace(fetch_guild=AsyncMock()),
+        is_shutting_down=lambda: False,
+    )
+    manager.services = SimpleNamespace(
+        logging_service=AsyncMock(),
+        ffmpeg_service_manager=SimpleNamespace(handler=handler),
+        recording_file_service_manager=SimpleNamespace(
+            get_temporary_storage_path=lambda: str(tmp_path),
+            get_persistent_storage_path=lambda: str(tmp_path),
+        ),
+        sql_recording_service_manager=SimpleNamespace(
+            get_temp_recordings_for_meeting=AsyncMock(),
+            insert_persistent_recording=AsyncMock(
+                side_effect=lambda user_id, **_: f"recording-{user_id}"
+            ),
+            get_meeting=AsyncMock(return_value={"guild_id": "1"}),
+            update_meeting_recording_files=AsyncMock(),
+            create_transcription_job_for_completed_meeting=AsyncMock(),
+        ),
+        sql_logging_service_manager=None,
+    )
+    return manager
+
+
+def _temp_recordings(tmp_path, users: int) -> list[dict]:
+    recordings = []
+    for user in range(users):
+        for chunk in range(2):
+            filename = f"meeting-1_user{user}_chunk{chunk:04d}.pcm"
+            (tmp_path / filename.replace(".pcm", ".mp3")).write_bytes(b"mp3")
+            recordings.append(
+                {"user_id": str(user), "filename": filename, "timestamp_ms": chunk * 30_000}
+            )
+    return recordings
+
+
+async def test_users_are_processed_concurrently_up_to_the_limit(tmp_path):
+    """Time to transcription start follows the slowest batch, not the sum of users."""
+    users = 6
+    handler = _StubFFmpegHandler()
+    manager = _manager(tmp_path, handler)
+    sql = manager.services.sql_recording_service_manager
+    sql.get_temp_recordings_for_meeting.return_value = _temp_recordings(tmp_path, users)
+
+    with patch.object(DiscordRecorderConstants, "POST_STOP_MAX_CONCURRENCY", 3):
+        start = time.perf_counter()
+        await manager._process_recordings_post_stop(
+            meeting_id="meeting-1", user_durations_ms={"0": 45_000}
+        )
+        elapsed = time.perf_counter() - start
+
+    # Sequentially this would take users * FFMPEG_SECONDS
+    assert elapsed < (users / 3 + 1) * FFMPEG_SECONDS
+    assert handler.max_running == 3
+
+    # Known durations are passed through, the rest are probed by the SQL service
+    durations = {
+        call.kwargs["user_id"]: call.kwargs["duration_ms"]
+        for call in sql.insert_persistent_recording.await_args_list
+    }
+    assert durations == {str(user): (45_000 if user == 0 else None) for user in range(users)}
+
+    mapping = sql.update_meeting_recording_files.await_args.kwargs["user_recording_mapping"]
+    assert mapping == {str(user): f"recording-{user}" for user in range(users)}
+    sql.create_transcription_job_for_completed_meeting.assert_awaited_once_with(
+        meeting_id="meeting-1"
+    )
@@ -0,0 +1,99 @@
+"""
+Unit tests for recording durations.
+
+The recorder computes each user's track duration from the PCM it emitted, so
+persistent recordings are inserted without probing the final file. When a
+probe is needed it runs ffprobe as an asyncio subprocess.
+"""
+
+import os
+import shutil
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from source.services.discord.discord_recorder_manager.manager import (
+    DiscordRecorderConstants,
+    DiscordSessionHandler,
+)
+from source.services.discord.discord_recorder_manager.pcm_generator import SilentPCM
+from source.services.discord.discord_recorder_manager.window_buffer import PCMWindowBuffer
+from source.services.gpu.ffmpeg_manager.manager import FFmpegHandler
+from source.utils import probe_audio_file_duration_ms
+
+pytestmark = pytest.mark.unit
+
+FFMPEG_PATH = os.getenv("FFMPEG_PATH") or shutil.which("ffmpeg")
+FFPROBE_PATH = shutil.which("ffprobe")
+WINDOW_MS = DiscordRecorderConstants.WINDOW_MS
+
+
+async def test_track_duration_is_computed_from_emitted_pcm(make_session_handler):
+    """Backfilled windows, full windows and the final partial window all count."""
+    handler = make_session_handler()
+    speaker, listener = 1, 2
+
+    await handler._flush_user_backfill(user_id=speaker, chunk_idx=0)
+    await handler._flush_user_window(
+        user_id=speaker, chunk_idx=1, window_data=b"\x01" * DiscordRecorderConstants.WINDOW_BYTES
+    )
+    partial = SilentPCM().generate(1_250)
+    await handler._flush_user_window(user_id=speaker, chunk_idx=2, window_data=partial)
+    for chunk_idx in range(3):
+        await handler._flush_user_backfill(user_id=listener, chunk_idx=chunk_idx)
+
+    assert handler.get_user_durations_ms() == {
+        speaker: 2 * WINDOW_MS + 1_250,
+        listener: 3 * WINDOW_MS,
+    }
+
+
+async def _flush(handler: DiscordSessionHandler, user_id: int, pcm: bytes, force: bool) -> None:
+    buffer = handler._user_audio_buffers.setdefault(user_id, PCMWindowBuffer())
+    handler._user_chunk_counters.setdefault(user_id, 0)
+    buffer.extend(pcm)
+    await handler._flush_all_users(force=force)
+
+
+async def test_duration_after_pause_counts_the_partial_window(make_session_handler):
+    """
+    Pausing emits a partial window but the chunk counter keeps counting, so the
+    window after resume starts a new 30s slot; only the emitted audio counts.
+    """
+    handler = make_session_handler()
+    speaker = 1
+    audio = b"\x01" * DiscordRecorderConstants.BYTES_PER_MS
+
+    # 30s window, then 10s flushed by pause_recording's forced flush
+    await _flush(handler, speaker, audio * (WINDOW_MS + 10_000), force=True)
+    await handler._clear_audio_buffers()
+    # After resume: one more full window, then stop with 5s left over
+    await _flush(handler, speaker, audio * WINDOW_MS, force=False)
+    await _flush(handler, speaker, audio * 5_000, force=True)
+
+    assert handler._user_chunk_counters[speaker] == 4
+    assert handler.get_user_durations_ms() == {speaker: WINDOW_MS + 10_000 + WINDOW_MS + 5_000}
+
+
+async def test_probe_failure_returns_zero(tmp_path):
+    """A missing ffprobe is reported as an unknown (0) duration, not an exception."""
+    with patch.dict(
+        os.environ,
+        {"MAC_FFPROBE_PATH": str(tmp_path / "missing-ffprobe"), "WINDOWS_FFPROBE_PATH": ""},
+    ):
+        assert await probe_audio_file_duration_ms(str(tmp_path / "track.mp3")) == 0
+
+
+async def test_probe_reads_duration(tmp_path):
+    if not (FFMPEG_PATH and FFPROBE_PATH):
+        pytest.skip("FFmpeg/ffprobe not found")
+
+    track = tmp_path / "track.mp3"
+    handler = FFmpegHandler(SimpleNamespace(), FFMPEG_PATH)
+    assert (await handler.generate_silent_mp3(str(track), 2_000))[0]
+
+    with patch.dict(os.environ, {"MAC_FFPROBE_PATH": FFPROBE_PATH}):
+        duration_ms = await probe_audio_file_duration_ms(str(track))
+
+    assert abs(duration_ms - 2_000) < 100
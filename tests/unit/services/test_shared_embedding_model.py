@@ -0,0 +1,145 @@
+"""
+Unit tests for the shared, reference-counted embedding model.
+
+Uses a fake handler so load/offload counts can be checked without
+sentence-transformers or a GPU.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from source.services.gpu.gpu_resource_manager.manager import GPUResourceManager
+from source.services.transcription.text_embedding_manager.manager import (
+    EMBEDDING_MODEL_GPU_JOB_TYPES,
+    SharedEmbeddingModel,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FakeHandler:
+    """Stand-in for EmbeddingModelHandler that records lifecycle calls."""
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self.model = None
+        self.loads = 0
+        self.offloads = 0
+
+    def load_model(self) -> None:
+        self.model = object()
+        self.loads += 1
+
+    def offload_model(self) -> None:
+        self.model = None
+        self.offloads += 1
+
+    def is_loaded(self) -> bool:
+        return self.model is not None
+
+    def encode(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
+        if not self.is_loaded():
+            raise ValueError("Model is not loaded")
+        return [[float(len(t))] for t in texts]
+
+
+def _shared(idle_timeout: float) -> SharedEmbeddingModel:
+    return SharedEmbeddingModel("fake-model", idle_timeout=idle_timeout, handler_factory=FakeHandler)
+
+
+async def test_back_to_back_uses_load_once():
+    """Sequential jobs reuse the resident model."""
+    shared = _shared(idle_timeout=60)
+
+    for _ in range(5):
+        async with shared.use() as handler:
+            assert handler.encode(["abc"]) == [[3.0]]
+
+    assert handler.loads == 1
+    assert handler.offloads == 0
+    assert shared.ref_count == 0
+    await shared.close()
+    assert handler.offloads == 1
+
+
+async def test_concurrent_users_share_one_load():
+    """Concurrent references load the model once and keep it loaded."""
+    shared = _shared(idle_timeout=60)
+
+    async def user() -> None:
+        async with shared.use():
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(user() for _ in range(10)))
+
+    assert shared.get_status()["load_count"] == 1
+    assert shared.get_status()["use_count"] == 10
+    await shared.close()
+
+
+async def test_idle_model_is_evicted():
+    """The model is offloaded once idle for idle_timeout."""
+    shared = _shared(idle_timeout=0.05)
+
+    async with shared.use() as handler:
+        pass
+    assert shared.is_loaded()
+
+    await asyncio.sleep(0.15)
+    assert not shared.is_loaded()
+    assert handler.offloads == 1
+
+
+async def test_use_during_idle_window_cancels_eviction():
+    """Using the model again before the timeout keeps it loaded."""
+    shared = _shared(idle_timeout=0.1)
+
+    async with shared.use() as handler:
+        pass
+    await asyncio.sleep(0.06)
+    async with shared.use():
+        pass
+    await asyncio.sleep(0.06)
+
+    # First release's timer would have fired by now; the second one hasn't
+    assert shared.is_loaded()
+    assert handler.loads == 1
+    await shared.close()
+
+
+async def test_zero_timeout_offloads_immediately():
+    """idle_timeout=0 keeps the old load/offload-per-use behaviour."""
+    shared = _shared(idle_timeout=0)
+
+    async with shared.use() as handler:
+        pass
+    async with shared.use():
+        pass
+
+    assert handler.loads == 2
+    assert handler.offloads == 2
+
+
+async def test_other_gpu_job_types_offload_resident_model():
+    """Whisper or summarization taking the GPU frees the model; its own users keep it."""
+    shared = _shared(idle_timeout=60)
+    gpu_manager = GPUResourceManager(SimpleNamespace(server_manager=None))
+    gpu_manager.register_resident_model(
+        "embedding model", EMBEDDING_MODEL_GPU_JOB_TYPES, shared.close
+    )
+    await gpu_manager._start_scheduler()
+    try:
+        async with gpu_manager.acquire_lock("text_embedding"):
+            async with shared.use() as handler:
+                pass
+        async with gpu_manager.acquire_lock("chatbot"):
+            assert shared.is_loaded()
+
+        async with gpu_manager.acquire_lock("transcription"):
+            assert not shared.is_loaded()
+        assert handler.offloads == 1
+        assert not gpu_manager._gpu_lock.is_locked()
+    finally:
+        await gpu_manager._stop_scheduler()
@@ -0,0 +1,105 @@
+"""
+Unit tests for silence markers in the Discord recorder.
+
+Fully silent windows are not written or transcoded. Each run of silent
+windows becomes one marker temp recording, rendered to audio only when the
+user's final track is assembled.
+"""
+
+import os
+import shutil
+import subprocess
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from source.services.discord.discord_recorder_manager.manager import (
+    DiscordRecorderConstants,
+    DiscordRecorderManagerService,
+)
+from source.services.discord.discord_recorder_manager.window_buffer import PCMWindowBuffer
+from source.services.gpu.ffmpeg_manager.manager import FFmpegHandler
+
+pytestmark = pytest.mark.unit
+
+FFMPEG_PATH = os.getenv("FFMPEG_PATH") or shutil.which("ffmpeg")
+WINDOW_MS = DiscordRecorderConstants.WINDOW_MS
+
+
+async def test_silent_runs_become_single_markers(make_session_handler):
+    """Runs of silent windows produce one marker row each and no PCM writes."""
+    handler = make_session_handler()
+    user_id = 111111111111111111
+    handler._user_chunk_counters[user_id] = 0
+    handler._user_audio_buffers[user_id] = PCMWindowBuffer()
+
+    # Absent for 10 windows, then speaks for one window
+    for chunk_idx in range(10):
+        await handler._flush_user_backfill(user_id=user_id, chunk_idx=chunk_idx)
+    handler._user_chunk_counters[user_id] = 10
+    handler._user_audio_buffers[user_id].extend(b"\x01" * DiscordRecorderConstants.WINDOW_BYTES)
+    # ... then a window that is only gap padding, then absent until the end
+    handler._user_audio_buffers[user_id].extend(bytes(DiscordRecorderConstants.WINDOW_BYTES))
+    await handler._flush_all_users()
+    for chunk_idx in range(12, 16):
+        await handler._flush_user_backfill(user_id=user_id, chunk_idx=chunk_idx)
+    await handler._record_silence_runs()
+    await handler._commit_temp_recordings()
+
+    insert = handler.services.sql_recording_service_manager.insert_temp_recordings
+    insert.assert_awaited_once()
+    inserts = [(row["start_timestamp_ms"], row["silence_ms"]) for row in insert.await_args.args[0]]
+    assert inserts == [
+        (0, 10 * WINDOW_MS),
+        (10 * WINDOW_MS, None),
+        (11 * WINDOW_MS, 5 * WINDOW_MS),
+    ]
+    handler._write_pcm_to_temp.assert_awaited_once()
+    handler._queue_pcm_to_mp3_transcode.assert_awaited_once()
+    assert len(handler.get_temp_recording_ids()) == 3
+
+
+async def test_markers_render_into_final_track(tmp_path):
+    """Assembly renders markers with anullsrc and concatenates them with real chunks."""
+    if not FFMPEG_PATH:
+        pytest.skip("FFmpeg not found")
+
+    handler = FFmpegHandler(SimpleNamespace(), FFMPEG_PATH)
+    speech = tmp_path / "meeting-1_user1_chunk0001.mp3"
+    assert (await handler.generate_silent_mp3(str(speech), 2_000))[0]
+
+    manager = DiscordRecorderManagerService.__new__(DiscordRecorderManagerService)
+    manager.context = SimpleNamespace(bot=SimpleNamespace(fetch_guild=AsyncMock()))
+    manager.services = SimpleNamespace(
+        logging_service=AsyncMock(),
+        ffmpeg_service_manager=SimpleNamespace(handler=handler),
+        recording_file_service_manager=SimpleNamespace(
+            get_temporary_storage_path=lambda: str(tmp_path),
+            get_persistent_storage_path=lambda: str(tmp_path),
+        ),
+        sql_recording_service_manager=SimpleNamespace(
+            insert_persistent_recording=AsyncMock(return_value="recording-1"),
+            get_meeting=AsyncMock(return_value={"guild_id": "1"}),
+        ),
+        sql_logging_service_manager=None,
+    )
+
+    recordings = [
+        {"id": "b", "filename": speech.name, "timestamp_ms": 3_000, "silence_ms": None},
+        {
+            "id": "a",
+            "filename": "meeting-1_user1_chunk0000.silence",
+            "timestamp_ms": 0,
+            "silence_ms": 3_000,
+        },
+    ]
+    assert await manager._process_user_recordings("1", recordings, "meeting-1") == "recording-1"
+
+    final = tmp_path / "meeting-1_user1_final.mp3"
+    probe = subprocess.run(
+        [FFMPEG_PATH, "-i", str(final), "-f", "null", "-"], capture_output=True, text=True
+    )
+    duration = probe.stderr.rsplit("time=", 1)[1].split()[0]
+    hours, minutes, seconds = duration.split(":")
+    assert abs(float(seconds) + 60 * int(minutes) - 5.0) < 0.2
@@ -0,0 +1,136 @@
+"""
+Unit tests for batched temp recording inserts.
+
+The recorder stages the temp recordings of a flush cycle and inserts them with
+one multi-row statement, queuing transcodes only once their rows exist.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from source.server.sql_models import TempRecordingModel, TranscodeStatus
+from source.services.discord.discord_recorder_manager.manager import (
+    DiscordRecorderConstants,
+    DiscordSessionHandler,
+)
+from source.services.discord.discord_recorder_manager.window_buffer import PCMWindowBuffer
+from source.services.discord.recording_sql_manager.manager import SQLRecordingManagerService
+
+pytestmark = pytest.mark.unit
+
+MEETING_ID = "meeting-00000001"
+USER_IDS = [111111111111111111, 222222222222222222, 333333333333333333]
+
+
+def _handler(make_session_handler, events: list) -> DiscordSessionHandler:
+    """Session handler that records inserts and queued transcodes in `events`."""
+
+    async def insert_temp_recordings(rows):
+        events.append(("insert", len(rows)))
+        return [f"temp{index:012d}" for index in range(len(rows))]
+
+    async def queue_transcode(pcm_path, mp3_path, temp_recording_id):
+        events.append(("transcode", temp_recording_id))
+
+    return make_session_handler(
+        meeting_id=MEETING_ID,
+        insert_temp_recordings=insert_temp_recordings,
+        queue_transcode=queue_transcode,
+    )
+
+
+async def test_flush_cycle_inserts_all_users_at_once(make_session_handler):
+    """One insert per cycle regardless of user count, transcodes queued afterwards."""
+    events = []
+    handler = _handler(make_session_handler, events)
+    for user_id in USER_IDS:
+        handler._user_chunk_counters[user_id] = 0
+        handler._user_audio_buffers[user_id] = PCMWindowBuffer()
+        handler._user_audio_buffers[user_id].extend(
+            b"\x01" * DiscordRecorderConstants.WINDOW_BYTES
+        )
+
+    await handler._flush_all_users()
+    assert events == []  # Nothing is written until the cycle commits
+
+    await handler._commit_temp_recordings()
+
+    assert events == [
+        ("insert", 3),
+        ("transcode", "temp000000000000"),
+        ("transcode", "temp000000000001"),
+        ("transcode", "temp000000000002"),
+    ]
+    assert sorted(handler.get_temp_recording_ids()) == [
+        "temp000000000000",
+        "temp000000000001",
+        "temp000000000002",
+    ]
+
+    # Nothing left staged
+    await handler._commit_temp_recordings()
+    assert len(events) == 4
+
+
+async def test_failed_insert_still_transcodes(make_session_handler):
+    """Like before batching, a failed insert is logged and the audio still transcoded."""
+    events = []
+    handler = _handler(make_session_handler, events)
+    handler.services.sql_recording_service_manager.insert_temp_recordings = AsyncMock(
+        side_effect=RuntimeError("foreign key violation")
+    )
+    handler._stage_temp_recording(
+        USER_IDS[0], start_timestamp_ms=0, filename="a.pcm", transcode=("a.pcm", "a.mp3")
+    )
+
+    await handler._commit_temp_recordings()
+
+    assert events == [("transcode", None)]
+    handler.services.logging_service.error.assert_awaited_once()
+
+
+async def test_insert_temp_recordings_is_one_statement():
+    service = SQLRecordingManagerService.__new__(SQLRecordingManagerService)
+    service.server = SimpleNamespace(sql_client=SimpleNamespace(execute=AsyncMock()))
+    service.services = SimpleNamespace(logging_service=AsyncMock())
+
+    entry_ids = await service.insert_temp_recordings(
+        [
+            {
+                "user_id": str(user_id),
+                "meeting_id": MEETING_ID,
+                "start_timestamp_ms": 0,
+                "filename": f"{user_id}.pcm",
+                "silence_ms": 30_000 if index == 0 else None,
+            }
+            for index, user_id in enumerate(USER_IDS)
+        ]
+    )
+
+    service.server.sql_client.execute.assert_awaited_once()
+    stmt = service.server.sql_client.execute.await_args.args[0]
+    assert stmt.table.name == TempRecordingModel.__tablename__
+    params = stmt.compile().params
+    assert [params[f"id_m{index}"] for index in range(3)] == entry_ids
+    assert [value for key, value in params.items() if key.startswith("transcode_status")] == [
+        TranscodeStatus.DONE.value,
+        TranscodeStatus.QUEUED.value,
+        TranscodeStatus.QUEUED.value,
+    ]
+
+
+async def test_insert_temp_recordings_validates_before_writing():
+    service = SQLRecordingManagerService.__new__(SQLRecordingManagerService)
+    service.server = SimpleNamespace(sql_client=SimpleNamespace(execute=AsyncMock()))
+    service.services = SimpleNamespace(logging_service=AsyncMock())
+
+    with pytest.raises(ValueError):
+        await service.insert_temp_recordings(
+            [
+                {"user_id": str(USER_IDS[0]), "meeting_id": MEETING_ID},
+                {"user_id": "short", "meeting_id": MEETING_ID},
+            ]
+        )
+    service.server.sql_client.execute.assert_not_awaited()
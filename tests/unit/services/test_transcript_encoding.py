@@ -0,0 +1,106 @@
+"""
+Unit tests for the on-disk transcript encoding.
+
+Transcripts can be written as pretty or minified JSON or MessagePack, plain or
+compressed; readers detect the format from the file's leading bytes.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from source.services.transcription.transcription_file_manager import encoding
+from source.services.transcription.transcription_file_manager.encoding import (
+    TRANSCRIPT_COMPRESSIONS,
+    TRANSCRIPT_FORMATS,
+    decode_transcript,
+    encode_transcript,
+    write_transcript_stream,
+)
+
+pytestmark = pytest.mark.unit
+
+TRANSCRIPT = {
+    "meeting_id": "meeting-00000001",
+    "user_id": "123456789",
+    "whisper_data": {
+        "text": " Bonjour à tous. 会議を始めます",
+        "segments": [
+            {"id": 0, "start": 0.0, "end": 1.5, "text": " Bonjour à tous.", "no_speech": False},
+            {"id": 1, "start": 1.5, "end": 3.25, "text": " 会議を始めます", "words": None},
+        ],
+    },
+    "summary": "",
+    "summary_layers": {},
+}
+
+
+@pytest.mark.parametrize("compression", TRANSCRIPT_COMPRESSIONS)
+@pytest.mark.parametrize("fmt", TRANSCRIPT_FORMATS)
+def test_round_trip(fmt, compression):
+    encoded = encode_transcript(TRANSCRIPT, fmt, compression)
+
+    assert decode_transcript(encoded) == TRANSCRIPT
+
+
+def test_compact_formats_are_smaller():
+    sizes = {fmt: len(encode_transcript(TRANSCRIPT, fmt, "none")) for fmt in TRANSCRIPT_FORMATS}
+
+    assert sizes["msgpack"] < sizes["json"] < sizes["pretty"]
+    assert encode_transcript(TRANSCRIPT, "json", "none") == json.dumps(
+        TRANSCRIPT, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def test_legacy_pretty_files_still_load():
+    legacy = json.dumps(TRANSCRIPT, indent=2, ensure_ascii=False).encode("utf-8")
+
+    assert decode_transcript(legacy) == TRANSCRIPT
+
+
+@pytest.mark.parametrize("fmt", TRANSCRIPT_FORMATS)
+def test_non_string_keys_load_as_json_would(fmt):
+    """summary_layers is keyed by level; every format reads the keys back as strings."""
+    transcript = {"summary_layers": {1: {0: "first"}, 2: {0: "second"}}}
+
+    decoded = decode_transcript(encode_transcript(transcript, fmt, "none"))
+
+    assert decoded == json.loads(json.dumps(transcript))
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError, match="Unknown transcript format"):
+        encode_transcript(TRANSCRIPT, "yaml", "none")
+    with pytest.raises(ValueError, match="Unknown transcript compression"):
+        encode_transcript(TRANSCRIPT, "json", "brotli")
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_corrupt_compressed_file_is_a_value_error(compression):
+    encoded = encode_transcript(TRANSCRIPT, "json", compression)
+
+    with pytest.raises(ValueError):
+        decode_transcript(encoded[:-8])
+
+
+@pytest.mark.parametrize("module", ["zstandard", "ormsgpack"])
+def test_missing_library_is_a_clear_error(module):
+    encoded = encode_transcript(TRANSCRIPT, "msgpack", "zstd")
+
+    with patch.object(encoding, module, None):
+        with pytest.raises(RuntimeError, match=f"{module} is required"):
+            decode_transcript(encoded)
+        with pytest.raises(RuntimeError, match=f"{module} is required"):
+            encode_transcript(TRANSCRIPT, "msgpack", "zstd")
+
+
+def test_stream_with_wrong_msgpack_count_leaves_no_file(tmp_path):
+    file_path = tmp_path / "transcript.json"
+
+    with pytest.raises(ValueError, match="Expected 3 items"):
+        write_transcript_stream(
+            str(file_path), {"meeting_id": "m"}, "segments", iter([{}, {}]), 3, "msgpack", "none"
+        )
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,176 @@
+"""
+Unit tests for transcript compilation.
+
+Per-user segments are spooled one transcript at a time, k-way merged by start
+time and streamed into the compilation, which must match the previous
+sort-everything-then-json.dumps output byte for byte (or, for compressed
+formats, decode to the same data).
+"""
+
+import json
+import random
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from source.services.transcription.transcription_file_manager import encoding
+from source.services.transcription.transcription_file_manager.encoding import (
+    decode_transcript,
+    encode_transcript,
+)
+from source.services.transcription.transcription_job_manager import compiler
+from source.services.transcription.transcription_job_manager.compiler import (
+    TranscriptionCompilationJob,
+)
+
+pytestmark = pytest.mark.unit
+
+MEETING_ID = "meeting-00000001"
+
+
+def _whisper_segments(seed: int, count: int) -> list[dict]:
+    rng = random.Random(seed)
+    start = 0.0
+    segments = []
+    for index in range(count):
+        # Whole seconds so different users share start times
+        start += rng.randint(0, 3)
+        segments.append(
+            {
+                "id": index,
+                "start": start,
+                "end": start + 1.5,
+                "text": f" user{seed} line {index} é",
+            }
+        )
+    return segments
+
+
+def _job(tmp_path, transcripts: dict[str, dict | None]) -> TranscriptionCompilationJob:
+    metadata = [
+        {
+            "id": transcript_id,
+            "user_id": f"user-{transcript_id}",
+            "filename": f"{transcript_id}.json",
+        }
+        for transcript_id in transcripts
+    ]
+    services = SimpleNamespace(
+        logging_service=AsyncMock(),
+        server=SimpleNamespace(sql_client=SimpleNamespace(execute=AsyncMock())),
+        transcription_file_service_manager=SimpleNamespace(
+            get_transcriptions_by_meeting=AsyncMock(return_value=metadata),
+            retrieve_transcription=AsyncMock(side_effect=transcripts.get),
+        ),
+    )
+    return TranscriptionCompilationJob(
+        job_id="job0000000000001", meeting_id=MEETING_ID, services=services
+    )
+
+
+def _expected(compiled: dict, transcripts: dict[str, dict | None]) -> dict:
+    """What the compiler produced before streaming: a global stable sort, encoded at once."""
+    segments = []
+    for transcript_id, transcript in transcripts.items():
+        if not transcript:
+            continue
+        for segment in transcript["whisper_data"]["segments"]:
+            segments.append(
+                {
+                    "timestamp": {"start_time": segment["start"], "end_time": segment["end"]},
+                    "speaker": {
+                        "user_id": f"user-{transcript_id}",
+                        "user_transcription_file": f"{transcript_id}.json",
+                    },
+                    "content": segment["text"].strip(),
+                }
+            )
+    segments.sort(key=lambda x: x["timestamp"]["start_time"])
+
+    header = {key: value for key, value in compiled.items() if key != "segments"}
+    header["segment_count"] = len(segments)
+    return {**header, "segments": segments}
+
+
+async def _compile(
+    tmp_path, transcripts, fmt: str = "pretty", compression: str = "none"
+) -> tuple[bytes, TranscriptionCompilationJob]:
+    job = _job(tmp_path, transcripts)
+    with (
+        patch.object(compiler, "COMPILATIONS_STORAGE_PATH", str(tmp_path)),
+        patch.object(encoding, "TRANSCRIPT_FORMAT", fmt),
+        patch.object(encoding, "TRANSCRIPT_COMPRESSION", compression),
+    ):
+        await job.execute()
+    return (tmp_path / f"transcript_{MEETING_ID}.json").read_bytes(), job
+
+
+async def test_merged_compilation_matches_global_sort(tmp_path):
+    transcripts = {
+        f"t{index}": {"whisper_data": {"segments": _whisper_segments(index, 200)}}
+        for index in range(5)
+    }
+
+    written, job = await _compile(tmp_path, transcripts)
+
+    compiled = json.loads(written)
+    assert written == json.dumps(
+        _expected(compiled, transcripts), indent=2, ensure_ascii=False
+    ).encode("utf-8")
+    assert compiled["segment_count"] == 1000
+    assert compiled["transcript_count"] == 5
+    # Spools are cleaned up; only the compilation remains
+    assert [path.name for path in tmp_path.iterdir()] == [f"transcript_{MEETING_ID}.json"]
+    job.services.server.sql_client.execute.assert_awaited_once()
+
+
+async def test_unordered_and_missing_transcripts(tmp_path):
+    shuffled = _whisper_segments(7, 50)
+    random.Random(0).shuffle(shuffled)
+    transcripts = {
+        "ordered": {"whisper_data": {"segments": _whisper_segments(3, 50)}},
+        "missing": None,
+        "shuffled": {"whisper_data": {"segments": shuffled}},
+        "silent": {"whisper_data": {"segments": []}},
+    }
+
+    written, _ = await _compile(tmp_path, transcripts)
+
+    assert written == encode_transcript(_expected(json.loads(written), transcripts), "pretty")
+
+
+async def test_compilation_without_segments(tmp_path):
+    transcripts = {"silent": {"whisper_data": {"segments": []}}}
+
+    written, _ = await _compile(tmp_path, transcripts)
+
+    compiled = json.loads(written)
+    assert compiled["segments"] == []
+    assert written == encode_transcript(_expected(compiled, transcripts), "pretty")
+
+
+@pytest.mark.parametrize("fmt", ["json", "msgpack"])
+@pytest.mark.parametrize("segment_count", [0, 3, 70_000])
+async def test_compact_compilation_matches_encode_transcript(tmp_path, fmt, segment_count):
+    """Streamed compact output is byte-identical; MessagePack switches array headers at 16/64K."""
+    transcripts = {"t0": {"whisper_data": {"segments": _whisper_segments(0, segment_count)}}}
+
+    written, _ = await _compile(tmp_path, transcripts, fmt=fmt)
+
+    compiled = decode_transcript(written)
+    assert written == encode_transcript(_expected(compiled, transcripts), fmt, "none")
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+async def test_compressed_compilation_round_trips(tmp_path, compression):
+    transcripts = {
+        f"t{index}": {"whisper_data": {"segments": _whisper_segments(index, 100)}}
+        for index in range(3)
+    }
+
+    written, _ = await _compile(tmp_path, transcripts, fmt="msgpack", compression=compression)
+
+    compiled = decode_transcript(written)
+    assert compiled == _expected(compiled, transcripts)
+    assert [path.name for path in tmp_path.iterdir()] == [f"transcript_{MEETING_ID}.json"]
@@ -0,0 +1,149 @@
+"""
+Unit tests for concurrent transcription of a meeting's recordings.
+
+TranscriptionJob transcribes user tracks concurrently on a pool of Whisper
+backends (local aiohttp stubs here), sharing one GPU lock between them.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiohttp import web
+
+from source.server.common.whisper_server import construct_whisper_server_pool
+from source.services.gpu.gpu_resource_manager.manager import GPUResourceManager
+from source.services.transcription.transcription_job_manager import manager as job_module
+from source.services.transcription.transcription_job_manager.manager import TranscriptionJob
+
+pytestmark = pytest.mark.unit
+
+INFERENCE_SECONDS = 0.3
+USER_COUNT = 4
+
+
+async def _start_backend(state: dict):
+    """Start a stub Whisper wrapper that takes INFERENCE_SECONDS per request."""
+
+    async def inference(request: web.Request) -> web.Response:
+        form = await request.post()
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(INFERENCE_SECONDS)
+        state["in_flight"] -= 1
+        return web.json_response({"text": form["file"].filename, "segments": []})
+
+    async def health(_request: web.Request) -> web.Response:
+        return web.json_response({"status": "ok"})
+
+    app = web.Application()
+    app.router.add_post("/inference", inference)
+    app.router.add_get("/health", health)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+@pytest.fixture
+async def gpu_manager():
+    manager = GPUResourceManager(SimpleNamespace(server_manager=None))
+    await manager._start_scheduler()
+    yield manager
+    await manager._stop_scheduler()
+
+
+@pytest.fixture
+async def whisper_pool():
+    """A pool of USER_COUNT stub backends, sharing one in-flight counter."""
+    state = {"in_flight": 0, "max_in_flight": 0}
+    backends = [await _start_backend(state) for _ in range(USER_COUNT)]
+    pool = construct_whisper_server_pool([endpoint for _, endpoint in backends])
+    await pool.connect()
+    yield pool, state
+    await pool.disconnect()
+    for runner, _ in backends:
+        await runner.cleanup()
+
+
+def _job(tmp_path, whisper_client, gpu_manager) -> tuple[TranscriptionJob, list]:
+    saved = []
+    for index in range(USER_COUNT):
+        (tmp_path / f"user{index}.mp3").write_bytes(b"\x00" * 1024)
+
+    async def get_recording_by_id(recording_id):
+        return {"user_id": f"user{recording_id[-1]}", "filename": f"user{recording_id[-1]}.mp3"}
+
+    async def save_transcription(transcript_data, meeting_id, user_id):
+        saved.append(transcript_data)
+        return f"transcript-{user_id}", f"transcript_{meeting_id}_{user_id}.json"
+
+    services = SimpleNamespace(
+        logging_service=AsyncMock(),
+        server=SimpleNamespace(whisper_server_client=whisper_client),
+        gpu_resource_manager=gpu_manager,
+        ffmpeg_service_manager=None,
+        sql_recording_service_manager=SimpleNamespace(get_recording_by_id=get_recording_by_id),
+        recording_file_service_manager=SimpleNamespace(
+            get_persistent_storage_path=lambda: str(tmp_path)
+        ),
+        transcription_file_service_manager=SimpleNamespace(save_transcription=save_transcription),
+    )
+    job = TranscriptionJob(
+        job_id="job0000000000001",
+        meeting_id="meeting-1",
+        recording_ids=[f"recording{index}" for index in range(USER_COUNT)],
+        services=services,
+    )
+    return job, saved
+
+
+async def test_tracks_are_transcribed_concurrently(tmp_path, whisper_pool, gpu_manager):
+    """Turnaround is bounded by the longest track, not the sum of all tracks."""
+    pool, state = whisper_pool
+    job, saved = _job(tmp_path, pool, gpu_manager)
+
+    start = time.perf_counter()
+    await job.execute()
+    elapsed = time.perf_counter() - start
+
+    assert state["max_in_flight"] == USER_COUNT
+    assert elapsed < 2 * INFERENCE_SECONDS
+    assert len(saved) == USER_COUNT
+    # Results are recorded in recording order
+    assert job.transcript_ids == [f"transcript-user{index}" for index in range(USER_COUNT)]
+    assert job.user_transcript_mapping == {
+        f"user{index}": f"transcript-user{index}" for index in range(USER_COUNT)
+    }
+    # One GPU lock covered all the overlapping inferences
+    assert gpu_manager.get_status()["stats"]["total_transcription_locks"] == 1
+
+
+async def test_fan_out_is_configurable(tmp_path, whisper_pool, gpu_manager):
+    pool, state = whisper_pool
+    job, saved = _job(tmp_path, pool, gpu_manager)
+
+    with patch.object(job_module, "TRANSCRIPTION_FAN_OUT", 1):
+        await job.execute()
+
+    assert state["max_in_flight"] == 1
+    assert len(saved) == USER_COUNT
+    # Sequential inferences take and release the GPU lock per recording
+    assert gpu_manager.get_status()["stats"]["total_transcription_locks"] == USER_COUNT
+
+
+async def test_failed_track_does_not_stop_the_others(tmp_path, whisper_pool, gpu_manager):
+    pool, _ = whisper_pool
+    job, saved = _job(tmp_path, pool, gpu_manager)
+    (tmp_path / "user2.mp3").unlink()
+
+    await job.execute()
+
+    assert job.transcript_ids == ["transcript-user0", "transcript-user1", "transcript-user3"]
+    assert len(saved) == USER_COUNT - 1
+    assert gpu_manager._gpu_lock.is_locked() is False
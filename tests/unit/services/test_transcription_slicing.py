@@ -0,0 +1,222 @@
+"""
+Unit tests for time-sliced transcription of long tracks.
+
+Long tracks are cut into overlapping slices that are transcribed and retried
+on their own, then stitched back together on the track timeline.
+"""
+
+import asyncio
+import os
+import shutil
+import wave
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from source.services.discord.discord_recorder_manager.pcm_generator import SilentPCM
+from source.services.gpu.gpu_resource_manager.manager import GPUResourceManager
+from source.services.transcription.transcription_job_manager.manager import (
+    TranscriptionJob,
+    _SharedGPULock,
+)
+from source.services.transcription.transcription_job_manager.slicing import (
+    AudioSlice,
+    plan_slices,
+    stitch_whisper_results,
+)
+
+pytestmark = pytest.mark.unit
+
+FFMPEG_PATH = os.getenv("FFMPEG_PATH") or shutil.which("ffmpeg")
+
+
+def _segment(start: float, end: float, text: str) -> dict:
+    return {
+        "start": start,
+        "end": end,
+        "text": f" {text}",
+        "words": [{"word": text, "start": start, "end": end}],
+    }
+
+
+# -------------------------------------------------------------- #
+# Planning and Stitching
+# -------------------------------------------------------------- #
+
+
+def test_short_track_is_one_slice():
+    assert plan_slices(60_000, slice_ms=600_000, overlap_ms=5_000) == [
+        AudioSlice(0, 0, 60_000, 0, 60_000)
+    ]
+
+
+def test_slices_overlap_and_keep_ranges_tile_the_track():
+    slices = plan_slices(1_500_000, slice_ms=600_000, overlap_ms=10_000)
+
+    assert [(s.start_ms, s.end_ms) for s in slices] == [
+        (0, 600_000),
+        (590_000, 1_190_000),
+        (1_180_000, 1_500_000),
+    ]
+    # The cut between slices sits in the middle of their overlap
+    assert [(s.keep_start_ms, s.keep_end_ms) for s in slices] == [
+        (0, 595_000),
+        (595_000, 1_185_000),
+        (1_185_000, 1_500_000),
+    ]
+
+
+def test_overlap_must_be_shorter_than_slice():
+    with pytest.raises(ValueError):
+        plan_slices(100_000, slice_ms=10_000, overlap_ms=10_000)
+
+
+def test_stitching_shifts_timestamps_and_drops_overlap_duplicates():
+    first, second = plan_slices(18_000, slice_ms=10_000, overlap_ms=2_000)
+    first_segments = [_segment(1.0, 3.0, "one"), _segment(8.5, 9.5, "two")]
+    # "two" is heard again at the start of the second slice (8.5s - 8.0s)
+    second_segments = [_segment(0.5, 1.5, "two"), _segment(4.0, 6.0, "three")]
+    results = [
+        (first, {"language": "en", "segments": first_segments}),
+        (second, {"language": "en", "segments": second_segments}),
+    ]
+
+    stitched = stitch_whisper_results(results, total_ms=18_000)
+
+    assert [(s["start"], s["end"], s["text"]) for s in stitched["segments"]] == [
+        (1.0, 3.0, " one"),
+        (8.5, 9.5, " two"),
+        (12.0, 14.0, " three"),
+    ]
+    assert stitched["segments"][2]["words"] == [{"word": "three", "start": 12.0, "end": 14.0}]
+    assert [s["id"] for s in stitched["segments"]] == [0, 1, 2]
+    assert stitched["text"] == " one two three"
+    assert stitched["duration"] == 18.0
+    assert stitched["language"] == "en"
+
+
+# -------------------------------------------------------------- #
+# GPU Lock Hold Time
+# -------------------------------------------------------------- #
+
+
+@pytest.fixture
+async def gpu_manager():
+    manager = GPUResourceManager(SimpleNamespace(server_manager=None))
+    await manager._start_scheduler()
+    yield manager
+    await manager._stop_scheduler()
+
+
+async def test_lock_is_reacquired_after_max_hold(gpu_manager):
+    """Inferences stop joining a long hold, so other job types get a turn."""
+    gpu_lock = _SharedGPULock(gpu_manager, max_hold_seconds=0.05, job_type="transcription")
+    order = []
+
+    async def inference(name: str, seconds: float) -> None:
+        async with gpu_lock.hold():
+            order.append(f"{name} start")
+            await asyncio.sleep(seconds)
+            order.append(f"{name} end")
+
+    first = asyncio.create_task(inference("first", 0.2))
+    await asyncio.sleep(0.1)
+    await inference("second", 0)
+    await first
+
+    assert order == ["first start", "first end", "second start", "second end"]
+    assert gpu_manager.get_status()["stats"]["total_transcription_locks"] == 2
+
+
+# -------------------------------------------------------------- #
+# Sliced Transcription
+# -------------------------------------------------------------- #
+
+
+class SliceWhisper:
+    """Stub Whisper client: one segment per slice, failing the given calls."""
+
+    def __init__(self, fail_calls: set[int]):
+        self.fail_calls = fail_calls
+        self.calls = []
+
+    async def inference(self, audio_path: str, **kwargs) -> dict:
+        self.calls.append(audio_path)
+        if len(self.calls) in self.fail_calls:
+            raise RuntimeError("backend restarted")
+        with wave.open(audio_path, "rb") as wav:
+            assert (wav.getframerate(), wav.getnchannels()) == (16000, 1)
+            seconds = wav.getnframes() / wav.getframerate()
+        return {"segments": [_segment(1.0, round(seconds - 1.0, 3), "speech")]}
+
+
+def _job(tmp_path, whisper_client) -> TranscriptionJob:
+    if not FFMPEG_PATH:
+        pytest.skip("FFmpeg not found")
+    services = SimpleNamespace(
+        logging_service=AsyncMock(),
+        server=SimpleNamespace(whisper_server_client=whisper_client),
+        ffmpeg_service_manager=SimpleNamespace(get_ffmpeg_path=lambda: FFMPEG_PATH),
+        recording_file_service_manager=SimpleNamespace(
+            get_temporary_storage_path=lambda: str(tmp_path)
+        ),
+    )
+    return TranscriptionJob(job_id="job0000000000001", meeting_id="meeting-1", services=services)
+
+
+def _track(tmp_path, ms: int) -> str:
+    path = tmp_path / "track.wav"
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(48000)
+        wav.writeframes(SilentPCM().generate(ms))
+    return str(path)
+
+
+async def test_failed_slice_is_retried_alone(tmp_path, gpu_manager):
+    whisper = SliceWhisper(fail_calls={2})
+    job = _job(tmp_path, whisper)
+    slices = plan_slices(25_000, slice_ms=10_000, overlap_ms=2_000)
+    gpu_lock = _SharedGPULock(gpu_manager, job_type="transcription")
+
+    result = await job._transcribe_slices(
+        "recording1", _track(tmp_path, 25_000), slices, 25_000, gpu_lock
+    )
+
+    names = [os.path.basename(path) for path in whisper.calls]
+    assert names == [
+        "slice_job0000000000001_recording1_0.wav",
+        "slice_job0000000000001_recording1_1.wav",
+        "slice_job0000000000001_recording1_1.wav",
+        "slice_job0000000000001_recording1_2.wav",
+    ]
+    # Slices start at 0s, 8s and 16s; the last one is 9s long
+    assert [(s["start"], s["end"]) for s in result["segments"]] == [
+        (1.0, 9.0),
+        (9.0, 17.0),
+        (17.0, 24.0),
+    ]
+    # One lock hold per inference, released in between
+    assert gpu_manager.get_status()["stats"]["total_transcription_locks"] == 4
+    assert not list(tmp_path.glob("slice_*"))
+
+
+async def test_slice_failing_every_retry_fails_the_recording(tmp_path, gpu_manager):
+    whisper = SliceWhisper(fail_calls={1, 2, 3})
+    job = _job(tmp_path, whisper)
+    slices = plan_slices(25_000, slice_ms=10_000, overlap_ms=2_000)
+
+    with pytest.raises(RuntimeError, match="backend restarted"):
+        await job._transcribe_slices(
+            "recording1",
+            _track(tmp_path, 25_000),
+            slices,
+            25_000,
+            _SharedGPULock(gpu_manager, job_type="transcription"),
+        )
+
+    assert len(whisper.calls) == 3
+    assert not list(tmp_path.glob("slice_*"))
+    assert gpu_manager._gpu_lock.is_locked() is False
@@ -0,0 +1,174 @@
+"""
+Unit tests for voice activity trimming before transcription.
+
+Uses SilentPCM (as produced by the recorder's backfill) mixed with synthetic
+tones to validate region detection, trimming and timestamp remapping.
+"""
+
+import os
+import shutil
+import wave
+
+import numpy as np
+import pytest
+
+from source.services.discord.discord_recorder_manager.pcm_generator import SilentPCM
+from source.services.transcription.transcription_job_manager.vad import (
+    OffsetMap,
+    VoicedRegion,
+    extract_voiced_pcm,
+    find_voiced_regions,
+    prepare_voiced_audio,
+    remap_whisper_timestamps,
+)
+
+pytestmark = pytest.mark.unit
+
+SAMPLE_RATE = 48000
+CHANNELS = 2
+
+FFMPEG_PATH = os.getenv("FFMPEG_PATH") or shutil.which("ffmpeg")
+
+
+def _tone(ms: int, freq: float = 440.0, amplitude: float = 0.3) -> bytes:
+    """Generate a stereo s16le sine tone."""
+    t = np.arange(SAMPLE_RATE * ms // 1000) / SAMPLE_RATE
+    mono = (np.sin(2 * np.pi * freq * t) * amplitude * 32767).astype("<i2")
+    return np.repeat(mono, CHANNELS).tobytes()
+
+
+def _track(*parts: tuple[str, int]) -> bytes:
+    """Build a track from ("silence"|"tone", ms) parts."""
+    silence = SilentPCM(sample_rate=SAMPLE_RATE, channels=CHANNELS)
+    return b"".join(silence.generate(ms) if kind == "silence" else _tone(ms) for kind, ms in parts)
+
+
+def _find(pcm: bytes, **kwargs):
+    # 20ms frames (one Discord frame) keep region edges aligned with the test tones
+    kwargs.setdefault("frame_ms", 20)
+    return find_voiced_regions(pcm, sample_rate=SAMPLE_RATE, channels=CHANNELS, **kwargs)
+
+
+# -------------------------------------------------------------- #
+# Region Detection
+# -------------------------------------------------------------- #
+
+
+def test_silent_track_has_no_voiced_regions():
+    """A fully backfilled (silent) window produces no regions."""
+    assert _find(_track(("silence", 30_000))) == []
+
+
+def test_tones_are_detected_with_padding():
+    """Voiced regions cover the tones plus padding."""
+    pcm = _track(("silence", 10_000), ("tone", 2_000), ("silence", 10_000), ("tone", 1_000))
+    regions = _find(pcm, padding_ms=300, merge_gap_ms=1000)
+
+    assert regions == [VoicedRegion(9_700, 12_300), VoicedRegion(21_700, 23_000)]
+
+
+def test_close_regions_are_merged():
+    """Tones separated by a short pause become a single region."""
+    pcm = _track(("silence", 5_000), ("tone", 1_000), ("silence", 500), ("tone", 1_000))
+    regions = _find(pcm, padding_ms=0, merge_gap_ms=1000)
+
+    assert regions == [VoicedRegion(5_000, 7_500)]
+
+
+def test_short_clicks_are_ignored():
+    """Bursts shorter than min_speech_ms are not treated as speech."""
+    pcm = _track(("silence", 5_000), ("tone", 30), ("silence", 5_000))
+    assert _find(pcm, min_speech_ms=90) == []
+
+
+# -------------------------------------------------------------- #
+# Trimming and Offset Map
+# -------------------------------------------------------------- #
+
+
+def test_extract_voiced_pcm_keeps_only_regions():
+    """Trimmed PCM is the voiced regions joined by spacers."""
+    pcm = _track(("silence", 10_000), ("tone", 2_000), ("silence", 20_000), ("tone", 2_000))
+    regions = _find(pcm, padding_ms=0)
+    offset_map = OffsetMap(regions=regions, total_ms=34_000, spacer_ms=250)
+
+    trimmed = extract_voiced_pcm(pcm, offset_map, sample_rate=SAMPLE_RATE, channels=CHANNELS)
+
+    bytes_per_ms = SAMPLE_RATE * CHANNELS * 2 // 1000
+    assert len(trimmed) == offset_map.trimmed_ms * bytes_per_ms
+    assert offset_map.trimmed_ms == 4_250
+    assert offset_map.voiced_ms == 4_000
+
+
+def test_offset_map_translates_to_original_timeline():
+    """Positions in trimmed audio map back into their original regions."""
+    offset_map = OffsetMap(
+        regions=[VoicedRegion(10_000, 12_000), VoicedRegion(60_000, 61_000)],
+        total_ms=120_000,
+        spacer_ms=250,
+    )
+
+    assert offset_map.to_original_ms(0) == 10_000
+    assert offset_map.to_original_ms(1_500) == 11_500
+    # Inside the spacer -> clamped to the end of the first region
+    assert offset_map.to_original_ms(2_100) == 12_000
+    # Start of the second region in trimmed time
+    assert offset_map.to_original_ms(2_250) == 60_000
+    assert offset_map.to_original_ms(2_250, is_end=True) == 12_000
+    assert offset_map.to_original_ms(2_750) == 60_500
+
+
+def test_remap_whisper_timestamps():
+    """Segment and word timestamps are remapped; the input is not mutated."""
+    offset_map = OffsetMap(
+        regions=[VoicedRegion(10_000, 12_000), VoicedRegion(60_000, 61_000)],
+        total_ms=120_000,
+        spacer_ms=250,
+    )
+    whisper_data = {
+        "text": "hello world",
+        "duration": 3.25,
+        "segments": [
+            {
+                "id": 0,
+                "start": 0.5,
+                "end": 2.0,
+                "text": "hello",
+                "words": [{"word": "hello", "start": 0.5, "end": 1.0}],
+            },
+            {"id": 1, "start": 2.25, "end": 3.25, "text": "world", "words": []},
+        ],
+    }
+
+    remapped = remap_whisper_timestamps(whisper_data, offset_map)
+
+    assert remapped["segments"][0]["start"] == 10.5
+    assert remapped["segments"][0]["end"] == 12.0
+    assert remapped["segments"][0]["words"][0] == {"word": "hello", "start": 10.5, "end": 11.0}
+    assert remapped["segments"][1]["start"] == 60.0
+    assert remapped["segments"][1]["end"] == 61.0
+    assert remapped["duration"] == 120.0
+    assert whisper_data["segments"][0]["start"] == 0.5
+
+
+@pytest.mark.skipif(not FFMPEG_PATH, reason="FFmpeg not found")
+async def test_prepare_voiced_audio_trims_decoded_track(tmp_path):
+    """The track is decoded through the spool file, which is removed afterwards."""
+    input_path = tmp_path / "track.wav"
+    with wave.open(str(input_path), "wb") as wav:
+        wav.setnchannels(CHANNELS)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(_track(("silence", 4000), ("tone", 1000), ("silence", 4000)))
+    output_path = tmp_path / "voiced.wav"
+
+    offset_map = await prepare_voiced_audio(FFMPEG_PATH, str(input_path), str(output_path))
+
+    assert offset_map is not None
+    assert len(offset_map.regions) == 1
+    assert offset_map.total_ms == 9000
+    assert offset_map.trimmed_ms < 2000
+    with wave.open(str(output_path), "rb") as wav:
+        assert wav.getframerate() == 16000
+        assert wav.getnframes() == offset_map.trimmed_ms * 16
+    assert not os.path.exists(f"{output_path}.pcm")
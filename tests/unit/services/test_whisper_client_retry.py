@@ -0,0 +1,125 @@
+"""
+Unit tests for WhisperServerClient retry behaviour.
+
+Runs the client against a local aiohttp app that rejects requests with 429
+(as the whisper wrapper does when its admission queue is full), or holds them
+past the client's inference timeout (as a long queue wait does).
+"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from source.server.common.whisper_server import WhisperServerClient
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    """Create a small dummy audio file."""
+    path = tmp_path / "track.mp3"
+    path.write_bytes(b"\x00" * 1024)
+    return path
+
+
+async def _start_backend(rejections: int, status: int = 429, stall_seconds: float = 0.0):
+    """Start a fake wrapper that rejects (or stalls, if stall_seconds) the first requests."""
+    state = {"calls": 0}
+
+    async def inference(request: web.Request) -> web.Response:
+        await request.post()
+        state["calls"] += 1
+        if state["calls"] <= rejections and stall_seconds:
+            await asyncio.sleep(stall_seconds)
+        elif state["calls"] <= rejections:
+            return web.json_response(
+                {"error": "Transcription queue is full"}, status=status, headers={"Retry-After": "0"}
+            )
+        return web.json_response(
+            {"text": "hello", "segments": []}, headers={"X-Queue-Position": "0"}
+        )
+
+    async def health(_request: web.Request) -> web.Response:
+        return web.json_response({"status": "ok"})
+
+    app = web.Application()
+    app.router.add_post("/inference", inference)
+    app.router.add_get("/health", health)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}", state
+
+
+async def test_inference_retries_when_queue_full(audio_file):
+    """A 429 from the wrapper is retried until the request is admitted."""
+    runner, endpoint, state = await _start_backend(rejections=2)
+    client = WhisperServerClient(endpoint=endpoint, max_retries=3, retry_base_delay=0.0)
+    try:
+        await client.connect()
+        result = await client.inference(str(audio_file))
+    finally:
+        await client.disconnect()
+        await runner.cleanup()
+
+    assert result == {"text": "hello", "segments": []}
+    assert state["calls"] == 3
+
+
+async def test_inference_gives_up_after_max_retries(audio_file):
+    """Retries are bounded; the last rejection is surfaced as an error."""
+    runner, endpoint, state = await _start_backend(rejections=10, status=503)
+    client = WhisperServerClient(endpoint=endpoint, max_retries=2, retry_base_delay=0.0)
+    try:
+        await client.connect()
+        with pytest.raises(RuntimeError, match="503"):
+            await client.inference(str(audio_file))
+    finally:
+        await client.disconnect()
+        await runner.cleanup()
+
+    assert state["calls"] == 3
+
+
+async def test_inference_does_not_retry_other_errors(audio_file):
+    """Non-queue errors fail immediately."""
+    runner, endpoint, state = await _start_backend(rejections=10, status=500)
+    client = WhisperServerClient(endpoint=endpoint, max_retries=5, retry_base_delay=0.0)
+    try:
+        await client.connect()
+        with pytest.raises(RuntimeError, match="500"):
+            await client.inference(str(audio_file))
+    finally:
+        await client.disconnect()
+        await runner.cleanup()
+
+    assert state["calls"] == 1
+
+
+async def test_inference_timeout_is_not_retried(audio_file):
+    """The server keeps working on a timed-out request, so it is not sent again."""
+    runner, endpoint, state = await _start_backend(rejections=10, stall_seconds=1.0)
+    client = WhisperServerClient(
+        endpoint=endpoint, max_retries=2, retry_base_delay=0.0, inference_timeout=0.2
+    )
+    try:
+        await client.connect()
+        with pytest.raises(asyncio.TimeoutError):
+            await client.inference(str(audio_file))
+    finally:
+        await client.disconnect()
+        await runner.cleanup()
+
+    assert state["calls"] == 1
+
+
+def test_default_timeout_covers_queue_wait_and_inference():
+    """aiohttp's 300s default would expire while the wrapper still queues the request."""
+    client = WhisperServerClient()
+
+    assert client.inference_timeout > 3600 + 300
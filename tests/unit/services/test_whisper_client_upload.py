@@ -0,0 +1,127 @@
+"""
+Unit tests for how audio reaches the whisper wrapper.
+
+The client streams uploads from disk, or sends a shared filesystem path when
+the wrapper is co-located; the wrapper streams the audio on to whisper-server
+with MultipartFileStream instead of building the body in memory.
+"""
+
+import io
+
+import pytest
+from aiohttp import web
+
+from source.server.common.whisper_server import WhisperServerClient
+from whisper_wrapper.upload_stream import MultipartFileStream
+
+pytestmark = pytest.mark.unit
+
+AUDIO = bytes(range(256)) * 4096  # 1 MiB
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / "track.mp3"
+    path.write_bytes(AUDIO)
+    return path
+
+
+async def _start_backend(reject_paths: bool = False):
+    """Start a fake wrapper that records what each inference request carried."""
+    requests = []
+
+    async def inference(request: web.Request) -> web.Response:
+        form = await request.post()
+        received = {"path": form.get("path"), "language": form.get("language")}
+        if "file" in form:
+            received["file"] = form["file"].file.read()
+            received["filename"] = form["file"].filename
+        requests.append(received)
+        if received["path"] and reject_paths:
+            return web.json_response({"error": "Path is not under a shared root"}, status=403)
+        return web.json_response({"text": "hello", "segments": []})
+
+    async def health(_request: web.Request) -> web.Response:
+        return web.json_response({"status": "ok"})
+
+    app = web.Application(client_max_size=4 * len(AUDIO))
+    app.router.add_post("/inference", inference)
+    app.router.add_get("/health", health)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}", requests
+
+
+async def _inference(endpoint: str, audio_path: str, shared_filesystem: bool) -> dict:
+    client = WhisperServerClient(endpoint=endpoint, shared_filesystem=shared_filesystem)
+    try:
+        await client.connect()
+        return await client.inference(audio_path)
+    finally:
+        await client.disconnect()
+
+
+async def test_upload_carries_the_file(audio_file):
+    runner, endpoint, requests = await _start_backend()
+    try:
+        result = await _inference(endpoint, str(audio_file), shared_filesystem=False)
+    finally:
+        await runner.cleanup()
+
+    assert result == {"text": "hello", "segments": []}
+    assert [(r["path"], r["filename"], r["file"] == AUDIO) for r in requests] == [
+        (None, "track.mp3", True)
+    ]
+
+
+async def test_shared_filesystem_sends_only_the_path(audio_file):
+    runner, endpoint, requests = await _start_backend()
+    try:
+        await _inference(endpoint, str(audio_file), shared_filesystem=True)
+    finally:
+        await runner.cleanup()
+
+    assert requests == [{"path": str(audio_file), "language": "en"}]
+
+
+async def test_rejected_path_falls_back_to_upload(audio_file):
+    runner, endpoint, requests = await _start_backend(reject_paths=True)
+    try:
+        result = await _inference(endpoint, str(audio_file), shared_filesystem=True)
+    finally:
+        await runner.cleanup()
+
+    assert result == {"text": "hello", "segments": []}
+    assert [r["path"] for r in requests] == [str(audio_file), None]
+    assert requests[1]["file"] == AUDIO
+
+
+def test_multipart_stream_encodes_fields_and_file():
+    werkzeug = pytest.importorskip("werkzeug")
+    body = MultipartFileStream(
+        fields={"language": "en", "response_format": "verbose_json"},
+        file_field="file",
+        filename='my "track".mp3',
+        fileobj=io.BytesIO(AUDIO),
+        file_content_type="audio/mpeg",
+    )
+    length = len(body)
+
+    # Read in small blocks, as http.client does while sending
+    encoded = b"".join(iter(lambda: body.read(8192), b""))
+    assert len(encoded) == length
+
+    request = werkzeug.Request.from_values(
+        input_stream=io.BytesIO(encoded),
+        content_length=length,
+        content_type=body.content_type,
+        method="POST",
+    )
+    assert request.form.to_dict() == {"language": "en", "response_format": "verbose_json"}
+    assert request.files["file"].filename == 'my "track".mp3'
+    assert request.files["file"].mimetype == "audio/mpeg"
+    assert request.files["file"].read() == AUDIO
@@ -0,0 +1,199 @@
+"""
+Unit tests for the whisper wrapper's admission queue.
+
+AdmissionQueue admits requests in arrival order, rejects them once max_depth
+are waiting and gives up on those that wait past their timeout. Through the
+Flask app, with a stub whisper.cpp server (tests/assets) as the backend, those
+outcomes are served in order, 429 and 503.
+"""
+
+import importlib
+import io
+import socket
+import stat
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+ROOT = Path(__file__).resolve().parents[3]
+STUB_SERVER = ROOT / "tests" / "assets" / "stub_whisper_server.py"
+
+# The wrapper runs from its own directory and imports its modules by bare name
+sys.path.insert(0, str(ROOT / "whisper_wrapper"))
+admission_queue = importlib.import_module("admission_queue")
+wrapper_config = importlib.import_module("config").config
+
+AdmissionQueue = admission_queue.AdmissionQueue
+QueueFullError = admission_queue.QueueFullError
+QueueTimeoutError = admission_queue.QueueTimeoutError
+
+
+def _wait_until(predicate, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+# -------------------------------------------------------------- #
+# AdmissionQueue
+# -------------------------------------------------------------- #
+
+
+def test_waiters_are_admitted_in_arrival_order():
+    queue = AdmissionQueue(max_depth=4)
+    holder = queue.enter()
+    admitted = []
+
+    def request(name: str) -> None:
+        with queue.admit() as ticket:
+            admitted.append((name, ticket.position))
+
+    threads = []
+    for index, name in enumerate(["first", "second", "third"]):
+        thread = threading.Thread(target=request, args=(name,))
+        thread.start()
+        threads.append(thread)
+        _wait_until(lambda: queue.depth == index + 1)
+
+    queue.leave(holder)
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert admitted == [("first", 1), ("second", 2), ("third", 3)]
+    assert queue.snapshot()["admitted_total"] == 4
+
+
+def test_full_queue_rejects_new_requests():
+    queue = AdmissionQueue(max_depth=1)
+    holder = queue.enter()
+    waiter = threading.Thread(target=lambda: queue.leave(queue.enter()))
+    waiter.start()
+    _wait_until(lambda: queue.depth == 1)
+
+    with pytest.raises(QueueFullError):
+        queue.enter()
+
+    queue.leave(holder)
+    waiter.join(timeout=5)
+    assert queue.snapshot()["rejected_total"] == 1
+
+
+def test_wait_past_timeout_gives_up_its_place():
+    queue = AdmissionQueue(max_depth=2)
+    holder = queue.enter()
+
+    with pytest.raises(QueueTimeoutError):
+        queue.enter(timeout=0.1)
+
+    assert queue.depth == 0
+    queue.leave(holder)
+    # The slot is free again for the next request
+    queue.leave(queue.enter(timeout=0.1))
+    assert queue.snapshot()["timed_out_total"] == 1
+
+
+# -------------------------------------------------------------- #
+# Wrapper App
+# -------------------------------------------------------------- #
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def wrapper(tmp_path, monkeypatch):
+    """The wrapper app with a fresh queue, backed by a slow stub whisper-server."""
+    pytest.importorskip("flask")
+    app_module = importlib.import_module("app")
+    server_module = importlib.import_module("whisper_server")
+
+    launcher = tmp_path / "whisper-server"
+    launcher.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{STUB_SERVER}" "$@"\n')
+    launcher.chmod(launcher.stat().st_mode | stat.S_IEXEC)
+
+    port = _free_port()
+    monkeypatch.setenv("STUB_WHISPER_DELAY", "0.2")
+    monkeypatch.setattr(wrapper_config, "whisper_binary_path", launcher)
+    monkeypatch.setattr(wrapper_config, "whisper_host", "127.0.0.1")
+    monkeypatch.setattr(wrapper_config, "whisper_port", port)
+    monkeypatch.setattr(wrapper_config, "whisper_url", f"http://127.0.0.1:{port}")
+    monkeypatch.setattr(wrapper_config, "server_start_timeout", 15)
+    monkeypatch.setattr(wrapper_config, "resident_mode", True)
+    monkeypatch.setattr(wrapper_config, "queue_retry_after", 7)
+
+    whisper_server = server_module.WhisperServer()
+    monkeypatch.setattr(app_module, "whisper_server", whisper_server)
+    monkeypatch.setattr(app_module, "transcription_queue", AdmissionQueue(max_depth=4))
+    yield app_module
+    whisper_server.shutdown()
+
+
+def _post_audio(app_module):
+    client = app_module.app.test_client()
+    return client.post(
+        "/inference",
+        data={"file": (io.BytesIO(b"\x00" * 1024), "track.mp3")},
+        content_type="multipart/form-data",
+    )
+
+
+def test_wrapper_serves_queued_requests_in_order(wrapper):
+    queue = wrapper.transcription_queue
+    served = []
+
+    def request(name: str) -> None:
+        response = _post_audio(wrapper)
+        served.append((name, response.status_code, response.headers["X-Queue-Position"]))
+
+    threads = []
+    for index, name in enumerate(["first", "second", "third"]):
+        thread = threading.Thread(target=request, args=(name,))
+        thread.start()
+        threads.append(thread)
+        if index == 0:
+            _wait_until(lambda: queue.snapshot()["active"] == 1)
+        else:
+            _wait_until(lambda: queue.depth == index)
+    for thread in threads:
+        thread.join(timeout=20)
+
+    assert served == [("first", 200, "0"), ("second", 200, "1"), ("third", 200, "2")]
+    # One resident backend served them all
+    assert wrapper.whisper_server.start_count == 1
+
+
+def test_wrapper_full_queue_returns_429(wrapper, monkeypatch):
+    monkeypatch.setattr(wrapper, "transcription_queue", AdmissionQueue(max_depth=0))
+    holder = wrapper.transcription_queue.enter()
+    try:
+        response = _post_audio(wrapper)
+    finally:
+        wrapper.transcription_queue.leave(holder)
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "7"
+    assert response.get_json()["queue"]["rejected_total"] == 1
+
+
+def test_wrapper_queue_timeout_returns_503(wrapper, monkeypatch):
+    monkeypatch.setattr(wrapper_config, "queue_timeout", 0.1)
+    holder = wrapper.transcription_queue.enter()
+    try:
+        response = _post_audio(wrapper)
+    finally:
+        wrapper.transcription_queue.leave(holder)
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "7"
+    assert response.get_json()["queue"]["timed_out_total"] == 1
+    # Rejected requests never started the backend
+    assert wrapper.whisper_server.start_count == 0
@@ -0,0 +1,134 @@
+"""
+Unit tests for the whisper wrapper's resident whisper-server.
+
+WhisperServer starts a stub whisper.cpp server process (tests/assets) in
+place of the real binary: the process is reused across requests, restarted
+when it exits and stopped once it has been idle.
+"""
+
+import importlib
+import socket
+import stat
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+ROOT = Path(__file__).resolve().parents[3]
+STUB_SERVER = ROOT / "tests" / "assets" / "stub_whisper_server.py"
+
+# The wrapper runs from its own directory and imports its modules by bare name
+sys.path.insert(0, str(ROOT / "whisper_wrapper"))
+wrapper_config = importlib.import_module("config").config
+wrapper_server = importlib.import_module("whisper_server")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """A WhisperServer whose binary is the stub server."""
+    launcher = tmp_path / "whisper-server"
+    launcher.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{STUB_SERVER}" "$@"\n')
+    launcher.chmod(launcher.stat().st_mode | stat.S_IEXEC)
+
+    port = _free_port()
+    monkeypatch.setattr(wrapper_config, "whisper_binary_path", launcher)
+    monkeypatch.setattr(wrapper_config, "whisper_host", "127.0.0.1")
+    monkeypatch.setattr(wrapper_config, "whisper_port", port)
+    monkeypatch.setattr(wrapper_config, "whisper_url", f"http://127.0.0.1:{port}")
+    monkeypatch.setattr(wrapper_config, "server_start_timeout", 15)
+
+    whisper_server = wrapper_server.WhisperServer()
+    yield whisper_server
+    whisper_server.shutdown()
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return predicate()
+
+
+def test_server_is_reused_across_requests(server):
+    server.acquire()
+    process = server.process
+    server.release(idle_timeout=0)
+
+    server.acquire()
+    server.release(idle_timeout=0)
+
+    assert server.process is process
+    assert server.start_count == 1
+    assert server.is_healthy()
+
+
+def test_exited_server_is_restarted(server):
+    server.acquire()
+    server.release(idle_timeout=0)
+    server.process.kill()
+    server.process.wait()
+
+    server.acquire()
+    server.release(idle_timeout=0)
+
+    assert server.start_count == 2
+    assert server.is_healthy()
+
+
+def test_idle_server_is_stopped(server):
+    server.acquire()
+    process = server.process
+    server.release(idle_timeout=0.2)
+
+    assert _wait_until(lambda: server.process is None)
+    assert process.poll() is not None
+    assert not server.is_running
+
+
+def test_request_cancels_idle_shutdown(server):
+    server.acquire()
+    server.release(idle_timeout=0.2)
+    server.acquire()
+    time.sleep(0.4)
+
+    assert server.is_healthy()
+    server.release(idle_timeout=0)
+    assert server.start_count == 1
+
+
+def test_fired_timer_does_not_stop_server_after_new_request(server):
+    """A timer that fired before a request came and went must not act for the new timer."""
+    server.acquire()
+    server.release(idle_timeout=60)
+    fired_generation = server._idle_generation
+
+    # The request cancels the timer (too late, it already fired) and schedules its own
+    server.acquire()
+    server.release(idle_timeout=60)
+    newer_timer = server._idle_timer
+
+    # The fired timer finally gets the state lock
+    server._on_idle_timeout(fired_generation)
+
+    assert server.is_healthy()
+    assert server._idle_timer is newer_timer
+
+
+def test_non_resident_release_stops_server(server):
+    server.acquire()
+    process = server.process
+    server.release(resident=False)
+
+    assert server.process is None
+    assert process.poll() is not None
@@ -0,0 +1,172 @@
+"""
+Bounded FIFO admission queue for transcription requests.
+Requests wait their turn instead of being rejected while the backend is busy.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """Raised when the admission queue is already at its maximum depth."""
+
+
+class QueueTimeoutError(Exception):
+    """Raised when a request waited longer than the queue timeout."""
+
+
+@dataclass
+class Ticket:
+    """A request's place in the admission queue."""
+
+    ticket_id: int
+    position: int  # Number of requests ahead of this one when it was enqueued
+    enqueued_at: float = field(default_factory=time.monotonic)
+    admitted_at: Optional[float] = None
+
+    @property
+    def wait_seconds(self) -> float:
+        """Time spent waiting in the queue (up to now if not yet admitted)."""
+        end = self.admitted_at if self.admitted_at is not None else time.monotonic()
+        return end - self.enqueued_at
+
+
+class AdmissionQueue:
+    """
+    Thread-safe bounded FIFO queue that admits up to `concurrency` requests at once.
+
+    Requests beyond `concurrency` wait in arrival order. When `max_depth` requests are
+    already waiting, new requests are rejected with QueueFullError.
+    """
+
+    def __init__(self, max_depth: int = 8, concurrency: int = 1):
+        if max_depth < 0:
+            raise ValueError("max_depth must be >= 0")
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+
+        self.max_depth = max_depth
+        self.concurrency = concurrency
+
+        self._cond = threading.Condition()
+        self._waiting: deque[Ticket] = deque()
+        self._active = 0
+        self._ids = itertools.count(1)
+
+        # Metrics
+        self._admitted_total = 0
+        self._rejected_total = 0
+        self._timed_out_total = 0
+        self._completed_total = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    def enter(self, timeout: Optional[float] = None) -> Ticket:
+        """
+        Wait until this request is admitted.
+
+        Args:
+            timeout: Maximum seconds to wait for admission (None waits indefinitely)
+
+        Returns:
+            The admitted Ticket (pass it to leave() when done)
+
+        Raises:
+            QueueFullError: If max_depth requests are already waiting
+            QueueTimeoutError: If the request was not admitted within timeout
+        """
+        with self._cond:
+            # Fast path: free slot and nobody ahead of us
+            if not self._waiting and self._active < self.concurrency:
+                ticket = Ticket(ticket_id=next(self._ids), position=0)
+                self._admit(ticket)
+                return ticket
+
+            if len(self._waiting) >= self.max_depth:
+                self._rejected_total += 1
+                raise QueueFullError(
+                    f"Transcription queue is full ({len(self._waiting)}/{self.max_depth} waiting)"
+                )
+
+            ticket = Ticket(ticket_id=next(self._ids), position=len(self._waiting) + 1)
+            self._waiting.append(ticket)
+            logger.info(
+                f"Request {ticket.ticket_id} queued at position {ticket.position} "
+                f"(depth={len(self._waiting)}, active={self._active})"
+            )
+
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not (self._waiting[0] is ticket and self._active < self.concurrency):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self._waiting.remove(ticket)
+                    self._timed_out_total += 1
+                    # Our departure may unblock the next waiter
+                    self._cond.notify_all()
+                    raise QueueTimeoutError(
+                        f"Request {ticket.ticket_id} not admitted within {timeout}s"
+                    )
+                self._cond.wait(remaining)
+
+            self._waiting.popleft()
+            self._admit(ticket)
+            # Another slot may still be free for the next waiter
+            self._cond.notify_all()
+            return ticket
+
+    def leave(self, ticket: Ticket) -> None:
+        """Release the slot held by an admitted ticket."""
+        with self._cond:
+            self._active = max(0, self._active - 1)
+            self._completed_total += 1
+            self._cond.notify_all()
+        logger.debug(f"Request {ticket.ticket_id} left the queue")
+
+    @contextmanager
+    def admit(self, timeout: Optional[float] = None) -> Iterator[Ticket]:
+        """Context manager wrapping enter()/leave()."""
+        ticket = self.enter(timeout=timeout)
+        try:
+            yield ticket
+        finally:
+            self.leave(ticket)
+
+    def _admit(self, ticket: Ticket) -> None:
+        """Record admission of a ticket. Caller must hold the condition lock."""
+        ticket.admitted_at = time.monotonic()
+        self._active += 1
+        self._admitted_total += 1
+        wait = ticket.wait_seconds
+        self._total_wait_seconds += wait
+        self._max_wait_seconds = max(self._max_wait_seconds, wait)
+
+    @property
+    def depth(self) -> int:
+        """Number of requests currently waiting."""
+        with self._cond:
+            return len(self._waiting)
+
+    def snapshot(self) -> dict:
+        """Return a point-in-time view of queue metrics."""
+        with self._cond:
+            admitted = self._admitted_total
+            return {
+                "depth": len(self._waiting),
+                "max_depth": self.max_depth,
+                "active": self._active,
+                "concurrency": self.concurrency,
+                "admitted_total": admitted,
+                "completed_total": self._completed_total,
+                "rejected_total": self._rejected_total,
+                "timed_out_total": self._timed_out_total,
+                "avg_wait_seconds": (self._total_wait_seconds / admitted) if admitted else 0.0,
+                "max_wait_seconds": self._max_wait_seconds,
+            }
@@ -3,19 +3,19 @@ Flask microservice for Whisper transcription.
 Wraps whisper-server with a simple REST API.
 """
 
+import atexit
 import logging
-import os
-import tempfile
-import threading
 from pathlib import Path
 from typing import Optional
 
 import requests
-from flask import Flask, request, jsonify
+from flask import Flask, g, request, jsonify
 
+from admission_queue import AdmissionQueue, QueueFullError, QueueTimeoutError
 from config import config
 from whisper_server import WhisperServer
 from timestamp_sanitizer import sanitize_whisper_result
+from upload_stream import MultipartFileStream
 
 # Configure logging
 logging.basicConfig(
@@ -29,8 +29,22 @@ app = Flask(__name__)
 # Global whisper server instance
 whisper_server = WhisperServer()
 
-# Lock to serialize transcription requests
-transcription_lock = threading.Lock()
+# Make sure a resident whisper-server does not outlive the Flask process
+atexit.register(whisper_server.shutdown)
+
+# Bounded FIFO queue that serializes transcription requests
+transcription_queue = AdmissionQueue(max_depth=config.queue_max_depth, concurrency=1)
+
+
+@app.after_request
+def add_queue_headers(response):
+    """Attach queue position/wait metrics to responses of queued requests."""
+    ticket = g.get("queue_ticket")
+    if ticket is not None:
+        response.headers["X-Queue-Position"] = str(ticket.position)
+        response.headers["X-Queue-Wait-Seconds"] = f"{ticket.wait_seconds:.3f}"
+        response.headers["X-Queue-Depth"] = str(transcription_queue.depth)
+    return response
 
 
 @app.route("/health", methods=["GET"])
@@ -46,6 +60,9 @@ def health_check():
         "whisper_binary_exists": config.whisper_binary_path.exists(),
         "whisper_model_exists": config.whisper_model_path.exists(),
         "whisper_server_running": whisper_server.is_running,
+        "resident_mode": config.resident_mode,
+        "idle_timeout": config.idle_timeout,
+        "queue": transcription_queue.snapshot(),
     }
 
     if errors:
@@ -55,6 +72,32 @@ def health_check():
     return jsonify(health_status), status_code
 
 
+@app.route("/queue", methods=["GET"])
+def queue_status():
+    """
+    Queue metrics endpoint.
+    Returns the current depth, active requests and cumulative wait statistics.
+    """
+    return jsonify(transcription_queue.snapshot()), 200
+
+
+def resolve_shared_path(path: str) -> Optional[Path]:
+    """
+    Resolve a client-supplied path if it lies under a configured shared root.
+
+    Args:
+        path: Absolute path sent by a co-located client
+
+    Returns:
+        The resolved path, or None if it is outside every shared root
+    """
+    resolved = Path(path).resolve()
+    for root in config.shared_path_roots:
+        if resolved == root or root in resolved.parents:
+            return resolved
+    return None
+
+
 @app.route("/inference", methods=["POST"])
 def inference():
     """
@@ -62,33 +105,63 @@ def inference():
 
     Accepts multipart/form-data with:
     - file: Audio file (mp3, wav, etc.)
+    - path: Instead of file, the path of the audio on a shared filesystem
+      (must be under WHISPER_SHARED_PATH_ROOTS)
     - word_timestamps: Optional word timestamps flag (default: True)
     - response_format: Optional format (default: verbose_json)
     - temperature: Optional temperature parameter (default: 0.0)
     - temperature_inc: Optional temperature increment (default: 0.2)
     - language: Optional language code (default: en)
 
+    Requests are admitted in arrival order; while another transcription is running they
+    wait in a bounded queue. Responses carry X-Queue-Position, X-Queue-Wait-Seconds and
+    X-Queue-Depth headers.
+
     Returns the raw JSON response from whisper-server.
     """
-    # Check if a transcription is already in progress
-    if not transcription_lock.acquire(blocking=False):
-        logger.warning("Transcription request rejected: another transcription in progress")
-        return (
-            jsonify({"error": "A transcription is already in progress. Please try again later."}),
-            429,
-        )
-
-    temp_file_path: Optional[Path] = None
-
-    try:
-        # Validate request
+    # Validate request before taking a place in the queue
+    shared_path: Optional[Path] = None
+    if request.form.get("path"):
+        shared_path = resolve_shared_path(request.form["path"])
+        if shared_path is None:
+            return jsonify({"error": "Path is not under a shared root"}), 403
+        if not shared_path.is_file():
+            return jsonify({"error": "Path not found"}), 404
+        filename = shared_path.name
+    else:
         if "file" not in request.files:
             return jsonify({"error": "No file provided"}), 400
 
         file = request.files["file"]
         if file.filename == "":
             return jsonify({"error": "Empty filename"}), 400
+        filename = file.filename
+
+    # Wait for our turn (or reject if the queue is full)
+    try:
+        ticket = transcription_queue.enter(timeout=config.queue_timeout or None)
+    except QueueFullError as e:
+        logger.warning(f"Transcription request rejected: {e}")
+        response = jsonify({"error": str(e), "queue": transcription_queue.snapshot()})
+        response.headers["Retry-After"] = str(config.queue_retry_after)
+        return response, 429
+    except QueueTimeoutError as e:
+        logger.warning(f"Transcription request timed out in queue: {e}")
+        response = jsonify({"error": str(e), "queue": transcription_queue.snapshot()})
+        response.headers["Retry-After"] = str(config.queue_retry_after)
+        return response, 503
+
+    g.queue_ticket = ticket
+    if ticket.position > 0:
+        logger.info(
+            f"Request {ticket.ticket_id} admitted after waiting {ticket.wait_seconds:.2f}s "
+            f"(queued at position {ticket.position})"
+        )
 
+    audio_stream = None
+    server_acquired = False
+
+    try:
         # Get optional parameters (matching whisper_server.py client expectations)
         word_timestamps = request.form.get("word_timestamps", "True")
         response_format = request.form.get("response_format", "verbose_json")
@@ -97,27 +170,21 @@ def inference():
         language = request.form.get("language", "en")
 
         logger.info(
-            f"Transcription request: file={file.filename}, "
+            f"Transcription request: {'path' if shared_path else 'file'}={filename}, "
             f"format={response_format}, word_timestamps={word_timestamps}"
         )
 
-        # Save uploaded file to temp directory
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix)
-        temp_file_path = Path(temp_file.name)
-        file.save(str(temp_file_path))
-        temp_file.close()
+        # Read the audio in place: the shared file, or the upload werkzeug already spooled
+        audio_stream = open(shared_path, "rb") if shared_path else file.stream
 
-        logger.info(f"Saved uploaded file to: {temp_file_path}")
-
-        # Start whisper server
-        logger.info("Starting whisper server...")
-        whisper_server.start_server()
+        # Start whisper server (reused across requests in resident mode)
+        logger.info("Acquiring whisper server...")
+        whisper_server.acquire()
+        server_acquired = True
 
         # Prepare inference request
         inference_url = f"{config.whisper_url}/inference"
 
-        files = {"file": (file.filename, open(temp_file_path, "rb"), "audio/mpeg")}
-
         # Prepare all parameters for whisper-server
         data = {
             "word_timestamps": word_timestamps,
@@ -127,16 +194,25 @@ def inference():
             "language": language,
         }
 
-        logger.info(f"Sending inference request to {inference_url}")
+        # Stream the audio to whisper-server instead of buffering the multipart body
+        body = MultipartFileStream(
+            fields=data,
+            file_field="file",
+            filename=filename,
+            fileobj=audio_stream,
+            file_content_type="audio/mpeg",
+        )
+
+        logger.info(f"Sending inference request to {inference_url} ({len(body)} bytes)")
 
         # Call whisper-server /inference endpoint
         response = requests.post(
-            inference_url, files=files, data=data, timeout=config.inference_timeout
+            inference_url,
+            data=body,
+            headers={"Content-Type": body.content_type},
+            timeout=config.inference_timeout,
         )
 
-        # Close the file handle
-        files["file"][1].close()
-
         if response.status_code != 200:
             logger.error(f"Whisper server error: {response.status_code} - {response.text}")
             return (
@@ -206,21 +282,21 @@ def inference():
     finally:
         # Always cleanup
         try:
-            # Stop whisper server
-            whisper_server.stop_server()
+            # Stop whisper server, or schedule its idle shutdown in resident mode
+            if server_acquired:
+                whisper_server.release(resident=config.resident_mode)
         except Exception as e:
-            logger.error(f"Error stopping whisper server: {e}")
+            logger.error(f"Error releasing whisper server: {e}")
 
         try:
-            # Delete temp file
-            if temp_file_path and temp_file_path.exists():
-                temp_file_path.unlink()
-                logger.info(f"Deleted temp file: {temp_file_path}")
+            # Close the shared file (werkzeug cleans up its own upload spool)
+            if shared_path and audio_stream:
+                audio_stream.close()
         except Exception as e:
-            logger.error(f"Error deleting temp file: {e}")
+            logger.error(f"Error closing audio file: {e}")
 
-        # Release lock
-        transcription_lock.release()
+        # Let the next queued request in
+        transcription_queue.leave(ticket)
 
 
 if __name__ == "__main__":
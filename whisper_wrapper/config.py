@@ -71,6 +71,28 @@ class Config:
         self.server_start_timeout = int(os.getenv("SERVER_START_TIMEOUT", "30"))
         self.inference_timeout = int(os.getenv("INFERENCE_TIMEOUT", "300"))
 
+        # Resident mode: keep whisper-server (and its loaded model) alive between
+        # requests and only stop it after it has been idle for WHISPER_IDLE_TIMEOUT seconds.
+        # Set WHISPER_RESIDENT_MODE=False to start/stop the server around every request.
+        self.resident_mode = os.getenv("WHISPER_RESIDENT_MODE", "True").lower() == "true"
+        self.idle_timeout = float(os.getenv("WHISPER_IDLE_TIMEOUT", "600"))
+
+        # Admission queue: requests wait (FIFO) while a transcription is running.
+        # Beyond WHISPER_QUEUE_MAX_DEPTH waiting requests new ones get 429 + Retry-After.
+        # WHISPER_QUEUE_TIMEOUT bounds the wait in seconds (0 waits indefinitely).
+        self.queue_max_depth = int(os.getenv("WHISPER_QUEUE_MAX_DEPTH", "8"))
+        self.queue_timeout = float(os.getenv("WHISPER_QUEUE_TIMEOUT", "3600"))
+        self.queue_retry_after = int(os.getenv("WHISPER_QUEUE_RETRY_AFTER", "30"))
+
+        # Shared filesystem: when the client runs on the same host (or mounts the same
+        # volume) it can send a `path` instead of uploading the audio. Only files under
+        # these comma-separated directories are accepted; empty disables path requests.
+        self.shared_path_roots = [
+            self._resolve_path(root.strip())
+            for root in os.getenv("WHISPER_SHARED_PATH_ROOTS", "").split(",")
+            if root.strip()
+        ]
+
     def _resolve_path(self, path: str) -> Path:
         """Resolve relative path to absolute path from project root."""
         p = Path(path)
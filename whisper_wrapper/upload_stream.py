@@ -0,0 +1,94 @@
+"""
+Streaming multipart body for forwarding audio to whisper-server.
+
+requests builds `files=` uploads in memory, so forwarding a multi-hour track
+held the whole file in RAM on top of the copy saved to disk. MultipartFileStream
+is a file-like request body that produces the multipart encoding on the fly:
+the form fields and closing boundary are small in-memory buffers and the audio
+is read from its file object in blocks as the request is sent. Its length is
+known up front, so the request is sent with a Content-Length instead of
+chunked transfer encoding.
+"""
+
+import io
+import uuid
+from typing import BinaryIO, Dict, Iterator
+
+BLOCK_SIZE = 1 << 16
+
+
+class MultipartFileStream:
+    """Read-only, file-like multipart/form-data body with one streamed file."""
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        file_field: str,
+        filename: str,
+        fileobj: BinaryIO,
+        file_content_type: str = "application/octet-stream",
+        boundary: str = None,
+    ):
+        """
+        Build the body.
+
+        Args:
+            fields: Plain form fields sent before the file
+            file_field: Form field name of the file
+            filename: Filename reported for the file
+            fileobj: Seekable binary file object, read from its current position
+            file_content_type: Content type of the file part
+            boundary: Multipart boundary (random if not given)
+        """
+        self.boundary = boundary or uuid.uuid4().hex
+
+        head = io.BytesIO()
+        for name, value in fields.items():
+            head.write(
+                f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+                f"{value}\r\n".encode("utf-8")
+            )
+        safe_filename = filename.replace("\\", "\\\\").replace('"', '\\"')
+        head.write(
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{file_field}"; filename="{safe_filename}"\r\n'
+            f"Content-Type: {file_content_type}\r\n\r\n".encode("utf-8")
+        )
+        tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+
+        start = fileobj.tell()
+        file_size = fileobj.seek(0, io.SEEK_END) - start
+        fileobj.seek(start)
+
+        self._length = head.tell() + file_size + len(tail)
+        head.seek(0)
+        self._parts = [head, fileobj, io.BytesIO(tail)]
+
+    @property
+    def content_type(self) -> str:
+        """Value for the request's Content-Type header."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to `size` bytes of the body (all remaining bytes if negative)."""
+        chunks = []
+        remaining = size
+        while self._parts and remaining != 0:
+            chunk = self._parts[0].read(remaining if remaining > 0 else -1)
+            if not chunk:
+                self._parts.pop(0)
+                continue
+            chunks.append(chunk)
+            if remaining > 0:
+                remaining -= len(chunk)
+        return b"".join(chunks)
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(BLOCK_SIZE)
+            if not chunk:
+                return
+            yield chunk
@@ -5,6 +5,7 @@ Manages starting, stopping, and health checking the whisper-server process.
 
 import logging
 import subprocess
+import threading
 import time
 from pathlib import Path
 from typing import Optional
@@ -23,6 +24,15 @@ class WhisperServer:
         self.process: Optional[subprocess.Popen] = None
         self._is_running = False
 
+        # Resident mode bookkeeping
+        self._state_lock = threading.RLock()
+        self._idle_timer: Optional[threading.Timer] = None
+        # Bumped whenever the idle timer is replaced or cancelled; a timer that already
+        # fired and is waiting for _state_lock must not act for a newer one
+        self._idle_generation = 0
+        self._active_requests = 0
+        self.start_count = 0
+
     def start_server(self) -> None:
         """
         Start the whisper-server process.
@@ -66,6 +76,7 @@ class WhisperServer:
             # Wait for server to be ready
             self._wait_for_ready()
             self._is_running = True
+            self.start_count += 1
 
             logger.info(f"Whisper server started successfully at {config.whisper_url}")
 
@@ -105,6 +116,101 @@ class WhisperServer:
             self.process = None
             self._is_running = False
 
+    # -------------------------------------------------------------- #
+    # Resident Mode
+    # -------------------------------------------------------------- #
+
+    def acquire(self) -> None:
+        """
+        Mark the start of a request and make sure the server is up.
+
+        In resident mode the process is reused across requests; it is only
+        (re)started when it is not running or its process has exited.
+        Cancels any pending idle shutdown.
+
+        Raises:
+            RuntimeError: If server fails to start
+            FileNotFoundError: If whisper binary doesn't exist
+        """
+        with self._state_lock:
+            self._cancel_idle_timer()
+            self._active_requests += 1
+
+            try:
+                if self._is_running and self.process and self.process.poll() is not None:
+                    logger.warning(
+                        f"Resident whisper server exited with code {self.process.returncode}, "
+                        "restarting"
+                    )
+                    self.process = None
+                    self._is_running = False
+
+                if not self._is_running:
+                    self.start_server()
+            except Exception:
+                self._active_requests -= 1
+                raise
+
+    def release(self, resident: bool = True, idle_timeout: Optional[float] = None) -> None:
+        """
+        Mark the end of a request.
+
+        Args:
+            resident: Keep the server alive and schedule an idle shutdown.
+                If False the server is stopped immediately once no requests are active.
+            idle_timeout: Seconds of inactivity before a resident server is stopped
+                (defaults to config.idle_timeout). A value <= 0 keeps it up indefinitely.
+        """
+        with self._state_lock:
+            self._active_requests = max(0, self._active_requests - 1)
+            if self._active_requests > 0:
+                return
+
+            if not resident:
+                self.stop_server()
+                return
+
+            if idle_timeout is None:
+                idle_timeout = config.idle_timeout
+            if idle_timeout > 0 and self._is_running:
+                self._cancel_idle_timer()
+                self._idle_timer = threading.Timer(
+                    idle_timeout, self._on_idle_timeout, args=(self._idle_generation,)
+                )
+                self._idle_timer.daemon = True
+                self._idle_timer.start()
+
+    def shutdown(self) -> None:
+        """Cancel any pending idle shutdown and stop the server if it is running."""
+        with self._state_lock:
+            self._cancel_idle_timer()
+            if self.process:
+                self.stop_server()
+
+    def _on_idle_timeout(self, generation: int) -> None:
+        """
+        Stop the resident server after it has been idle for the configured timeout.
+
+        Args:
+            generation: _idle_generation when the timer was scheduled; the timer is
+                stale (cancelled or replaced after it fired) if it has changed since
+        """
+        with self._state_lock:
+            if generation != self._idle_generation:
+                return
+            self._idle_timer = None
+            if self._active_requests > 0 or not self.process:
+                return
+            logger.info("Whisper server idle timeout reached, releasing model")
+            self.stop_server()
+
+    def _cancel_idle_timer(self) -> None:
+        """Cancel a pending idle shutdown, if any, including one that already fired."""
+        self._idle_generation += 1
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
     def _wait_for_ready(self, timeout: Optional[int] = None) -> None:
         """
         Wait for the whisper server to be ready by checking health endpoint.